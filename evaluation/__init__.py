@@ -3,7 +3,7 @@ latzero Evaluation Suite
 
 Comprehensive benchmarking comparing:
 - latzero (shared memory IPC)
-- HTTP (Flask/requests)
+- HTTP (aiohttp/requests)
 - Socket (raw TCP)
 
 Metrics:
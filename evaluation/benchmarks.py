@@ -4,15 +4,177 @@ Benchmark implementations for latzero, HTTP, and Socket communication.
 Windows-compatible version using threading instead of multiprocessing for servers.
 """
 
+import os
 import time
-import json
 import socket
+import struct
+import selectors
 import threading
-import statistics
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+import msgpack
+import numpy as np
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from hdrh.histogram import HdrHistogram
+    HAS_HDRH = True
+except ImportError:
+    HAS_HDRH = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+
+# Histogram mode records microsecond ticks from 1us to 60s at 3 significant figures;
+# slower samples are recorded as 60s, since the histogram would drop them
+HISTOGRAM_MAX_US = 60_000_000
+HISTOGRAM_SIG_FIGS = 3
+
+# Number of distinct keys cycled through by each benchmark run
+KEY_SPACE = 1000
+
+# Cap on retained error strings per result (the count is kept separately)
+MAX_SAMPLE_ERRORS = 128
+
+
+# Shared happy-path result for set operations (avoids a tuple per call)
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+
+# Socket wire format: 4-byte big-endian length prefix + msgpack body
+_FRAME_HEADER = struct.Struct('>I')
+
+# Bytes requested per recv() when draining pipelined responses
+RECV_BUFFER_SIZE = 65536
+
+
+def _frame(message: dict) -> bytes:
+    """Encode a message as a length-prefixed msgpack frame."""
+    payload = msgpack.packb(message, use_bin_type=True)
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytearray:
+    """Read exactly n bytes from a socket. Raises ConnectionError on EOF."""
+    buf = bytearray(n)
+    view = memoryview(buf)
+    pos = 0
+    while pos < n:
+        received = sock.recv_into(view[pos:])
+        if not received:
+            raise ConnectionError("Socket closed by peer")
+        pos += received
+    return buf
+
+
+def _recv_frame(sock: socket.socket) -> Any:
+    """Read one length-prefixed msgpack frame and decode it."""
+    (length,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    return msgpack.unpackb(_recv_exact(sock, length), raw=False)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _latency_kernel(samples, kth):
+        """
+        Fused min/max/mean/stdev over integer-ns samples plus the order
+        statistics at the kth ranks, without materialising a ms copy.
+        """
+        n = samples.shape[0]
+        lo = samples[0]
+        hi = samples[0]
+        total = 0.0
+        for i in range(n):
+            x = samples[i]
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+            total += x
+        avg = total / n
+        
+        sq = 0.0
+        for i in range(n):
+            d = samples[i] - avg
+            sq += d * d
+        stdev = np.sqrt(sq / (n - 1)) if n > 1 else 0.0
+        
+        partitioned = np.partition(samples, kth)
+        return lo, hi, avg, stdev, partitioned[kth[0]], partitioned[kth[1]], partitioned[kth[2]]
+
+
+def _pin_current(core: int) -> Tuple[Any, Any]:
+    """
+    Pin the calling thread to one CPU core and raise its scheduling
+    priority. Returns the previous (affinity, nice) for _restore_pinning;
+    either element is None when that setting could not be changed.
+    """
+    affinity = None
+    if hasattr(os, 'sched_setaffinity'):
+        affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {core})
+    elif HAS_PSUTIL and hasattr(psutil.Process, 'cpu_affinity'):
+        proc = psutil.Process()
+        affinity = proc.cpu_affinity()
+        proc.cpu_affinity([core])
+    
+    nice = None
+    if HAS_PSUTIL:
+        proc = psutil.Process()
+        try:
+            nice = proc.nice()
+            proc.nice(psutil.HIGH_PRIORITY_CLASS if os.name == 'nt' else nice - 10)
+        except (psutil.AccessDenied, OSError):
+            # Raising priority needs elevated privileges; pinning still applies
+            nice = None
+    
+    return affinity, nice
+
+
+def _restore_pinning(saved: Tuple[Any, Any]) -> None:
+    """Undo _pin_current."""
+    affinity, nice = saved
+    if affinity is not None:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, affinity)
+        else:
+            psutil.Process().cpu_affinity(affinity)
+    if nice is not None:
+        try:
+            psutil.Process().nice(nice)
+        except (psutil.AccessDenied, OSError):
+            pass
+
+
+def _new_histogram() -> "HdrHistogram":
+    """Create an empty latency histogram (microsecond resolution)."""
+    if not HAS_HDRH:
+        raise ImportError("hdrhistogram is required for histogram latency recording")
+    return HdrHistogram(1, HISTOGRAM_MAX_US, HISTOGRAM_SIG_FIGS)
 
 
 @dataclass
@@ -24,8 +186,9 @@ class BenchmarkResult:
     successful_operations: int
     failed_operations: int
     total_time_seconds: float
-    latencies_ms: List[float] = field(default_factory=list)
+    latencies_ns: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
     errors: List[str] = field(default_factory=list)
+    histogram: Optional["HdrHistogram"] = None
     
     @property
     def throughput(self) -> float:
@@ -41,25 +204,96 @@ class BenchmarkResult:
             return 0
         return (self.successful_operations / self.total_operations) * 100
     
+    @property
+    def latencies_ms(self) -> np.ndarray:
+        """Per-operation latencies converted to milliseconds."""
+        return np.asarray(self.latencies_ns, dtype=np.float64) * 1e-6
+    
     @property
     def latency_stats(self) -> Dict[str, float]:
         """Calculate latency statistics."""
-        if not self.latencies_ms:
+        if self.histogram is not None:
+            return self._histogram_stats()
+        
+        samples = np.asarray(self.latencies_ns)
+        n = len(samples)
+        if n == 0:
             return {'min': 0, 'max': 0, 'avg': 0, 'p50': 0, 'p95': 0, 'p99': 0, 'stdev': 0}
         
-        sorted_latencies = sorted(self.latencies_ms)
-        n = len(sorted_latencies)
+        if HAS_NUMBA and samples.dtype == np.int64:
+            return self._kernel_stats(samples)
+        
+        # Samples are integer nanoseconds; convert to ms once for the whole run
+        latencies = samples.astype(np.float64) * 1e-6
+        
+        # Only a handful of order statistics are needed, so partition (O(n))
+        # instead of sorting; the extreme ranks give min/max in the same pass
+        i50, i95, i99 = int(n * 0.50), int(n * 0.95), int(n * 0.99)
+        partitioned = np.partition(latencies, [0, i50, i95, i99, n - 1])
+        
+        # Reuse the mean for the variance instead of letting std() recompute it
+        avg = latencies.mean()
+        if n > 1:
+            dev = latencies - avg
+            stdev = float(np.sqrt(np.dot(dev, dev) / (n - 1)))
+        else:
+            stdev = 0
+        
+        return {
+            'min': float(partitioned[0]),
+            'max': float(partitioned[n - 1]),
+            'avg': float(avg),
+            'p50': float(partitioned[i50]),
+            'p95': float(partitioned[i95]),
+            'p99': float(partitioned[i99]),
+            'stdev': stdev,
+        }
+    
+    @staticmethod
+    def _kernel_stats(samples: np.ndarray) -> Dict[str, float]:
+        """Latency statistics from the compiled single-pass kernel (ns -> ms)."""
+        n = len(samples)
+        kth = np.array([int(n * 0.50), int(n * 0.95), int(n * 0.99)], dtype=np.int64)
+        lo, hi, avg, stdev, p50, p95, p99 = _latency_kernel(samples, kth)
+        return {
+            'min': lo * 1e-6,
+            'max': hi * 1e-6,
+            'avg': avg * 1e-6,
+            'p50': p50 * 1e-6,
+            'p95': p95 * 1e-6,
+            'p99': p99 * 1e-6,
+            'stdev': stdev * 1e-6,
+        }
+    
+    def _histogram_stats(self) -> Dict[str, float]:
+        """Latency statistics from the HdrHistogram (microseconds -> ms)."""
+        hist = self.histogram
+        if hist.get_total_count() == 0:
+            return {'min': 0, 'max': 0, 'avg': 0, 'p50': 0, 'p95': 0, 'p99': 0, 'stdev': 0}
         
         return {
-            'min': min(sorted_latencies),
-            'max': max(sorted_latencies),
-            'avg': statistics.mean(sorted_latencies),
-            'p50': sorted_latencies[int(n * 0.50)] if n > 0 else 0,
-            'p95': sorted_latencies[int(n * 0.95)] if n > 1 else sorted_latencies[-1],
-            'p99': sorted_latencies[int(n * 0.99)] if n > 1 else sorted_latencies[-1],
-            'stdev': statistics.stdev(sorted_latencies) if n > 1 else 0,
+            'min': hist.get_min_value() / 1000,
+            'max': hist.get_max_value() / 1000,
+            'avg': hist.get_mean_value() / 1000,
+            'p50': hist.get_value_at_percentile(50) / 1000,
+            'p95': hist.get_value_at_percentile(95) / 1000,
+            'p99': hist.get_value_at_percentile(99) / 1000,
+            'stdev': hist.get_stddev() / 1000,
         }
     
+    def __getstate__(self) -> dict:
+        # HdrHistogram wraps ctypes buffers that cannot be pickled (e.g. when
+        # a result comes back from a worker process); ship its encoding
+        state = self.__dict__.copy()
+        if self.histogram is not None:
+            state['histogram'] = self.histogram.encode()
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        if isinstance(state.get('histogram'), bytes):
+            state['histogram'] = HdrHistogram.decode(state['histogram'])
+        self.__dict__.update(state)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
@@ -72,7 +306,7 @@ class BenchmarkResult:
             'throughput_ops_per_sec': self.throughput,
             'success_rate_percent': self.success_rate,
             'latency_ms': self.latency_stats,
-            'error_count': len(self.errors),
+            'error_count': self.failed_operations,
             'sample_errors': self.errors[:5] if self.errors else [],
         }
 
@@ -80,6 +314,14 @@ class BenchmarkResult:
 class BaseBenchmark(ABC):
     """Base class for all benchmarks."""
     
+    # Requests kept in flight per round trip on the single-threaded path;
+    # values above 1 require run_batch()
+    pipeline_depth = 1
+    
+    # CPU core to pin single-threaded runs to; None = no pinning. Runs with
+    # worker threads are never pinned: the workers would share the one core
+    pin_core: Optional[int] = None
+    
     def __init__(self, name: str):
         self.name = name
     
@@ -103,12 +345,20 @@ class BaseBenchmark(ABC):
         """Perform a get operation. Returns (value, success, error_message)."""
         pass
     
+    def run_batch(self, ops: List[Tuple[str, str, Any]]) -> List[Tuple[int, bool, Optional[str]]]:
+        """
+        Issue several ('set'|'get', key, value) operations in one pipelined
+        round trip. Returns (elapsed_ns, success, error_message) per op.
+        """
+        raise NotImplementedError(f"{self.name} does not support pipelining")
+    
     def run_benchmark(
         self, 
         num_operations: int, 
         operation: str = 'mixed',
         payload_size: int = 100,
-        num_threads: int = 1
+        num_threads: int = 1,
+        use_histogram: bool = False
     ) -> BenchmarkResult:
         """
         Run the benchmark.
@@ -118,28 +368,39 @@ class BaseBenchmark(ABC):
             operation: 'set', 'get', or 'mixed' (50/50)
             payload_size: Size of value in bytes
             num_threads: Number of concurrent threads
+            use_histogram: Record latencies into an HdrHistogram instead of
+                keeping every sample (constant memory, bounded quantile error)
         """
+        histogram = _new_histogram() if use_histogram else None
+        
         self.setup()
         
-        latencies = []
+        if histogram is None:
+            latencies = np.empty(num_operations, dtype=np.int64)
+        else:
+            latencies = np.empty(0, dtype=np.int64)
         errors = []
         successful = 0
-        failed = 0
         
-        # Generate test data
-        test_value = {"data": "x" * payload_size, "id": 0}
+        # Generate test data once; no consumer reads a per-op id, so every
+        # operation shares the same value object and a fixed set of keys
+        value = {"data": "x" * payload_size}
+        keys = [f"bench_key_{i}" for i in range(KEY_SPACE)]
         
         # Pre-populate for get operations
         if operation == 'get':
-            for i in range(min(1000, num_operations)):
-                key = f"bench_key_{i}"
-                self.set_operation(key, {**test_value, "id": i})
+            for i in range(min(KEY_SPACE, num_operations)):
+                self.set_operation(keys[i], value)
+        
+        def op_kind(op_id: int) -> str:
+            if operation == 'mixed':
+                return 'set' if op_id % 2 == 0 else 'get'
+            return operation
         
-        def run_single_op(op_id: int) -> Tuple[float, bool, Optional[str]]:
-            key = f"bench_key_{op_id % 1000}"  # Reuse keys
-            value = {**test_value, "id": op_id}
+        def run_single_op(op_id: int) -> Tuple[int, bool, Optional[str]]:
+            key = keys[op_id % KEY_SPACE]  # Reuse keys
             
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             
             try:
                 if operation == 'set':
@@ -152,42 +413,83 @@ class BaseBenchmark(ABC):
                     else:
                         _, success, error = self.get_operation(key)
                 
-                elapsed = (time.perf_counter() - start) * 1000  # ms
-                return elapsed, success, error
+                return time.perf_counter_ns() - start, success, error
             except Exception as e:
-                elapsed = (time.perf_counter() - start) * 1000
-                return elapsed, False, str(e)
+                return time.perf_counter_ns() - start, False, str(e)
         
-        start_time = time.perf_counter()
-        
-        if num_threads == 1:
-            # Single-threaded
-            for i in range(num_operations):
+        def run_chunk(lo: int, hi: int, hist) -> Tuple[int, List[str], Any]:
+            # Each chunk owns a disjoint slice of the latency buffer, so
+            # workers write their samples in place without coordination
+            ok = 0
+            chunk_errors = []
+            for i in range(lo, hi):
                 elapsed, success, error = run_single_op(i)
-                latencies.append(elapsed)
-                if success:
-                    successful += 1
+                if hist is None:
+                    latencies[i] = elapsed
                 else:
-                    failed += 1
-                    if error:
-                        errors.append(error)
-        else:
-            # Multi-threaded
-            with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                futures = [executor.submit(run_single_op, i) for i in range(num_operations)]
-                for future in as_completed(futures):
-                    elapsed, success, error = future.result()
-                    latencies.append(elapsed)
-                    if success:
-                        successful += 1
+                    hist.record_value(min(elapsed // 1000, HISTOGRAM_MAX_US))
+                if success:
+                    ok += 1
+                elif error and len(chunk_errors) < MAX_SAMPLE_ERRORS:
+                    chunk_errors.append(error)
+            return ok, chunk_errors, hist
+        
+        def run_pipelined(hist) -> Tuple[int, List[str]]:
+            # Latency of each op is measured from when its batch was sent
+            ok = 0
+            batch_errors = []
+            depth = self.pipeline_depth
+            for lo in range(0, num_operations, depth):
+                hi = min(lo + depth, num_operations)
+                ops = [(op_kind(i), keys[i % KEY_SPACE], value) for i in range(lo, hi)]
+                for i, (elapsed, success, error) in enumerate(self.run_batch(ops), lo):
+                    if hist is None:
+                        latencies[i] = elapsed
                     else:
-                        failed += 1
-                        if error:
-                            errors.append(error)
+                        hist.record_value(min(elapsed // 1000, HISTOGRAM_MAX_US))
+                    if success:
+                        ok += 1
+                    elif error and len(batch_errors) < MAX_SAMPLE_ERRORS:
+                        batch_errors.append(error)
+            return ok, batch_errors
         
-        total_time = time.perf_counter() - start_time
+        # Worker threads would inherit the one-core affinity and serialize
+        pin = self.pin_core is not None and num_threads == 1
+        pinned = _pin_current(self.pin_core) if pin else None
         
-        self.teardown()
+        try:
+            start_time = time.perf_counter()
+            
+            if num_threads == 1 and self.pipeline_depth > 1:
+                # Single-threaded, several requests per round trip
+                successful, errors = run_pipelined(histogram)
+            elif num_threads == 1:
+                # Single-threaded
+                successful, errors, _ = run_chunk(0, num_operations, histogram)
+            else:
+                # Multi-threaded: hand out contiguous index ranges rather than one
+                # future per operation (ThreadPoolExecutor.map ignores chunksize)
+                chunk = max(1, num_operations // (num_threads * 16))
+                
+                def run_bounds(lo: int) -> Tuple[int, List[str], Any]:
+                    hist = _new_histogram() if histogram is not None else None
+                    return run_chunk(lo, min(lo + chunk, num_operations), hist)
+                
+                with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                    for ok, chunk_errors, hist in executor.map(run_bounds, range(0, num_operations, chunk)):
+                        successful += ok
+                        if hist is not None:
+                            histogram.add(hist)
+                        errors.extend(chunk_errors[:MAX_SAMPLE_ERRORS - len(errors)])
+            
+            failed = num_operations - successful
+            total_time = time.perf_counter() - start_time
+        finally:
+            try:
+                self.teardown()
+            finally:
+                if pinned is not None:
+                    _restore_pinning(pinned)
         
         return BenchmarkResult(
             name=self.name,
@@ -196,8 +498,9 @@ class BaseBenchmark(ABC):
             successful_operations=successful,
             failed_operations=failed,
             total_time_seconds=total_time,
-            latencies_ms=latencies,
+            latencies_ns=latencies,
             errors=errors,
+            histogram=histogram,
         )
 
 
@@ -211,6 +514,9 @@ class LatzeroBenchmark(BaseBenchmark):
         self.pool_name = "eval_benchmark_pool"
         self.use_fast_mode = use_fast_mode
         self._pending_writes = 0
+        self._set = None
+        self._get = None
+        self._flush = None
     
     def setup(self) -> None:
         from latzero import SharedMemoryPool
@@ -225,6 +531,11 @@ class LatzeroBenchmark(BaseBenchmark):
         self.pool.create(self.pool_name)
         self.client = self.pool.connect(self.pool_name)
         self._pending_writes = 0
+        
+        # Bind the client methods once so each op skips two attribute lookups
+        self._set = self.client.set_fast if self.use_fast_mode else self.client.set
+        self._get = self.client.get
+        self._flush = self.client.flush
     
     def teardown(self) -> None:
         # Flush any pending writes
@@ -247,118 +558,157 @@ class LatzeroBenchmark(BaseBenchmark):
     
     def set_operation(self, key: str, value: Any) -> Tuple[bool, Optional[str]]:
         try:
+            self._set(key, value)
             if self.use_fast_mode:
-                self.client.set_fast(key, value)
                 self._pending_writes += 1
                 # Flush every 100 writes for data durability
                 if self._pending_writes >= 100:
-                    self.client.flush()
+                    self._flush()
                     self._pending_writes = 0
-            else:
-                self.client.set(key, value)
-            return True, None
+            return _OK
         except Exception as e:
             return False, str(e)
     
     def get_operation(self, key: str) -> Tuple[Any, bool, Optional[str]]:
         try:
-            value = self.client.get(key)
-            return value, True, None
+            return self._get(key), True, None
         except Exception as e:
             return None, False, str(e)
 
 
 class HTTPBenchmark(BaseBenchmark):
-    """Benchmark for HTTP communication using Flask (threaded server)."""
+    """Benchmark for HTTP communication using aiohttp (event-loop server)."""
+    
+    # Upper bound on pooled keep-alive connections (one per client thread)
+    MAX_CONNECTIONS = 64
     
     def __init__(self, host: str = "127.0.0.1", port: int = 5999):
         super().__init__("HTTP")
         self.host = host
         self.port = port
         self.server_thread = None
-        self.data_store = {}
-        self._shutdown = False
+        self.session = None
+        self._loop = None
+        self._base_url = f"http://{host}:{port}"
+        self._set_url = f"{self._base_url}/set"
+        self._get_url = f"{self._base_url}/get/"
+        self._health_url = f"{self._base_url}/health"
     
     def setup(self) -> None:
-        self._shutdown = False
+        if requests is None:
+            raise ImportError("requests is required for the HTTP benchmark")
+        
+        # Reuse keep-alive connections instead of a new TCP handshake per request
+        self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_CONNECTIONS),
+        )
         
-        # Start Flask server in thread
+        # Start aiohttp server in thread
         self.server_thread = threading.Thread(target=self._run_server, daemon=True)
         self.server_thread.start()
         
         # Wait for server to start
-        import requests
         for _ in range(20):
             try:
-                resp = requests.get(f"http://{self.host}:{self.port}/health", timeout=1)
+                resp = self.session.get(self._health_url, timeout=1)
                 if resp.status_code == 200:
                     break
             except:
                 time.sleep(0.2)
     
     def _run_server(self) -> None:
-        """Run Flask server in thread."""
-        from flask import Flask, request, jsonify
+        """Run an aiohttp server on a private event loop in this thread."""
+        import asyncio
+        import json
         import logging
+        from aiohttp import web
         
-        # Suppress Flask logging
-        log = logging.getLogger('werkzeug')
-        log.setLevel(logging.ERROR)
+        # Suppress aiohttp logging
+        logging.getLogger('aiohttp').setLevel(logging.ERROR)
         
-        app = Flask(__name__)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
         data_store = {}
         
-        @app.route('/health')
-        def health():
-            return jsonify({"status": "ok"})
+        if HAS_ORJSON:
+            # orjson encodes straight to bytes and parses the raw body,
+            # skipping the stdlib encoder and the str->bytes round trip
+            dumps, loads = orjson.dumps, orjson.loads
+        else:
+            def dumps(obj):
+                return json.dumps(obj).encode()
+            loads = json.loads
+        
+        # Constant replies are encoded once, not per request
+        health_body = dumps({"status": "ok"})
+        set_ok_body = dumps({"success": True})
+        not_found_body = dumps({"value": None, "found": False})
+        
+        def respond(body: bytes):
+            return web.Response(body=body, content_type="application/json")
+        
+        async def health(request):
+            return respond(health_body)
         
-        @app.route('/set', methods=['POST'])
-        def set_value():
-            data = request.json
+        async def set_value(request):
+            data = loads(await request.read())
             data_store[data['key']] = data['value']
-            return jsonify({"success": True})
+            return respond(set_ok_body)
         
-        @app.route('/get/<key>')
-        def get_value(key):
-            value = data_store.get(key)
-            return jsonify({"value": value, "found": value is not None})
+        async def get_value(request):
+            value = data_store.get(request.match_info['key'])
+            if value is None:
+                return respond(not_found_body)
+            return respond(dumps({"value": value, "found": True}))
         
-        # Use werkzeug directly to avoid Flask dev server warnings
-        from werkzeug.serving import make_server
-        server = make_server(self.host, self.port, app, threaded=True)
-        server.timeout = 1
+        app = web.Application()
+        app.router.add_get('/health', health)
+        app.router.add_post('/set', set_value)
+        app.router.add_get('/get/{key}', get_value)
         
-        while not self._shutdown:
-            server.handle_request()
+        runner = web.AppRunner(app, access_log=None)
+        try:
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, self.host, self.port, reuse_address=True)
+            loop.run_until_complete(site.start())
+            self._loop = loop
+            # All client connections are multiplexed on this loop until
+            # teardown() stops it; no per-request threads or polling timeout
+            loop.run_forever()
+        finally:
+            self._loop = None
+            loop.run_until_complete(runner.cleanup())
+            loop.close()
     
     def teardown(self) -> None:
-        self._shutdown = True
-        # Send a dummy request to unblock the server
-        try:
-            import requests
-            requests.get(f"http://{self.host}:{self.port}/health", timeout=0.5)
-        except:
-            pass
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if self.session:
+            self.session.close()
+            self.session = None
         if self.server_thread:
             self.server_thread.join(timeout=2)
     
     def set_operation(self, key: str, value: Any) -> Tuple[bool, Optional[str]]:
         try:
-            import requests
-            resp = requests.post(
-                f"http://{self.host}:{self.port}/set",
+            resp = self.session.post(
+                self._set_url,
                 json={"key": key, "value": value},
                 timeout=5
             )
-            return resp.status_code == 200, None
+            if resp.status_code == 200:
+                return _OK
+            return False, f"HTTP {resp.status_code}"
         except Exception as e:
             return False, str(e)
     
     def get_operation(self, key: str) -> Tuple[Any, bool, Optional[str]]:
         try:
-            import requests
-            resp = requests.get(
-                f"http://{self.host}:{self.port}/get/{key}",
+            resp = self.session.get(
+                self._get_url + key,
                 timeout=5
             )
             if resp.status_code == 200:
@@ -370,16 +720,22 @@ class HTTPBenchmark(BaseBenchmark):
 
 
 class SocketBenchmark(BaseBenchmark):
-    """Benchmark for raw TCP socket communication (threaded server)."""
+    """Benchmark for raw TCP socket communication (selectors-based server)."""
     
-    def __init__(self, host: str = "127.0.0.1", port: int = 5998):
+    def __init__(self, host: str = "127.0.0.1", port: int = 5998, pipeline_depth: int = 1):
         super().__init__("Socket")
         self.host = host
         self.port = port
+        self.pipeline_depth = max(1, pipeline_depth)
         self.server_thread = None
         self.server_socket = None
         self.client_socket = None
+        self._client_lock = threading.Lock()
         self._shutdown = False
+        # Encoded request frames, reused while the same value object is set
+        self._set_frames: Dict[str, bytes] = {}
+        self._set_value = None
+        self._get_frames: Dict[str, bytes] = {}
     
     def setup(self) -> None:
         self._shutdown = False
@@ -393,64 +749,107 @@ class SocketBenchmark(BaseBenchmark):
         
         # Connect client
         self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.client_socket.connect((self.host, self.port))
         self.client_socket.settimeout(5)
     
     def _run_server(self) -> None:
-        """Run socket server in thread."""
+        """Run a single-threaded selectors reactor serving every connection."""
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.settimeout(1)
         self.server_socket.bind((self.host, self.port))
         self.server_socket.listen(5)
+        self.server_socket.setblocking(False)
         
         data_store = {}
+        header_size = _FRAME_HEADER.size
+        sel = selectors.DefaultSelector()
+        sel.register(self.server_socket, selectors.EVENT_READ)
         
-        def handle_client(conn):
+        def dispatch(msg) -> dict:
             try:
-                while not self._shutdown:
-                    try:
-                        conn.settimeout(1)
-                        data = conn.recv(65536)
-                        if not data:
-                            break
-                        
-                        msg = json.loads(data.decode())
-                        
-                        if msg['op'] == 'set':
-                            data_store[msg['key']] = msg['value']
-                            response = {"success": True}
-                        elif msg['op'] == 'get':
-                            value = data_store.get(msg['key'])
-                            response = {"value": value, "found": value is not None}
-                        else:
-                            response = {"error": "Unknown operation"}
-                        
-                        conn.sendall(json.dumps(response).encode())
-                    except socket.timeout:
-                        continue
-                    except Exception as e:
-                        try:
-                            conn.sendall(json.dumps({"error": str(e)}).encode())
-                        except:
-                            break
+                if msg['op'] == 'set':
+                    data_store[msg['key']] = msg['value']
+                    return {"success": True}
+                elif msg['op'] == 'get':
+                    value = data_store.get(msg['key'])
+                    return {"value": value, "found": value is not None}
+                else:
+                    return {"error": "Unknown operation"}
+            except Exception as e:
+                return {"error": str(e)}
+        
+        def close(conn) -> None:
+            try:
+                sel.unregister(conn)
+            except (KeyError, ValueError):
+                pass
+            try:
+                conn.close()
             except:
                 pass
-            finally:
-                try:
-                    conn.close()
-                except:
-                    pass
         
-        while not self._shutdown:
+        def handle_read(conn, state) -> None:
+            inbuf, outbuf = state
+            chunk = conn.recv(RECV_BUFFER_SIZE)
+            if not chunk:
+                close(conn)
+                return
+            inbuf += chunk
+            
+            # Answer every complete frame in the buffer with one send
+            pos = 0
+            while len(inbuf) - pos >= header_size:
+                (length,) = _FRAME_HEADER.unpack_from(inbuf, pos)
+                end = pos + header_size + length
+                if end > len(inbuf):
+                    break
+                outbuf += _frame(dispatch(msgpack.unpackb(inbuf[pos + header_size:end], raw=False)))
+                pos = end
+            del inbuf[:pos]
+            
+            if outbuf:
+                handle_write(conn, state)
+        
+        def handle_write(conn, state) -> None:
+            outbuf = state[1]
             try:
-                conn, addr = self.server_socket.accept()
-                thread = threading.Thread(target=handle_client, args=(conn,), daemon=True)
-                thread.start()
-            except socket.timeout:
-                continue
-            except:
-                break
+                sent = conn.send(outbuf)
+            except BlockingIOError:
+                sent = 0
+            del outbuf[:sent]
+            # Only watch for writability while a reply is partially sent
+            events = selectors.EVENT_READ | selectors.EVENT_WRITE if outbuf else selectors.EVENT_READ
+            sel.modify(conn, events, state)
+        
+        try:
+            while not self._shutdown:
+                for key, mask in sel.select(timeout=0.1):
+                    sock = key.fileobj
+                    if sock is self.server_socket:
+                        try:
+                            conn, addr = sock.accept()
+                        except (BlockingIOError, OSError):
+                            continue
+                        conn.setblocking(False)
+                        # Small framed replies must not wait on Nagle/delayed-ACK
+                        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                        sel.register(conn, selectors.EVENT_READ, (bytearray(), bytearray()))
+                        continue
+                    
+                    try:
+                        if mask & selectors.EVENT_WRITE:
+                            handle_write(sock, key.data)
+                        if mask & selectors.EVENT_READ:
+                            handle_read(sock, key.data)
+                    except (ConnectionError, OSError):
+                        close(sock)
+        except:
+            pass
+        finally:
+            for key in list(sel.get_map().values()):
+                close(key.fileobj)
+            sel.close()
     
     def teardown(self) -> None:
         self._shutdown = True
@@ -467,22 +866,92 @@ class SocketBenchmark(BaseBenchmark):
         if self.server_thread:
             self.server_thread.join(timeout=2)
     
+    def _request(self, frame: bytes) -> dict:
+        """Send one encoded request frame and wait for its framed response."""
+        # The connection is shared by all worker threads; keep each
+        # request/response pair together so frames never interleave.
+        with self._client_lock:
+            self.client_socket.sendall(frame)
+            return _recv_frame(self.client_socket)
+    
+    def _set_frame(self, key: str, value: Any) -> bytes:
+        # Benchmarks reuse one value object, so a frame encoded for a key
+        # stays valid until a different value object comes in
+        if value is not self._set_value:
+            self._set_value = value
+            self._set_frames = {}
+        frame = self._set_frames.get(key)
+        if frame is None:
+            frame = self._set_frames[key] = _frame({"op": "set", "key": key, "value": value})
+        return frame
+    
+    def _get_frame(self, key: str) -> bytes:
+        frame = self._get_frames.get(key)
+        if frame is None:
+            frame = self._get_frames[key] = _frame({"op": "get", "key": key})
+        return frame
+    
     def set_operation(self, key: str, value: Any) -> Tuple[bool, Optional[str]]:
         try:
-            msg = json.dumps({"op": "set", "key": key, "value": value})
-            self.client_socket.sendall(msg.encode())
-            response = self.client_socket.recv(65536)
-            data = json.loads(response.decode())
-            return data.get('success', False), data.get('error')
+            data = self._request(self._set_frame(key, value))
+            if data.get('success', False):
+                return _OK
+            return False, data.get('error')
         except Exception as e:
             return False, str(e)
     
     def get_operation(self, key: str) -> Tuple[Any, bool, Optional[str]]:
         try:
-            msg = json.dumps({"op": "get", "key": key})
-            self.client_socket.sendall(msg.encode())
-            response = self.client_socket.recv(65536)
-            data = json.loads(response.decode())
+            data = self._request(self._get_frame(key))
             return data.get('value'), data.get('found', False), data.get('error')
         except Exception as e:
             return None, False, str(e)
+    
+    def run_batch(self, ops: List[Tuple[str, str, Any]]) -> List[Tuple[int, bool, Optional[str]]]:
+        """
+        Send every request frame in one sendall(), then read the responses
+        back in order. The server answers a connection FIFO, so the i-th
+        response belongs to the i-th request.
+        """
+        payload = b"".join(
+            self._set_frame(key, value) if kind == 'set' else self._get_frame(key)
+            for kind, key, value in ops
+        )
+        results = []
+        header_size = _FRAME_HEADER.size
+        start = time.perf_counter_ns()
+        
+        try:
+            with self._client_lock:
+                sock = self.client_socket
+                start = time.perf_counter_ns()
+                sock.sendall(payload)
+                
+                pending = bytearray()
+                while len(results) < len(ops):
+                    chunk = sock.recv(RECV_BUFFER_SIZE)
+                    if not chunk:
+                        raise ConnectionError("Socket closed by peer")
+                    pending += chunk
+                    now = time.perf_counter_ns()
+                    
+                    # Decode every complete frame that has arrived so far
+                    pos = 0
+                    while len(pending) - pos >= header_size:
+                        (length,) = _FRAME_HEADER.unpack_from(pending, pos)
+                        end = pos + header_size + length
+                        if end > len(pending):
+                            break
+                        data = msgpack.unpackb(pending[pos + header_size:end], raw=False)
+                        if ops[len(results)][0] == 'set':
+                            success = data.get('success', False)
+                        else:
+                            success = data.get('found', False)
+                        results.append((now - start, success, data.get('error')))
+                        pos = end
+                    del pending[:pos]
+        except Exception as e:
+            elapsed = time.perf_counter_ns() - start
+            results.extend((elapsed, False, str(e)) for _ in range(len(ops) - len(results)))
+        
+        return results
@@ -2,10 +2,14 @@
 Resource monitoring for CPU and RAM usage during benchmarks.
 """
 
+import os
 import time
+import signal
 import threading
 from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+
+import numpy as np
 
 try:
     import psutil
@@ -23,62 +27,98 @@ class ResourceSample:
     memory_percent: float
 
 
-@dataclass
 class ResourceStats:
-    """Aggregated resource statistics."""
-    samples: List[ResourceSample] = field(default_factory=list)
-    
+    """
+    Aggregated resource statistics.
+
+    Samples are stored column-wise (one NumPy array per metric) so every
+    aggregate is a single vectorized reduction instead of a Python-level
+    scan over a list of ResourceSample objects.
+    """
+
+    __slots__ = ('timestamps_ns', 'cpu_percent', 'memory_mb', 'memory_percent')
+
+    def __init__(
+        self,
+        timestamps_ns: Optional[np.ndarray] = None,
+        cpu_percent: Optional[np.ndarray] = None,
+        memory_mb: Optional[np.ndarray] = None,
+        memory_percent: Optional[np.ndarray] = None,
+    ):
+        self.timestamps_ns = _as_column(timestamps_ns, np.int64)
+        self.cpu_percent = _as_column(cpu_percent, np.float32)
+        self.memory_mb = _as_column(memory_mb, np.float32)
+        self.memory_percent = _as_column(memory_percent, np.float32)
+
+    @classmethod
+    def concat(cls, stats: List["ResourceStats"]) -> "ResourceStats":
+        """Concatenate several stats objects into one."""
+        if not stats:
+            return cls()
+        return cls(
+            timestamps_ns=np.concatenate([s.timestamps_ns for s in stats]),
+            cpu_percent=np.concatenate([s.cpu_percent for s in stats]),
+            memory_mb=np.concatenate([s.memory_mb for s in stats]),
+            memory_percent=np.concatenate([s.memory_percent for s in stats]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ns)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Sample times in seconds since the monitor started."""
+        return self.timestamps_ns * 1e-9
+
+    @property
+    def samples(self) -> List[ResourceSample]:
+        """Per-sample view (built on demand, for compatibility)."""
+        return [
+            ResourceSample(float(t), float(c), float(m), float(p))
+            for t, c, m, p in zip(
+                self.timestamps, self.cpu_percent, self.memory_mb, self.memory_percent
+            )
+        ]
+
     @property
     def cpu_avg(self) -> float:
-        if not self.samples:
-            return 0
-        return sum(s.cpu_percent for s in self.samples) / len(self.samples)
-    
+        return _mean(self.cpu_percent)
+
     @property
     def cpu_max(self) -> float:
-        if not self.samples:
-            return 0
-        return max(s.cpu_percent for s in self.samples)
-    
+        return _max(self.cpu_percent)
+
     @property
     def cpu_min(self) -> float:
-        if not self.samples:
-            return 0
-        return min(s.cpu_percent for s in self.samples)
-    
+        return _min(self.cpu_percent)
+
     @property
     def memory_avg_mb(self) -> float:
-        if not self.samples:
-            return 0
-        return sum(s.memory_mb for s in self.samples) / len(self.samples)
-    
+        return _mean(self.memory_mb)
+
     @property
     def memory_max_mb(self) -> float:
-        if not self.samples:
-            return 0
-        return max(s.memory_mb for s in self.samples)
-    
+        return _max(self.memory_mb)
+
     @property
     def memory_min_mb(self) -> float:
-        if not self.samples:
-            return 0
-        return min(s.memory_mb for s in self.samples)
-    
+        return _min(self.memory_mb)
+
     @property
     def memory_avg_percent(self) -> float:
-        if not self.samples:
-            return 0
-        return sum(s.memory_percent for s in self.samples) / len(self.samples)
-    
+        return _mean(self.memory_percent)
+
     @property
     def duration_seconds(self) -> float:
-        if len(self.samples) < 2:
+        ts = self.timestamps_ns
+        n = len(ts)
+        if n < 2:
             return 0
-        return self.samples[-1].timestamp - self.samples[0].timestamp
-    
+        return float(ts[n - 1] - ts[0]) * 1e-9
+
     def to_dict(self) -> dict:
         return {
-            'sample_count': len(self.samples),
+            'sample_count': len(self.timestamps_ns),
             'duration_seconds': round(self.duration_seconds, 2),
             'cpu': {
                 'avg_percent': round(self.cpu_avg, 2),
@@ -94,6 +134,26 @@ class ResourceStats:
         }
 
 
+def _as_column(values, dtype) -> np.ndarray:
+    """Coerce an optional sequence into a 1-D array of the given dtype."""
+    if values is None:
+        return np.empty(0, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+def _mean(column: np.ndarray) -> float:
+    """Mean of a column (accumulated in float64), 0 when empty."""
+    return float(column.mean(dtype=np.float64)) if len(column) else 0
+
+
+def _min(column: np.ndarray) -> float:
+    return float(column.min()) if len(column) else 0
+
+
+def _max(column: np.ndarray) -> float:
+    return float(column.max()) if len(column) else 0
+
+
 class ResourceMonitor:
     """
     Monitor CPU and RAM usage during benchmark execution.
@@ -106,68 +166,177 @@ class ResourceMonitor:
         
         stats = monitor.stop()
         print(f"Avg CPU: {stats.cpu_avg}%")
+    
+    With use_timer=True (POSIX, main thread only) samples are taken from a
+    SIGALRM handler driven by setitimer instead of a background thread, so
+    no second Python thread competes with the benchmark for the GIL.
+    Falls back to the thread when a timer cannot be installed.
     """
+
+    INITIAL_CAPACITY = 1024
     
-    def __init__(self, interval: float = 0.1):
+    def __init__(self, interval: float = 0.1, use_timer: bool = False, cpu: Optional[int] = None):
         """
         Args:
             interval: Sampling interval in seconds
+            use_timer: Sample from an interval-timer signal instead of a thread
+            cpu: Core to pin the monitor thread to (Linux), e.g. one the
+                benchmark is not pinned to
         """
         if not HAS_PSUTIL:
             raise ImportError("psutil is required for resource monitoring")
         
         self.interval = interval
+        self.use_timer = use_timer
+        self.cpu = cpu
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._samples: List[ResourceSample] = []
+        self._prev_handler = None
+        self._timer_active = False
         self._process: Optional[psutil.Process] = None
-        self._start_time: float = 0
+        self._start_ns: int = 0
+        self._n = 0
+        self._ts_ns = np.empty(0, np.int64)
+        self._cpu = np.empty(0, np.float32)
+        self._mem_mb = np.empty(0, np.float32)
+        self._mem_pct = np.empty(0, np.float32)
     
     def start(self) -> None:
         """Start monitoring."""
         if self._running:
             return
         
-        self._samples = []
+        capacity = self.INITIAL_CAPACITY
+        self._n = 0
+        self._ts_ns = np.empty(capacity, np.int64)
+        self._cpu = np.empty(capacity, np.float32)
+        self._mem_mb = np.empty(capacity, np.float32)
+        self._mem_pct = np.empty(capacity, np.float32)
         self._process = psutil.Process()
         self._running = True
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         
         # Initial CPU call (first call returns 0)
         self._process.cpu_percent()
         
+        if self.use_timer and self._start_timer():
+            return
+        
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
     
     def stop(self) -> ResourceStats:
         """Stop monitoring and return stats."""
         self._running = False
+        if self._timer_active:
+            self._stop_timer()
         if self._thread:
             self._thread.join(timeout=2)
             self._thread = None
         
-        return ResourceStats(samples=list(self._samples))
+        n = self._n
+        return ResourceStats(
+            timestamps_ns=self._ts_ns[:n].copy(),
+            cpu_percent=self._cpu[:n].copy(),
+            memory_mb=self._mem_mb[:n].copy(),
+            memory_percent=self._mem_pct[:n].copy(),
+        )
+    
+    def _read_sample(self) -> tuple:
+        """Read (cpu_percent, memory_mb, memory_percent) for this process."""
+        return (
+            self._process.cpu_percent(),
+            self._process.memory_info().rss / (1024 * 1024),
+            self._process.memory_percent(),
+        )
+    
+    def _record(self, timestamp_ns: int, cpu: float, mem_mb: float, mem_pct: float) -> None:
+        """Append one sample to the column buffers, growing them if full."""
+        n = self._n
+        if n == len(self._ts_ns):
+            capacity = max(2 * n, self.INITIAL_CAPACITY)
+            self._ts_ns = np.resize(self._ts_ns, capacity)
+            self._cpu = np.resize(self._cpu, capacity)
+            self._mem_mb = np.resize(self._mem_mb, capacity)
+            self._mem_pct = np.resize(self._mem_pct, capacity)
+        self._ts_ns[n] = timestamp_ns
+        self._cpu[n] = cpu
+        self._mem_mb[n] = mem_mb
+        self._mem_pct[n] = mem_pct
+        self._n = n + 1
     
     def _monitor_loop(self) -> None:
-        """Background monitoring loop."""
+        """
+        Background monitoring loop.
+        
+        Ticks on absolute deadlines (start + k * interval) so the time spent
+        reading a sample does not stretch the sampling period.
+        """
+        if self.cpu is not None and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {self.cpu})
+            except OSError:
+                pass
+        
+        base = self._start_ns
+        interval_ns = max(1, int(self.interval * 1e9))
+        k = 0
         while self._running:
             try:
-                sample = ResourceSample(
-                    timestamp=time.time() - self._start_time,
-                    cpu_percent=self._process.cpu_percent(),
-                    memory_mb=self._process.memory_info().rss / (1024 * 1024),
-                    memory_percent=self._process.memory_percent(),
-                )
-                self._samples.append(sample)
+                cpu, mem_mb, mem_pct = self._read_sample()
+                self._record(time.monotonic_ns() - base, cpu, mem_mb, mem_pct)
             except Exception:
                 pass
             
-            time.sleep(self.interval)
+            k += 1
+            delay_ns = base + k * interval_ns - time.monotonic_ns()
+            if delay_ns > 0:
+                time.sleep(delay_ns * 1e-9)
+            else:
+                # Overran one or more periods; skip to the next future tick
+                # rather than firing a burst of catch-up samples
+                k = (time.monotonic_ns() - base) // interval_ns
+    
+    def _start_timer(self) -> bool:
+        """Install the SIGALRM sampler. Returns False if unsupported here."""
+        if not hasattr(signal, 'setitimer'):
+            return False
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        
+        self._prev_handler = signal.signal(signal.SIGALRM, self._tick)
+        signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        self._timer_active = True
+        return True
+    
+    def _stop_timer(self) -> None:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self._prev_handler or signal.SIG_DFL)
+        self._prev_handler = None
+        self._timer_active = False
+    
+    def _tick(self, signum, frame) -> None:
+        """SIGALRM handler: take one sample."""
+        if not self._running:
+            return
+        try:
+            cpu, mem_mb, mem_pct = self._read_sample()
+            self._record(time.monotonic_ns() - self._start_ns, cpu, mem_mb, mem_pct)
+        except Exception:
+            pass
     
     def get_current_sample(self) -> Optional[ResourceSample]:
         """Get the most recent sample."""
-        if self._samples:
-            return self._samples[-1]
+        n = self._n
+        if n:
+            i = n - 1
+            return ResourceSample(
+                timestamp=float(self._ts_ns[i]) * 1e-9,
+                cpu_percent=float(self._cpu[i]),
+                memory_mb=float(self._mem_mb[i]),
+                memory_percent=float(self._mem_pct[i]),
+            )
         return None
 
 
@@ -176,22 +345,10 @@ class SystemResourceMonitor(ResourceMonitor):
     Monitor system-wide CPU and RAM usage (not just this process).
     """
     
-    def _monitor_loop(self) -> None:
-        """Background monitoring loop for system resources."""
-        while self._running:
-            try:
-                mem = psutil.virtual_memory()
-                sample = ResourceSample(
-                    timestamp=time.time() - self._start_time,
-                    cpu_percent=psutil.cpu_percent(),
-                    memory_mb=mem.used / (1024 * 1024),
-                    memory_percent=mem.percent,
-                )
-                self._samples.append(sample)
-            except Exception:
-                pass
-            
-            time.sleep(self.interval)
+    def _read_sample(self) -> tuple:
+        """Read (cpu_percent, memory_mb, memory_percent) for the whole system."""
+        mem = psutil.virtual_memory()
+        return psutil.cpu_percent(), mem.used / (1024 * 1024), mem.percent
 
 
 def get_system_info() -> dict:
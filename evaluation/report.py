@@ -10,19 +10,118 @@ Creates a comprehensive Markdown report with:
 """
 
 import json
+import os
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, NamedTuple, Optional
 from pathlib import Path
 
+import numpy as np
+
 from .benchmarks import BenchmarkResult
 from .monitor import ResourceStats, get_system_info
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Report file buffer; small section writes are coalesced into ~1 MiB flushes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# ASCII chart bars are sliced from these instead of built per row
+_FULL = '█' * 60
+_EMPTY = '░' * 60
+
+# Results Overview rows, formatted from one template per table
+_THROUGHPUT_ROW = "| {method} | {set:,.0f} | {get:,.0f} | {mixed:,.0f} |\n"
+_LATENCY_ROW = (
+    "| {0} | {1.result.operation} | {1.avg:.3f} | {1.p50:.3f} "
+    "| {1.p95:.3f} | {1.p99:.3f} | {1.max:.3f} |\n"
+)
+
+# Above this many results, the per-result sections keep only the fastest
+# rows and latency bars collapse to per-method averages
+MAX_DETAIL_ROWS = 200
+
+
+def _dumps_indented(obj: Any) -> str:
+    """JSON-encode with 2-space indentation, via orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+class _ZeroDefault(dict):
+    """format_map namespace in which operations that were not run read as 0."""
+    
+    def __missing__(self, key: str) -> int:
+        return 0
+
+
+class _Summary(NamedTuple):
+    """Metrics of one result, read once (latency_stats is recomputed per access)."""
+    result: BenchmarkResult
+    throughput: float
+    success_rate: float
+    min: float
+    avg: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    stdev: float
+
+
+def _summarize(r: BenchmarkResult) -> _Summary:
+    lat = r.latency_stats
+    return _Summary(
+        r, r.throughput, r.success_rate,
+        lat['min'], lat['avg'], lat['p50'], lat['p95'], lat['p99'], lat['max'], lat.get('stdev', 0),
+    )
+
+
+def _summary_dict(sm: _Summary) -> dict:
+    """BenchmarkResult.to_dict() from the precomputed metrics."""
+    r = sm.result
+    return {
+        'name': r.name,
+        'operation': r.operation,
+        'total_operations': r.total_operations,
+        'successful_operations': r.successful_operations,
+        'failed_operations': r.failed_operations,
+        'total_time_seconds': r.total_time_seconds,
+        'throughput_ops_per_sec': sm.throughput,
+        'success_rate_percent': sm.success_rate,
+        'latency_ms': {
+            'min': sm.min, 'max': sm.max, 'avg': sm.avg,
+            'p50': sm.p50, 'p95': sm.p95, 'p99': sm.p99, 'stdev': sm.stdev,
+        },
+        'error_count': r.failed_operations,
+        'sample_errors': r.errors[:5] if r.errors else [],
+    }
+
+
+def _latency_bars(label: str, mn: float, p50: float, p95: float, p99: float, mx: float) -> str:
+    """Percentile bars for one entry of the latency visualization."""
+    return (
+        f"\n{label}:\n"
+        f"  Min  [█] {mn:.3f}ms\n"
+        f"  P50  [{_FULL[:min(20, int(p50 * 10))]}] {p50:.3f}ms\n"
+        f"  P95  [{_FULL[:min(40, int(p95 * 10))]}] {p95:.3f}ms\n"
+        f"  P99  [{_FULL[:min(50, int(p99 * 10))]}] {p99:.3f}ms\n"
+        f"  Max  [{_FULL[:min(60, int(mx * 5))]}] {mx:.3f}ms\n"
+    )
+
 
 def generate_report(
     results: Dict[str, List[BenchmarkResult]],
     resource_stats: Dict[str, ResourceStats],
     output_path: str = "evaluation/REPORT.md",
-    config: dict = None
+    config: dict = None,
+    sys_info: Optional[dict] = None,
+    max_detail_rows: Optional[int] = MAX_DETAIL_ROWS
 ) -> str:
     """
     Generate a comprehensive evaluation report.
@@ -32,381 +131,551 @@ def generate_report(
         resource_stats: Dict of {method_name: ResourceStats}
         output_path: Path to save the report
         config: Benchmark configuration used
+        sys_info: System information already collected by the caller
+            (collected here if omitted)
+        max_detail_rows: Per-result rows to write before eliding the rest
+            (None writes every row, 0 only per-method summaries)
     
     Returns:
         Path to generated report
     """
     config = config or {}
-    report_lines = []
+    if sys_info is None:
+        sys_info = get_system_info()
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    def add(line: str = ""):
-        report_lines.append(line)
+    # Sections, and the raw JSON sidecar, are streamed through large write
+    # buffers rather than assembled in memory first. They go to .tmp files
+    # moved into place once complete, so a failed run leaves the previous
+    # report intact rather than a truncated one
+    json_path = output_path.with_suffix('.json')
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    json_tmp_path = json_path.with_name(json_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f, \
+                open(json_tmp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as jf:
+            _write_sections(
+                f.write, jf.write, results, resource_stats, config, sys_info, max_detail_rows
+            )
+    except BaseException:
+        for path in (tmp_path, json_tmp_path):
+            path.unlink(missing_ok=True)
+        raise
+    os.replace(json_tmp_path, json_path)
+    os.replace(tmp_path, output_path)
+    
+    return str(output_path)
+
+
+def _write_sections(
+    w: Callable[[str], Any],
+    raw_w: Callable[[str], Any],
+    results: Dict[str, List[BenchmarkResult]],
+    resource_stats: Dict[str, ResourceStats],
+    config: dict,
+    sys_info: dict,
+    max_detail_rows: Optional[int] = MAX_DETAIL_ROWS,
+) -> None:
+    """Write every report section through w and the raw-data JSON through raw_w."""
+    # One timestamp for both the header and the raw data
+    now = datetime.now()
     
     # === Header ===
-    add("# latzero Evaluation Report")
-    add()
-    add(f"> Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    add()
-    add("---")
-    add()
+    w(
+        "# latzero Evaluation Report\n"
+        "\n"
+        f"> Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Table of Contents ===
-    add("## Table of Contents")
-    add()
-    add("1. [Executive Summary](#executive-summary)")
-    add("2. [System Information](#system-information)")
-    add("3. [Benchmark Configuration](#benchmark-configuration)")
-    add("4. [Results Overview](#results-overview)")
-    add("5. [Detailed Results](#detailed-results)")
-    add("6. [Latency Analysis](#latency-analysis)")
-    add("7. [Resource Usage](#resource-usage)")
-    add("8. [Reliability Analysis](#reliability-analysis)")
-    add("9. [Comparison Charts](#comparison-charts)")
-    add("10. [Conclusions](#conclusions)")
-    add("11. [Raw Data](#raw-data)")
-    add()
-    add("---")
-    add()
+    w(
+        "## Table of Contents\n"
+        "\n"
+        "1. [Executive Summary](#executive-summary)\n"
+        "2. [System Information](#system-information)\n"
+        "3. [Benchmark Configuration](#benchmark-configuration)\n"
+        "4. [Results Overview](#results-overview)\n"
+        "5. [Detailed Results](#detailed-results)\n"
+        "6. [Latency Analysis](#latency-analysis)\n"
+        "7. [Resource Usage](#resource-usage)\n"
+        "8. [Reliability Analysis](#reliability-analysis)\n"
+        "9. [Comparison Charts](#comparison-charts)\n"
+        "10. [Conclusions](#conclusions)\n"
+        "11. [Raw Data](#raw-data)\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Executive Summary ===
-    add("## Executive Summary")
-    add()
+    w(
+        "## Executive Summary\n"
+        "\n"
+    )
+    
+    # Derived metrics for every result, computed once and shared by all sections
+    # Item lists are materialized once and walked by every section below
+    results_items = list(results.items())
+    resource_items = list(resource_stats.items())
+    rs_dict = {method: stats.to_dict() for method, stats in resource_items}
+    summaries = {method: [_summarize(r) for r in rs] for method, rs in results_items}
+    summary_items = list(summaries.items())
+    all_results = [(method, sm) for method, sms in summary_items for sm in sms]
+    
+    # Past max_detail_rows only the fastest results get a detail block
+    elided = 0
+    if max_detail_rows is not None and len(all_results) > max_detail_rows:
+        fastest = sorted(all_results, key=lambda mr: mr[1].throughput, reverse=True)
+        detail_ids = {id(sm) for _, sm in fastest[:max_detail_rows]}
+        elided = len(all_results) - len(detail_ids)
+    
+    # One structured row per result (grouped by method, in all_results
+    # order); winners and per-method aggregates are reductions over columns
+    arr = np.array(
+        [(sm.throughput, sm.avg, sm.success_rate) for _, sm in all_results],
+        dtype=[('tp', 'f8'), ('lat', 'f8'), ('sr', 'f8')],
+    )
+    
+    # Per-method aggregates shared by the comparison, chart and conclusion
+    # sections, reduced segment-wise (methods without results are skipped,
+    # since reduceat cannot express an empty segment)
+    counts = np.array([len(sms) for _, sms in summary_items], dtype=np.intp)
+    starts = (np.cumsum(counts) - counts)[counts > 0]
+    if len(starts):
+        tp_sums = np.add.reduceat(arr['tp'], starts).tolist()
+        tp_maxes = np.maximum.reduceat(arr['tp'], starts).tolist()
+        lat_sums = np.add.reduceat(arr['lat'], starts).tolist()
+        lat_maxes = np.maximum.reduceat(arr['lat'], starts).tolist()
+    
+    agg = {}
+    seg = 0
+    for (method, _), n in zip(summary_items, counts.tolist()):
+        if not n:
+            agg[method] = {'total_tp': 0, 'max_tp': 0, 'avg_tp': 0, 'avg_lat': 0, 'max_lat': 0}
+            continue
+        agg[method] = {
+            'total_tp': tp_sums[seg],
+            'max_tp': tp_maxes[seg],
+            'avg_tp': tp_sums[seg] / n,
+            'avg_lat': lat_sums[seg] / n,
+            'max_lat': max(lat_maxes[seg], 0),
+        }
+        seg += 1
     
     # Find the best performer for key metrics
-    all_results = []
-    for method, method_results in results.items():
-        for r in method_results:
-            all_results.append((method, r))
-    
     if all_results:
-        # Best throughput
-        best_throughput = max(all_results, key=lambda x: x[1].throughput)
-        # Best latency (lowest avg)
-        best_latency = min(all_results, key=lambda x: x[1].latency_stats['avg'] if x[1].latency_stats['avg'] > 0 else float('inf'))
-        # Best reliability
-        best_reliability = max(all_results, key=lambda x: x[1].success_rate)
+        # Highest throughput, lowest (non-zero) avg latency and best
+        # reliability; argmax/argmin keep the first result on ties
+        lat = arr['lat']
+        positive = np.flatnonzero(lat > 0)
+        lat_i = int(positive[lat[positive].argmin()]) if len(positive) else 0
+        
+        tp_method, tp_sm = all_results[int(arr['tp'].argmax())]
+        rel_method, rel_sm = all_results[int(arr['sr'].argmax())]
+        lat_method, lat_sm = all_results[lat_i]
+        best_tp = tp_sm.throughput
+        best_rel = rel_sm.success_rate
+        best_lat = lat_sm.avg
         
-        add("### Key Findings")
-        add()
-        add(f"| Metric | Winner | Value |")
-        add(f"|--------|--------|-------|")
-        add(f"| **Highest Throughput** | {best_throughput[0]} | {best_throughput[1].throughput:,.0f} ops/sec |")
-        add(f"| **Lowest Latency** | {best_latency[0]} | {best_latency[1].latency_stats['avg']:.3f} ms avg |")
-        add(f"| **Best Reliability** | {best_reliability[0]} | {best_reliability[1].success_rate:.2f}% success |")
-        add()
+        w(
+            "### Key Findings\n"
+            "\n"
+            "| Metric | Winner | Value |\n"
+            "|--------|--------|-------|\n"
+            f"| **Highest Throughput** | {tp_method} | {best_tp:,.0f} ops/sec |\n"
+            f"| **Lowest Latency** | {lat_method} | {best_lat:.3f} ms avg |\n"
+            f"| **Best Reliability** | {rel_method} | {best_rel:.2f}% success |\n"
+            "\n"
+        )
         
         # Speed comparison
         if 'latzero' in results and len(results) > 1:
-            latzero_throughput = max(r.throughput for r in results.get('latzero', [{'throughput': 0}]))
+            latzero_throughput = agg['latzero']['max_tp']
             comparisons = []
-            for method, method_results in results.items():
-                if method != 'latzero' and method_results:
-                    other_throughput = max(r.throughput for r in method_results)
+            for method, method_summaries in summary_items:
+                if method != 'latzero' and method_summaries:
+                    other_throughput = agg[method]['max_tp']
                     if other_throughput > 0:
                         speedup = latzero_throughput / other_throughput
                         comparisons.append(f"**{speedup:.1f}x faster** than {method}")
             
             if comparisons:
-                add("### Speed Advantage")
-                add()
-                add(f"latzero is: {', '.join(comparisons)}")
-                add()
-    
-    add("---")
-    add()
+                w(
+                    "### Speed Advantage\n"
+                    "\n"
+                    f"latzero is: {', '.join(comparisons)}\n"
+                    "\n"
+                )
+    
+    w(
+        "---\n"
+        "\n"
+    )
     
     # === System Information ===
-    add("## System Information")
-    add()
-    sys_info = get_system_info()
-    add("| Property | Value |")
-    add("|----------|-------|")
+    w(
+        "## System Information\n"
+        "\n"
+        "| Property | Value |\n"
+        "|----------|-------|\n"
+    )
     for key, value in sys_info.items():
-        add(f"| {key.replace('_', ' ').title()} | {value} |")
-    add()
-    add("---")
-    add()
+        w(f"| {key.replace('_', ' ').title()} | {value} |\n")
+    w(
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Benchmark Configuration ===
-    add("## Benchmark Configuration")
-    add()
-    add("```json")
-    add(json.dumps(config, indent=2))
-    add("```")
-    add()
-    add("---")
-    add()
+    w(
+        "## Benchmark Configuration\n"
+        "\n"
+        "```json\n"
+    )
+    w(_dumps_indented(config))
+    w(
+        "\n"
+        "```\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Results Overview ===
-    add("## Results Overview")
-    add()
-    add("### Throughput Comparison (ops/sec)")
-    add()
-    add("| Method | SET | GET | Mixed |")
-    add("|--------|-----|-----|-------|")
-    
-    for method, method_results in results.items():
-        set_tp = next((r.throughput for r in method_results if r.operation == 'set'), 0)
-        get_tp = next((r.throughput for r in method_results if r.operation == 'get'), 0)
-        mixed_tp = next((r.throughput for r in method_results if r.operation == 'mixed'), 0)
-        add(f"| {method} | {set_tp:,.0f} | {get_tp:,.0f} | {mixed_tp:,.0f} |")
-    add()
-    
-    add("### Latency Comparison (ms)")
-    add()
-    add("| Method | Operation | Avg | P50 | P95 | P99 | Max |")
-    add("|--------|-----------|-----|-----|-----|-----|-----|")
-    
-    for method, method_results in results.items():
-        for r in method_results:
-            lat = r.latency_stats
-            add(f"| {method} | {r.operation} | {lat['avg']:.3f} | {lat['p50']:.3f} | {lat['p95']:.3f} | {lat['p99']:.3f} | {lat['max']:.3f} |")
-    add()
-    add("---")
-    add()
+    w(
+        "## Results Overview\n"
+        "\n"
+        "### Throughput Comparison (ops/sec)\n"
+        "\n"
+        "| Method | SET | GET | Mixed |\n"
+        "|--------|-----|-----|-------|\n"
+    )
+    
+    rows = []
+    for method, method_summaries in summary_items:
+        # Built in reverse so the first result per operation wins, as before
+        by_op = _ZeroDefault((sm.result.operation, sm.throughput) for sm in reversed(method_summaries))
+        by_op['method'] = method
+        rows.append(_THROUGHPUT_ROW.format_map(by_op))
+    rows.append("\n")
+    w(''.join(rows))
+    
+    w(
+        "### Latency Comparison (ms)\n"
+        "\n"
+        "| Method | Operation | Avg | P50 | P95 | P99 | Max |\n"
+        "|--------|-----------|-----|-----|-----|-----|-----|\n"
+    )
+    
+    w(''.join([_LATENCY_ROW.format(method, sm) for method, sm in all_results]))
+    w(
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Detailed Results ===
-    add("## Detailed Results")
-    add()
-    
-    for method, method_results in results.items():
-        add(f"### {method}")
-        add()
+    w(
+        "## Detailed Results\n"
+        "\n"
+    )
+    
+    for method, method_summaries in summary_items:
+        if elided:
+            method_summaries = [sm for sm in method_summaries if id(sm) in detail_ids]
+            if not method_summaries:
+                continue
+        
+        w(
+            f"### {method}\n"
+            "\n"
+        )
         
-        for r in method_results:
-            add(f"#### {r.operation.upper()} Operations")
-            add()
-            add(f"- **Total Operations**: {r.total_operations:,}")
-            add(f"- **Successful**: {r.successful_operations:,}")
-            add(f"- **Failed**: {r.failed_operations:,}")
-            add(f"- **Success Rate**: {r.success_rate:.2f}%")
-            add(f"- **Total Time**: {r.total_time_seconds:.2f}s")
-            add(f"- **Throughput**: {r.throughput:,.0f} ops/sec")
-            add()
+        for sm in method_summaries:
+            r = sm.result
+            w(
+                f"#### {r.operation.upper()} Operations\n"
+                "\n"
+                f"- **Total Operations**: {r.total_operations:,}\n"
+                f"- **Successful**: {r.successful_operations:,}\n"
+                f"- **Failed**: {r.failed_operations:,}\n"
+                f"- **Success Rate**: {sm.success_rate:.2f}%\n"
+                f"- **Total Time**: {r.total_time_seconds:.2f}s\n"
+                f"- **Throughput**: {sm.throughput:,.0f} ops/sec\n"
+                "\n"
+            )
             
-            lat = r.latency_stats
-            add("**Latency Distribution:**")
-            add()
-            add(f"| Metric | Value (ms) |")
-            add(f"|--------|------------|")
-            add(f"| Min | {lat['min']:.4f} |")
-            add(f"| Avg | {lat['avg']:.4f} |")
-            add(f"| P50 (Median) | {lat['p50']:.4f} |")
-            add(f"| P95 | {lat['p95']:.4f} |")
-            add(f"| P99 | {lat['p99']:.4f} |")
-            add(f"| Max | {lat['max']:.4f} |")
-            add(f"| Std Dev | {lat.get('stdev', 0):.4f} |")
-            add()
+            w(
+                "**Latency Distribution:**\n"
+                "\n"
+                "| Metric | Value (ms) |\n"
+                "|--------|------------|\n"
+                f"| Min | {sm.min:.4f} |\n"
+                f"| Avg | {sm.avg:.4f} |\n"
+                f"| P50 (Median) | {sm.p50:.4f} |\n"
+                f"| P95 | {sm.p95:.4f} |\n"
+                f"| P99 | {sm.p99:.4f} |\n"
+                f"| Max | {sm.max:.4f} |\n"
+                f"| Std Dev | {sm.stdev:.4f} |\n"
+                "\n"
+            )
             
             if r.errors:
-                add(f"**Sample Errors ({len(r.errors)} total):**")
-                add("```")
+                w(
+                    f"**Sample Errors ({r.failed_operations} total):**\n"
+                    "```\n"
+                )
                 for err in r.errors[:5]:
-                    add(f"  - {err}")
-                add("```")
-                add()
+                    w(f"  - {err}\n")
+                w(
+                    "```\n"
+                    "\n"
+                )
         
-        add("---")
-        add()
+        w(
+            "---\n"
+            "\n"
+        )
+    
+    if elided:
+        w(
+            f"*... {elided} more rows elided, see [Raw Data](#raw-data) ...*\n"
+            "\n"
+        )
     
     # === Latency Analysis ===
-    add("## Latency Analysis")
-    add()
-    add("### Latency Distribution Visualization")
-    add()
-    add("```")
-    add("Latency Percentiles (lower is better)")
-    add("=" * 60)
-    
-    for method, method_results in results.items():
-        for r in method_results:
-            lat = r.latency_stats
-            add(f"\n{method} - {r.operation}:")
-            add(f"  Min  [{'█' * 1}] {lat['min']:.3f}ms")
-            add(f"  P50  [{'█' * min(20, int(lat['p50'] * 10))}] {lat['p50']:.3f}ms")
-            add(f"  P95  [{'█' * min(40, int(lat['p95'] * 10))}] {lat['p95']:.3f}ms")
-            add(f"  P99  [{'█' * min(50, int(lat['p99'] * 10))}] {lat['p99']:.3f}ms")
-            add(f"  Max  [{'█' * min(60, int(lat['max'] * 5))}] {lat['max']:.3f}ms")
-    
-    add("```")
-    add()
-    add("---")
-    add()
+    w(
+        "## Latency Analysis\n"
+        "\n"
+        "### Latency Distribution Visualization\n"
+        "\n"
+        "```\n"
+        "Latency Percentiles (lower is better)\n"
+        f"{'=' * 60}\n"
+    )
+    
+    if elided:
+        # Too many results to chart one by one; average per method instead
+        for method, sms in summary_items:
+            if sms:
+                cols = np.array([(sm.min, sm.p50, sm.p95, sm.p99, sm.max) for sm in sms])
+                w(_latency_bars(f"{method} - mean of {len(sms)} results", *cols.mean(axis=0).tolist()))
+    else:
+        for method, sm in all_results:
+            w(_latency_bars(f"{method} - {sm.result.operation}", sm.min, sm.p50, sm.p95, sm.p99, sm.max))
+    
+    w(
+        "```\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Resource Usage ===
-    add("## Resource Usage")
-    add()
+    w(
+        "## Resource Usage\n"
+        "\n"
+    )
     
     if resource_stats:
-        add("### CPU and Memory by Method")
-        add()
-        add("| Method | CPU Avg (%) | CPU Max (%) | RAM Avg (MB) | RAM Max (MB) |")
-        add("|--------|-------------|-------------|--------------|--------------|")
+        w(
+            "### CPU and Memory by Method\n"
+            "\n"
+            "| Method | CPU Avg (%) | CPU Max (%) | RAM Avg (MB) | RAM Max (MB) |\n"
+            "|--------|-------------|-------------|--------------|--------------|\n"
+        )
         
-        for method, stats in resource_stats.items():
-            data = stats.to_dict()
+        for method, data in rs_dict.items():
             cpu = data['cpu']
             mem = data['memory']
-            add(f"| {method} | {cpu['avg_percent']:.1f} | {cpu['max_percent']:.1f} | {mem['avg_mb']:.1f} | {mem['max_mb']:.1f} |")
-        add()
+            w(f"| {method} | {cpu['avg_percent']:.1f} | {cpu['max_percent']:.1f} | {mem['avg_mb']:.1f} | {mem['max_mb']:.1f} |\n")
+        w("\n")
         
         # Efficiency calculation
-        add("### Efficiency Score")
-        add()
-        add("*Efficiency = Throughput / (CPU% × RAM_MB)*")
-        add()
-        add("| Method | Throughput | CPU% | RAM (MB) | Efficiency |")
-        add("|--------|------------|------|----------|------------|")
+        w(
+            "### Efficiency Score\n"
+            "\n"
+            "*Efficiency = Throughput / (CPU% × RAM_MB)*\n"
+            "\n"
+            "| Method | Throughput | CPU% | RAM (MB) | Efficiency |\n"
+            "|--------|------------|------|----------|------------|\n"
+        )
         
-        for method, method_results in results.items():
-            if method in resource_stats:
-                stats = resource_stats[method].to_dict()
-                total_throughput = sum(r.throughput for r in method_results)
+        for method in summaries:
+            if method in rs_dict:
+                stats = rs_dict[method]
+                total_throughput = agg[method]['total_tp']
                 cpu = max(stats['cpu']['avg_percent'], 0.1)
                 ram = max(stats['memory']['avg_mb'], 0.1)
                 efficiency = total_throughput / (cpu * ram) * 100
-                add(f"| {method} | {total_throughput:,.0f} | {cpu:.1f} | {ram:.1f} | {efficiency:,.0f} |")
-        add()
+                w(f"| {method} | {total_throughput:,.0f} | {cpu:.1f} | {ram:.1f} | {efficiency:,.0f} |\n")
+        w("\n")
     else:
-        add("*Resource monitoring data not available*")
-        add()
+        w(
+            "*Resource monitoring data not available*\n"
+            "\n"
+        )
     
-    add("---")
-    add()
+    w(
+        "---\n"
+        "\n"
+    )
     
     # === Reliability Analysis ===
-    add("## Reliability Analysis")
-    add()
-    add("| Method | Operation | Success Rate | Errors |")
-    add("|--------|-----------|--------------|--------|")
-    
-    for method, method_results in results.items():
-        for r in method_results:
-            add(f"| {method} | {r.operation} | {r.success_rate:.2f}% | {r.failed_operations} |")
-    add()
+    w(
+        "## Reliability Analysis\n"
+        "\n"
+        "| Method | Operation | Success Rate | Errors |\n"
+        "|--------|-----------|--------------|--------|\n"
+    )
+    
+    for method, sm in all_results:
+        r = sm.result
+        w(f"| {method} | {r.operation} | {sm.success_rate:.2f}% | {r.failed_operations} |\n")
+    w("\n")
     
     # Reliability summary
-    perfect = [m for m, rs in results.items() if all(r.success_rate == 100 for r in rs)]
+    perfect = [m for m, sms in summary_items if all(sm.success_rate == 100 for sm in sms)]
     if perfect:
-        add(f"✅ **100% reliability achieved by**: {', '.join(perfect)}")
-    add()
-    add("---")
-    add()
+        w(f"✅ **100% reliability achieved by**: {', '.join(perfect)}\n")
+    w(
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Comparison Charts ===
-    add("## Comparison Charts")
-    add()
-    add("### Throughput Bar Chart")
-    add()
-    add("```")
-    add("Operations per Second (higher is better)")
-    add("=" * 60)
-    
-    max_tp = max(r.throughput for _, rs in results.items() for r in rs) if all_results else 1
-    for method, method_results in results.items():
-        avg_tp = sum(r.throughput for r in method_results) / len(method_results) if method_results else 0
+    w(
+        "## Comparison Charts\n"
+        "\n"
+        "### Throughput Bar Chart\n"
+        "\n"
+        "```\n"
+        "Operations per Second (higher is better)\n"
+        f"{'=' * 60}\n"
+    )
+    
+    max_tp = max(a['max_tp'] for a in agg.values()) if all_results else 1
+    for method, a in agg.items():
+        avg_tp = a['avg_tp']
         bar_len = int((avg_tp / max_tp) * 40)
-        add(f"{method:12} [{'█' * bar_len}{'░' * (40-bar_len)}] {avg_tp:,.0f}")
+        w(f"{method:12} [{_FULL[:bar_len]}{_EMPTY[bar_len:40]}] {avg_tp:,.0f}\n")
     
-    add("```")
-    add()
+    w(
+        "```\n"
+        "\n"
+    )
     
-    add("### Latency Comparison")
-    add()
-    add("```")
-    add("Average Latency in ms (lower is better)")
-    add("=" * 60)
+    w(
+        "### Latency Comparison\n"
+        "\n"
+        "```\n"
+        "Average Latency in ms (lower is better)\n"
+        f"{'=' * 60}\n"
+    )
     
-    all_lats = [r.latency_stats['avg'] for _, rs in results.items() for r in rs if r.latency_stats['avg'] > 0]
-    max_lat = max(all_lats) if all_lats else 1
+    max_lat = max((a['max_lat'] for a in agg.values()), default=0) or 1
     
-    for method, method_results in results.items():
-        avg_lat = sum(r.latency_stats['avg'] for r in method_results) / len(method_results) if method_results else 0
+    for method, a in agg.items():
+        avg_lat = a['avg_lat']
         bar_len = int((avg_lat / max_lat) * 40) if max_lat > 0 else 0
-        add(f"{method:12} [{'█' * bar_len}{'░' * (40-bar_len)}] {avg_lat:.3f}ms")
+        w(f"{method:12} [{_FULL[:bar_len]}{_EMPTY[bar_len:40]}] {avg_lat:.3f}ms\n")
     
-    add("```")
-    add()
-    add("---")
-    add()
+    w(
+        "```\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Conclusions ===
-    add("## Conclusions")
-    add()
+    w(
+        "## Conclusions\n"
+        "\n"
+    )
     
     if 'latzero' in results:
-        latzero_results = results['latzero']
-        latzero_avg_tp = sum(r.throughput for r in latzero_results) / len(latzero_results)
-        latzero_avg_lat = sum(r.latency_stats['avg'] for r in latzero_results) / len(latzero_results)
+        latzero_avg_tp = agg['latzero']['avg_tp']
+        latzero_avg_lat = agg['latzero']['avg_lat']
         
-        add("### latzero Performance Summary")
-        add()
-        add(f"- **Average Throughput**: {latzero_avg_tp:,.0f} operations/second")
-        add(f"- **Average Latency**: {latzero_avg_lat:.3f} ms")
-        add()
+        w(
+            "### latzero Performance Summary\n"
+            "\n"
+            f"- **Average Throughput**: {latzero_avg_tp:,.0f} operations/second\n"
+            f"- **Average Latency**: {latzero_avg_lat:.3f} ms\n"
+            "\n"
+        )
         
         # Comparisons
-        for method, method_results in results.items():
-            if method != 'latzero' and method_results:
-                other_avg_tp = sum(r.throughput for r in method_results) / len(method_results)
-                other_avg_lat = sum(r.latency_stats['avg'] for r in method_results) / len(method_results)
+        for method, method_summaries in summary_items:
+            if method != 'latzero' and method_summaries:
+                other_avg_tp = agg[method]['avg_tp']
+                other_avg_lat = agg[method]['avg_lat']
                 
                 if other_avg_tp > 0:
                     tp_ratio = latzero_avg_tp / other_avg_tp
                     lat_ratio = other_avg_lat / latzero_avg_lat if latzero_avg_lat > 0 else 0
                     
-                    add(f"**vs {method}:**")
-                    add(f"- {tp_ratio:.1f}x faster throughput")
-                    add(f"- {lat_ratio:.1f}x lower latency")
-                    add()
-    
-    add("### Recommendations")
-    add()
-    add("1. **For maximum speed**: Use latzero for inter-process communication")
-    add("2. **For cross-machine**: Use HTTP or Socket (latzero is same-machine only)")
-    add("3. **For persistence**: Enable latzero snapshots for data durability")
-    add()
-    add("---")
-    add()
+                    w(
+                        f"**vs {method}:**\n"
+                        f"- {tp_ratio:.1f}x faster throughput\n"
+                        f"- {lat_ratio:.1f}x lower latency\n"
+                        "\n"
+                    )
+    
+    w(
+        "### Recommendations\n"
+        "\n"
+        "1. **For maximum speed**: Use latzero for inter-process communication\n"
+        "2. **For cross-machine**: Use HTTP or Socket (latzero is same-machine only)\n"
+        "3. **For persistence**: Enable latzero snapshots for data durability\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
     
     # === Raw Data ===
-    add("## Raw Data")
-    add()
-    add("<details>")
-    add("<summary>Click to expand JSON data</summary>")
-    add()
-    add("```json")
+    w(
+        "## Raw Data\n"
+        "\n"
+        "<details>\n"
+        "<summary>Click to expand JSON data</summary>\n"
+        "\n"
+        "```json\n"
+    )
     
     raw_data = {
-        'generated_at': datetime.now().isoformat(),
+        'generated_at': now.isoformat(),
         'config': config,
         'system_info': sys_info,
         'results': {
-            method: [r.to_dict() for r in rs]
-            for method, rs in results.items()
+            method: [_summary_dict(sm) for sm in method_summaries]
+            for method, method_summaries in summary_items
         },
-        'resource_stats': {
-            method: stats.to_dict()
-            for method, stats in resource_stats.items()
-        }
+        'resource_stats': rs_dict
     }
-    add(json.dumps(raw_data, indent=2))
-    add("```")
-    add()
-    add("</details>")
-    add()
-    add("---")
-    add()
-    add("*Report generated by latzero evaluation suite*")
-    
-    # Write report
-    report_content = "\n".join(report_lines)
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(report_content, encoding='utf-8')
-    
-    # Also save raw JSON
-    json_path = output_path.with_suffix('.json')
-    json_path.write_text(json.dumps(raw_data, indent=2), encoding='utf-8')
-    
-    return str(output_path)
+    if HAS_ORJSON:
+        raw_json = _dumps_indented(raw_data)
+        w(raw_json)
+        raw_w(raw_json)
+    else:
+        # Feed the encoder's chunks to both files; the document is never
+        # held as one string
+        for chunk in json.JSONEncoder(indent=2, default=str).iterencode(raw_data):
+            w(chunk)
+            raw_w(chunk)
+    w(
+        "\n"
+        "```\n"
+        "\n"
+        "</details>\n"
+        "\n"
+        "---\n"
+        "\n"
+        "*Report generated by latzero evaluation suite*\n"
+    )
@@ -4,10 +4,12 @@ Main evaluation runner.
 Orchestrates all benchmarks, monitors resources, and generates reports.
 """
 
+import os
 import sys
 import time
 import argparse
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 from .benchmarks import (
@@ -18,7 +20,15 @@ from .benchmarks import (
     SocketBenchmark,
 )
 from .monitor import ResourceMonitor, ResourceStats, get_system_info
-from .report import generate_report
+from .report import MAX_DETAIL_ROWS, generate_report
+
+# The HTTP benchmark needs an aiohttp server and a requests client; probe once
+try:
+    import aiohttp
+    import requests
+    HAS_HTTP = True
+except ImportError:
+    HAS_HTTP = False
 
 
 # Default configuration
@@ -42,15 +52,13 @@ def run_single_benchmark(
     operation: str,
     payload_size: int,
     threads: int,
-    monitor: Optional[ResourceMonitor] = None
-) -> tuple:
-    """Run a single benchmark with optional resource monitoring."""
-    
-    print(f"    {operation.upper()}: {num_operations:,} ops, {payload_size}B payload, {threads} threads...", end=" ", flush=True)
+    use_histogram: bool = False,
+    verbose: bool = True
+) -> BenchmarkResult:
+    """Run a single benchmark, reporting failures as a failed result."""
     
-    # Start monitoring
-    if monitor:
-        monitor.start()
+    if verbose:
+        print(f"    {operation.upper()}: {num_operations:,} ops, {payload_size}B payload, {threads} threads...", end=" ", flush=True)
     
     start = time.time()
     
@@ -59,15 +67,18 @@ def run_single_benchmark(
             num_operations=num_operations,
             operation=operation,
             payload_size=payload_size,
-            num_threads=threads
+            num_threads=threads,
+            use_histogram=use_histogram
         )
         
         elapsed = time.time() - start
-        print(f"✓ {result.throughput:,.0f} ops/sec ({elapsed:.2f}s)")
+        if verbose:
+            print(f"✓ {result.throughput:,.0f} ops/sec ({elapsed:.2f}s)")
         
     except Exception as e:
         elapsed = time.time() - start
-        print(f"✗ Error: {e}")
+        if verbose:
+            print(f"✗ Error: {e}")
         result = BenchmarkResult(
             name=benchmark.name,
             operation=operation,
@@ -78,12 +89,64 @@ def run_single_benchmark(
             errors=[str(e)]
         )
     
-    # Stop monitoring
-    resource_stats = None
-    if monitor:
-        resource_stats = monitor.stop()
+    return result
+
+
+def _create_benchmark(method_name: str, pipeline_depth: int = 1) -> BaseBenchmark:
+    """Instantiate the benchmark for a method name."""
+    if method_name == 'latzero':
+        return LatzeroBenchmark()
+    if method_name == 'HTTP':
+        return HTTPBenchmark()
+    if method_name == 'Socket':
+        return SocketBenchmark(pipeline_depth=pipeline_depth)
+    raise ValueError(f"Unknown method: {method_name}")
+
+
+def _run_method(
+    method_name: str,
+    operations: List[str],
+    num_operations: int,
+    payload_size: int,
+    threads: int,
+    use_histogram: bool = False,
+    pipeline_depth: int = 1,
+    pin_core: Optional[int] = None,
+    monitor_core: Optional[int] = None,
+    verbose: bool = True
+) -> Tuple[List[BenchmarkResult], Optional[ResourceStats]]:
+    """
+    Run every operation for one method. Module-level so it can also run in
+    a worker process; the benchmark is created here because live clients,
+    sockets and locks cannot be pickled.
+    
+    Returns:
+        (results, resource stats over all operations or None)
+    """
+    benchmark = _create_benchmark(method_name, pipeline_depth)
+    benchmark.pin_core = pin_core
+    
+    method_results: List[BenchmarkResult] = []
     
-    return result, resource_stats
+    # One monitor spans all operations of the method
+    monitor = ResourceMonitor(interval=0.05, cpu=monitor_core)
+    monitor.start()
+    
+    try:
+        for operation in operations:
+            method_results.append(run_single_benchmark(
+                benchmark=benchmark,
+                num_operations=num_operations,
+                operation=operation,
+                payload_size=payload_size,
+                threads=threads,
+                use_histogram=use_histogram,
+                verbose=verbose
+            ))
+    finally:
+        stats = monitor.stop()
+    
+    return method_results, (stats if len(stats) else None)
 
 
 def run_evaluation(
@@ -95,6 +158,11 @@ def run_evaluation(
     output_path: str = "evaluation/REPORT.md",
     skip_http: bool = False,
     skip_socket: bool = False,
+    use_histogram: bool = False,
+    pipeline_depth: int = 1,
+    pin_core: Optional[int] = None,
+    parallel: bool = False,
+    max_detail_rows: Optional[int] = MAX_DETAIL_ROWS,
     verbose: bool = True
 ) -> str:
     """
@@ -107,8 +175,15 @@ def run_evaluation(
         methods: List of methods to test ('latzero', 'HTTP', 'Socket')
         operations: List of operations to test ('set', 'get', 'mixed')
         output_path: Path for the report
-        skip_http: Skip HTTP benchmark (requires Flask)
+        skip_http: Skip HTTP benchmark (requires aiohttp/requests)
         skip_socket: Skip Socket benchmark
+        use_histogram: Record latencies in an HdrHistogram (requires hdrhistogram)
+        pipeline_depth: Socket requests sent per round trip when single-threaded
+        pin_core: Pin single-threaded benchmarks to this CPU core (monitor
+            uses another); ignored when threads > 1
+        parallel: Run the methods concurrently, one worker process each
+        max_detail_rows: Per-result report rows before the rest are elided
+            (None for all, 0 for per-method summaries only)
         verbose: Print progress
     
     Returns:
@@ -130,9 +205,16 @@ def run_evaluation(
         'threads': threads,
         'methods': methods,
         'operations': operations,
+        'use_histogram': use_histogram,
+        'pipeline_depth': pipeline_depth,
+        'pin_core': pin_core,
+        'parallel': parallel,
         'timestamp': datetime.now().isoformat(),
     }
     
+    # Collected once and reused by the report
+    sys_info = get_system_info()
+    
     if verbose:
         print("=" * 60)
         print("latzero Evaluation Suite")
@@ -146,62 +228,68 @@ def run_evaluation(
         print(f"  - Operations: {', '.join(operations)}")
         print()
         print("System Info:")
-        sys_info = get_system_info()
         print(f"  - Platform: {sys_info.get('platform', 'Unknown')}")
         print(f"  - CPUs: {sys_info.get('cpu_count_logical', 'Unknown')}")
         print(f"  - RAM: {sys_info.get('ram_total_gb', 'Unknown')} GB")
         print()
     
     # Initialize benchmarks
-    benchmarks: Dict[str, BaseBenchmark] = {}
+    available: List[str] = []
     
     if 'latzero' in methods:
-        benchmarks['latzero'] = LatzeroBenchmark()
+        available.append('latzero')
     
     if 'HTTP' in methods:
-        try:
-            import flask
-            import requests
-            benchmarks['HTTP'] = HTTPBenchmark()
-        except ImportError:
-            if verbose:
-                print("⚠ Flask/requests not installed, skipping HTTP benchmark")
+        if HAS_HTTP:
+            available.append('HTTP')
+        elif verbose:
+            print("⚠ aiohttp/requests not installed, skipping HTTP benchmark")
     
     if 'Socket' in methods:
-        benchmarks['Socket'] = SocketBenchmark()
+        available.append('Socket')
+    
+    # Keep the sampler off the core the benchmark is pinned to
+    monitor_core = None
+    if pin_core is not None:
+        monitor_core = (pin_core + 1) % (os.cpu_count() or 1)
+    
+    method_args = (
+        operations, num_operations, payload_size, threads,
+        use_histogram, pipeline_depth, pin_core, monitor_core, verbose,
+    )
     
     # Run benchmarks
-    results: Dict[str, List[BenchmarkResult]] = {name: [] for name in benchmarks}
+    results: Dict[str, List[BenchmarkResult]] = {name: [] for name in available}
     resource_stats: Dict[str, ResourceStats] = {}
     
-    for method_name, benchmark in benchmarks.items():
+    if parallel and len(available) > 1:
+        # Every method uses its own port / pool name, so they can run side
+        # by side; each worker process monitors only its own resource usage
         if verbose:
             print(f"\n{'─' * 40}")
-            print(f"Benchmarking: {method_name}")
+            print(f"Benchmarking in parallel: {', '.join(available)}")
             print(f"{'─' * 40}")
         
-        method_resource_samples = []
-        
-        for operation in operations:
-            monitor = ResourceMonitor(interval=0.05)
-            
-            result, stats = run_single_benchmark(
-                benchmark=benchmark,
-                num_operations=num_operations,
-                operation=operation,
-                payload_size=payload_size,
-                threads=threads,
-                monitor=monitor
-            )
-            
-            results[method_name].append(result)
+        with ProcessPoolExecutor(max_workers=len(available)) as executor:
+            futures = {
+                executor.submit(_run_method, method_name, *method_args): method_name
+                for method_name in available
+            }
+            for future in as_completed(futures):
+                method_name = futures[future]
+                results[method_name], stats = future.result()
+                if stats is not None:
+                    resource_stats[method_name] = stats
+    else:
+        for method_name in available:
+            if verbose:
+                print(f"\n{'─' * 40}")
+                print(f"Benchmarking: {method_name}")
+                print(f"{'─' * 40}")
             
-            if stats and stats.samples:
-                method_resource_samples.extend(stats.samples)
-        
-        # Aggregate resource stats for this method
-        if method_resource_samples:
-            resource_stats[method_name] = ResourceStats(samples=method_resource_samples)
+            results[method_name], stats = _run_method(method_name, *method_args)
+            if stats is not None:
+                resource_stats[method_name] = stats
     
     # Generate report
     if verbose:
@@ -214,7 +302,9 @@ def run_evaluation(
         results=results,
         resource_stats=resource_stats,
         output_path=output_path,
-        config=config
+        config=config,
+        sys_info=sys_info,
+        max_detail_rows=max_detail_rows
     )
     
     if verbose:
@@ -313,6 +403,46 @@ Examples:
         action='store_true',
         help='Skip Socket benchmark'
     )
+    parser.add_argument(
+        '--histogram',
+        action='store_true',
+        help='Record latencies in an HdrHistogram instead of keeping every sample'
+    )
+    parser.add_argument(
+        '--pipeline',
+        type=int,
+        default=1,
+        metavar='DEPTH',
+        help='Socket requests per round trip in single-threaded runs (default: 1)'
+    )
+    parser.add_argument(
+        '--pin-core',
+        type=int,
+        default=None,
+        metavar='CORE',
+        help='Pin single-threaded benchmarks to one CPU core and raise their priority'
+    )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run the benchmark methods concurrently in separate processes'
+    )
+    detail = parser.add_mutually_exclusive_group()
+    detail.add_argument(
+        '--detailed',
+        dest='max_detail_rows',
+        action='store_const',
+        const=None,
+        default=MAX_DETAIL_ROWS,
+        help=f'Write every result in the report (default: first {MAX_DETAIL_ROWS})'
+    )
+    detail.add_argument(
+        '--no-detailed',
+        dest='max_detail_rows',
+        action='store_const',
+        const=0,
+        help='Write only per-method summaries in the report'
+    )
     parser.add_argument(
         '-q', '--quiet',
         action='store_true',
@@ -344,6 +474,11 @@ Examples:
             output_path=args.output,
             skip_http=args.skip_http or args.latzero_only,
             skip_socket=args.skip_socket or args.latzero_only,
+            use_histogram=args.histogram,
+            pipeline_depth=args.pipeline,
+            pin_core=args.pin_core,
+            parallel=args.parallel,
+            max_detail_rows=args.max_detail_rows,
             verbose=not args.quiet
         )
     except KeyboardInterrupt:
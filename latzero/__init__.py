@@ -19,7 +19,7 @@ __author__ = 'BRAHMAI'
 
 # Core API
 from .core.pool import SharedMemoryPool, PoolClient, NamespacedClient
-from .core.memory import configure_serializer, get_serializer
+from .core.memory import LazyValue, configure_serializer, get_serializer
 from .core.cleanup import start_cleanup_daemon, stop_cleanup_daemon, cleanup_orphaned_memory
 from .server_client import LatZero, ServerNamespacedClient
 
@@ -61,6 +61,7 @@ __all__ = [
     'PoolClient',
     'NamespacedClient',
     'ServerNamespacedClient',
+    'LazyValue',
     'configure_serializer',
     'get_serializer',
     
@@ -6,7 +6,7 @@ Uses asyncio.to_thread() for non-blocking operations.
 """
 
 import asyncio
-from typing import Optional, Any, Dict, List, Tuple, Callable
+from typing import Optional, Any, Dict, List, Tuple, Callable, Union
 from functools import wraps
 
 from ..core.pool import SharedMemoryPool, PoolClient, NamespacedClient
@@ -56,9 +56,10 @@ class AsyncPoolClient:
 
     # =========== Core Operations ===========
 
-    async def set(self, key: str, value: Any, auto_clean: Optional[int] = None) -> None:
+    async def set(self, key: str, value: Any, auto_clean: Optional[int] = None,
+                  dtype: Optional[str] = None) -> None:
         """Set a value (non-blocking)."""
-        await asyncio.to_thread(self._client.set, key, value, auto_clean)
+        await asyncio.to_thread(self._client.set, key, value, auto_clean, dtype)
 
     async def get(self, key: str, default: Any = None) -> Any:
         """Get a value (non-blocking)."""
@@ -68,6 +69,14 @@ class AsyncPoolClient:
         """Delete a key (non-blocking)."""
         return await asyncio.to_thread(self._client.delete, key)
 
+    async def replace(self, old_key: str, key: str, value: Any) -> bool:
+        """Set key and delete old_key in a single write (non-blocking)."""
+        return await asyncio.to_thread(self._client.replace, old_key, key, value)
+
+    async def pop(self, key: str, default: Any = None) -> Any:
+        """Delete a key and return its value (non-blocking)."""
+        return await asyncio.to_thread(self._client.pop, key, default)
+
     async def exists(self, key: str) -> bool:
         """Check if key exists (non-blocking)."""
         return await asyncio.to_thread(self._client.exists, key)
@@ -100,9 +109,9 @@ class AsyncPoolClient:
         """Set multiple keys at once."""
         await asyncio.to_thread(self._client.mset, data, auto_clean)
 
-    async def mget(self, keys: List[str]) -> Dict[str, Any]:
+    async def mget(self, keys: List[str], lazy: bool = False) -> Dict[str, Any]:
         """Get multiple keys at once."""
-        return await asyncio.to_thread(self._client.mget, keys)
+        return await asyncio.to_thread(self._client.mget, keys, lazy)
 
     async def delete_many(self, keys: List[str]) -> int:
         """Delete multiple keys."""
@@ -122,7 +131,7 @@ class AsyncPoolClient:
         """Get all (key, value) pairs."""
         return await asyncio.to_thread(self._client.items, pattern)
 
-    async def scan(self, cursor: int = 0, count: int = 100) -> Tuple[int, List[str]]:
+    async def scan(self, cursor: Union[int, str] = 0, count: int = 100) -> Tuple[Union[int, str], List[str]]:
         """Paginated key scanning."""
         return await asyncio.to_thread(self._client.scan, cursor, count)
 
@@ -163,6 +172,12 @@ class AsyncNamespacedClient:
     async def delete(self, key: str) -> bool:
         return await asyncio.to_thread(self._ns_client.delete, key)
 
+    async def replace(self, old_key: str, key: str, value: Any) -> bool:
+        return await asyncio.to_thread(self._ns_client.replace, old_key, key, value)
+
+    async def pop(self, key: str, default: Any = None) -> Any:
+        return await asyncio.to_thread(self._ns_client.pop, key, default)
+
     async def exists(self, key: str) -> bool:
         return await asyncio.to_thread(self._ns_client.exists, key)
 
@@ -178,8 +193,8 @@ class AsyncNamespacedClient:
     async def mset(self, data: dict, auto_clean: Optional[int] = None) -> None:
         await asyncio.to_thread(self._ns_client.mset, data, auto_clean)
 
-    async def mget(self, keys: List[str]) -> Dict[str, Any]:
-        return await asyncio.to_thread(self._ns_client.mget, keys)
+    async def mget(self, keys: List[str], lazy: bool = False) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._ns_client.mget, keys, lazy)
 
 
 class AsyncSharedMemoryPool:
@@ -3,7 +3,7 @@ latzero.core - Core components for shared memory pool management.
 """
 
 from .pool import SharedMemoryPool, PoolClient, NamespacedClient
-from .memory import SharedMemoryPoolData, configure_serializer, get_serializer
+from .memory import SharedMemoryPoolData, LazyValue, configure_serializer, get_serializer
 from .registry import PoolRegistry
 from .locking import FileLock, StripedLock, ReadWriteLock, get_registry_lock
 from .cleanup import (
@@ -24,6 +24,7 @@ __all__ = [
     
     # Memory
     'SharedMemoryPoolData',
+    'LazyValue',
     'configure_serializer',
     'get_serializer',
     
@@ -11,6 +11,7 @@ Monitors pools for:
 import threading
 import time
 import os
+import re
 import sys
 from typing import Optional, Set, Callable, List
 
@@ -20,6 +21,9 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+# Extra segments of a pool's data: heap "<data>_h<i>", directory "<data>_d<gen>_<pid>"
+_POOL_SEGMENT = re.compile(r'(.+)_(?:h\d+|d\d+_\d+)')
+
 
 class CleanupDaemon:
     """
@@ -244,6 +248,11 @@ def cleanup_orphaned_memory() -> List[str]:
         if os.path.exists(shm_dir):
             for name in os.listdir(shm_dir):
                 if name.startswith('l0p_') or name.startswith('latzero'):
+                    # Heap ("_h<i>") and directory ("_d<gen>_<pid>") segments
+                    # belong to the pool whose data segment they extend
+                    extension = _POOL_SEGMENT.fullmatch(name)
+                    if extension and extension.group(1) in known_segments:
+                        continue
                     if name not in known_segments:
                         try:
                             orphan = shm.SharedMemory(name=name)
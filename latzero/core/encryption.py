@@ -23,12 +23,13 @@ def encrypt_data(data, auth_key):
         raise EncryptionError(f"Encryption failed: {e}")
 
 def decrypt_data(encrypted_data, auth_key):
-    """Decrypt data using AES-GCM."""
+    """Decrypt data using AES-GCM. encrypted_data may be any bytes-like object."""
     try:
         key = derive_key(auth_key)
         if len(encrypted_data) < 28:
             raise ValueError("Encrypted data too short")
-        iv, tag, ciphertext = encrypted_data[:12], encrypted_data[12:28], encrypted_data[28:]
+        iv, tag = bytes(encrypted_data[:12]), bytes(encrypted_data[12:28])
+        ciphertext = encrypted_data[28:]
         cipher = Cipher(algorithms.AES(key), modes.GCM(iv, tag), backend=default_backend())
         decryptor = cipher.decryptor()
         return decryptor.update(ciphertext) + decryptor.finalize()
@@ -433,6 +433,8 @@ class EventKeys:
     """Key prefix constants for event system storage."""
     
     REGISTRY = "__events__:registry"
+    # Calls are stored as CALL_PREFIX + event + ":" + call_id, so a
+    # listener finds its event's pending calls with one prefix query
     CALL_PREFIX = "__events__:call:"
     RESULT_PREFIX = "__events__:result:"
     HEARTBEAT_PREFIX = "__events__:heartbeat:"
@@ -593,29 +595,61 @@ class EventManager:
         ).to_dict()
         
         # Store call data
-        self._client.set(f"{EventKeys.CALL_PREFIX}{call_id}", payload)
+        self._client.set(f"{EventKeys.CALL_PREFIX}{event}:{call_id}", payload)
         
-        # Signal handlers based on mode
+        self._signal_handlers(event, handlers, mode)
+    
+    def emit_many(self, event: str, payloads: List[dict]) -> None:
+        """
+        Fire-and-forget emission of several events at once.
+        
+        All calls are stored in one batched write and each targeted handler
+        is signaled once; a woken listener processes every pending call for
+        the event, so one wake-up covers the whole batch.
+        
+        Args:
+            event: Event name
+            payloads: One dict of event data per emission
+        """
+        if not payloads:
+            return
+        
+        registry = self._client.get(EventKeys.REGISTRY, {})
+        event_info = registry.get(event)
+        
+        if not event_info or not event_info.get("handlers"):
+            return  # No handlers registered
+        
+        handlers = event_info["handlers"]
+        mode = EventMode(event_info.get("mode", "first"))
+        
+        now = time.time()
+        calls = {
+            f"{EventKeys.CALL_PREFIX}{event}:{uuid.uuid4()}": CallPayload(
+                event=event,
+                args=data,
+                caller_pid=self._pid,
+                caller_signal="",  # No response needed
+                created_at=now,
+            ).to_dict()
+            for data in payloads
+        }
+        self._client.mset(calls)
+        
+        self._signal_handlers(event, handlers, mode)
+    
+    def _signal_handlers(self, event: str, handlers: List[dict], mode: EventMode) -> None:
+        """Wake the handler(s) an emission goes to, based on mode."""
         if mode == EventMode.BROADCAST:
-            for handler in handlers:
-                try:
-                    sig = Signal(handler["signal"], create=False)
-                    sig.signal()
-                    sig.close()
-                except:
-                    pass
+            targets = handlers
         elif mode == EventMode.ROUND_ROBIN:
             idx = self._round_robin_index.get(event, 0)
-            handler = handlers[idx % len(handlers)]
+            targets = [handlers[idx % len(handlers)]]
             self._round_robin_index[event] = idx + 1
-            try:
-                sig = Signal(handler["signal"], create=False)
-                sig.signal()
-                sig.close()
-            except:
-                pass
         else:  # FIRST
-            handler = handlers[0]
+            targets = [handlers[0]]
+        
+        for handler in targets:
             try:
                 sig = Signal(handler["signal"], create=False)
                 sig.signal()
@@ -674,7 +708,7 @@ class EventManager:
         
         try:
             # Store call data
-            self._client.set(f"{EventKeys.CALL_PREFIX}{call_id}", payload)
+            self._client.set(f"{EventKeys.CALL_PREFIX}{event}:{call_id}", payload)
             
             # Signal handler(s)
             if mode == EventMode.BROADCAST:
@@ -690,11 +724,9 @@ class EventManager:
                 
                 # Wait for all results (simplified - just wait once for now)
                 if result_signal.wait(timeout_ms=int(_timeout * 1000)):
-                    result_key = f"{EventKeys.RESULT_PREFIX}{call_id}"
-                    result_data = self._client.get(result_key)
+                    result_data = self._client.pop(f"{EventKeys.RESULT_PREFIX}{call_id}")
                     if result_data:
                         result = ResultPayload.from_dict(result_data)
-                        self._client.delete(result_key)
                         
                         if result.error:
                             raise EventError.from_dict(result.error)
@@ -724,11 +756,9 @@ class EventManager:
                     
                     # Wait for result
                     if result_signal.wait(timeout_ms=int(_timeout * 1000)):
-                        result_key = f"{EventKeys.RESULT_PREFIX}{call_id}"
-                        result_data = self._client.get(result_key)
+                        result_data = self._client.pop(f"{EventKeys.RESULT_PREFIX}{call_id}")
                         if result_data:
                             result = ResultPayload.from_dict(result_data)
-                            self._client.delete(result_key)
                             
                             if result.error:
                                 err = EventError.from_dict(result.error)
@@ -758,7 +788,7 @@ class EventManager:
         finally:
             # Cleanup
             result_signal.close()
-            self._client.delete(f"{EventKeys.CALL_PREFIX}{call_id}")
+            self._client.delete(f"{EventKeys.CALL_PREFIX}{event}:{call_id}")
     
     def listen(self) -> None:
         """Start listening for events in background thread."""
@@ -870,13 +900,14 @@ class EventManager:
         if not handler:
             return
         
-        # Find pending calls for this event
-        all_keys = self._client.keys()
-        call_keys = [k for k in all_keys if k.startswith(EventKeys.CALL_PREFIX.replace(self._client._data_key_prefix, ""))]
+        # Find pending calls for this event and read them in one pass
+        prefix = f"{EventKeys.CALL_PREFIX}{event}:"
+        call_keys = self._client.keys(prefix)
+        if not call_keys:
+            return
         
-        for call_key in call_keys:
-            full_key = call_key
-            call_data = self._client.get(full_key)
+        for full_key, call_data in self._client.mget(call_keys).items():
+            # Another event's name may extend this one's prefix
             if not call_data or call_data.get("event") != event:
                 continue
             
@@ -906,10 +937,10 @@ class EventManager:
                     completed_at=time.time(),
                 )
             
-            # If caller wants response, send it
+            # If caller wants response, write it in place of the call data
             if payload.caller_signal:
-                call_id = full_key.replace(EventKeys.CALL_PREFIX.replace(self._client._data_key_prefix, ""), "")
-                self._client.set(f"{EventKeys.RESULT_PREFIX}{call_id}", result.to_dict())
+                call_id = full_key[len(prefix):]
+                self._client.replace(full_key, f"{EventKeys.RESULT_PREFIX}{call_id}", result.to_dict())
                 
                 # Signal caller
                 try:
@@ -918,9 +949,9 @@ class EventManager:
                     sig.close()
                 except:
                     pass
-            
-            # Cleanup call data
-            self._client.delete(full_key)
+            else:
+                # Cleanup call data
+                self._client.delete(full_key)
     
     def _start_heartbeat(self) -> None:
         """Start heartbeat thread."""
@@ -1039,6 +1070,10 @@ class EventEmitter:
         """Fire-and-forget event emission."""
         self._get_manager().emit(self._namespaced(event), **data)
     
+    def emit_many(self, event: str, payloads: List[dict]) -> None:
+        """Fire-and-forget emission of several events in one batch."""
+        self._get_manager().emit_many(self._namespaced(event), payloads)
+    
     def call(
         self,
         event: str,
@@ -4,17 +4,20 @@ latzero.core.memory - Dynamic shared memory data storage.
 Manages data storage in shared memory segments with:
 - Dynamic expansion when data grows
 - Optimized serialization (msgpack default, pickle fallback)
-- Lazy refresh for better performance
+- Per-key slots, so reads and writes touch a single entry
 """
 
 import multiprocessing.shared_memory as shm
+import os
 import struct
+import tempfile
 import time
 import threading
+from bisect import bisect_left, bisect_right
+from functools import partial
+from hashlib import blake2b
 from typing import Optional, Any, Dict, List
 
-from .locking import StripedLock, ReadWriteLock
-
 
 # Try msgpack for speed, fallback to pickle
 try:
@@ -23,9 +26,265 @@ try:
 except ImportError:
     HAS_MSGPACK = False
 
+# msgspec decodes msgpack ~1.5x faster than msgpack itself
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+# zstd compresses faster and smaller than zlib; zlib stays as the fallback
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# lz4 block compression is several times faster than zstd/zlib on small payloads
+try:
+    import lz4.block
+    HAS_LZ4 = True
+except ImportError:
+    HAS_LZ4 = False
+
+# numpy arrays get a compact msgpack extension instead of going through pickle
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# numba compiles the rebuild loop of large directories to native code. It
+# is only looked up here: importing it takes ~0.2s, so that waits for the
+# first rebuild that uses it (see _reinsert_kernel)
+try:
+    from importlib.util import find_spec
+    HAS_NUMBA = HAS_NUMPY and find_spec('numba') is not None
+except (ImportError, ValueError):
+    HAS_NUMBA = False
+
+# flock() serializes writers across processes (see _open_lock); not on Windows
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 import pickle
 import zlib
 
+# Compression codecs, stored in bits 5-6 of the serializer header byte
+CODEC_NONE = 0x00
+CODEC_ZLIB = 0x20
+CODEC_LZ4 = 0x40
+CODEC_ZSTD = 0x60
+# Level 1: ~20% faster than the default 3 on large values, about the same ratio
+ZSTD_LEVEL = 1
+# Payloads below this size use lz4 when installed, larger ones zstd/zlib
+LZ4_MAX_SIZE = 64 * 1024
+
+# Compression bypass heuristics. 256 strided sample bytes of random data
+# (ciphertext, float noise) hold ~150-165 distinct values; anything that
+# compresses well holds far fewer
+ENTROPY_SAMPLE = 256
+MAX_DISTINCT_BYTES = 140
+# Below this running compression ratio only every PROBE_INTERVAL-th
+# eligible payload is still tried, so the estimate can recover
+MIN_COMPRESS_RATIO = 1.05
+PROBE_INTERVAL = 16
+
+# zstandard (de)compressors must not be shared between threads
+_zstd_local = threading.local()
+
+
+# msgpack ExtType code for numeric numpy arrays. Ext data:
+# [u8 len][dtype str][u8 ndim][u64 x ndim shape][raw C-order bytes]
+EXT_NDARRAY = 2
+_NDARRAY_KINDS = 'biufc'
+
+# msgpack ext 8/16/32 framing: type byte, big-endian length, ext code
+_EXT8 = struct.Struct('>BBb')
+_EXT16 = struct.Struct('>BHb')
+_EXT32 = struct.Struct('>BIb')
+
+
+def _ndarray_parts(arr: 'np.ndarray') -> tuple:
+    """(head, body) of the ext payload; body is the array's own buffer when contiguous."""
+    dtype = arr.dtype.str.encode('ascii')
+    head = struct.pack(f'<B{len(dtype)}sB{arr.ndim}Q', len(dtype), dtype, arr.ndim, *arr.shape)
+    return head, (arr.data if arr.flags.c_contiguous else arr.tobytes())
+
+
+def _pack_ndarray(arr: 'np.ndarray') -> bytes:
+    """Ext payload for a numeric array."""
+    head, body = _ndarray_parts(arr)
+    return head + body
+
+
+def _ndarray_msgpack(arr: 'np.ndarray') -> bytes:
+    """
+    A complete msgpack ext object for a top-level array, framed here so the
+    array bytes are copied once instead of again inside msgpack.packb.
+    """
+    head, body = _ndarray_parts(arr)
+    n = len(head) + body.nbytes if isinstance(body, memoryview) else len(head) + len(body)
+    if n < 0x100:
+        prefix = _EXT8.pack(0xc7, n, EXT_NDARRAY)
+    elif n < 0x10000:
+        prefix = _EXT16.pack(0xc8, n, EXT_NDARRAY)
+    else:
+        prefix = _EXT32.pack(0xc9, n, EXT_NDARRAY)
+    return b''.join((prefix, head, body))
+
+
+def _unpack_ndarray(data) -> 'np.ndarray':
+    """Rebuild an array from _pack_ndarray() output (bytes or memoryview)."""
+    n = data[0]
+    dtype = bytes(data[1:1 + n]).decode('ascii')
+    ndim = data[1 + n]
+    shape = struct.unpack_from(f'<{ndim}Q', data, 2 + n)
+    start = 2 + n + 8 * ndim
+    # The one copy out of the (possibly shared) buffer; yields a writable
+    # array that does not alias pool memory
+    return np.frombuffer(data, dtype=dtype, offset=start).reshape(shape).copy()
+
+
+# msgpack ExtType code for float arrays stored as bfloat16 (set(..., dtype='bf16')).
+# Ext data: [u8 ndim][u64 x ndim shape][u16 bf16 words, little-endian];
+# decodes to float32
+EXT_BF16 = 3
+
+
+def bf16_ext(arr: 'np.ndarray') -> Any:
+    """
+    Pack a float array as bfloat16, halving the bytes of a float32 array
+    (a quarter of float64).
+    
+    bfloat16 is the top 16 bits of a float32: same sign and exponent,
+    7 mantissa bits. Values are truncated toward zero.
+    """
+    if not (HAS_NUMPY and isinstance(arr, np.ndarray) and arr.dtype.kind == 'f'):
+        raise ValueError("bf16 storage needs a numpy float array")
+    words = np.ascontiguousarray(arr, dtype='<f4').view('<u4') >> 16
+    head = struct.pack(f'<B{arr.ndim}Q', arr.ndim, *arr.shape)
+    return msgpack.ExtType(EXT_BF16, head + words.astype('<u2').tobytes())
+
+
+def _unpack_bf16(data) -> 'np.ndarray':
+    """Rebuild a float32 array from bf16_ext() data (bytes or memoryview)."""
+    ndim = data[0]
+    shape = struct.unpack_from(f'<{ndim}Q', data, 1)
+    words = np.frombuffer(data, dtype='<u2', offset=1 + 8 * ndim)
+    return (words.astype('<u4') << 16).view('<f4').reshape(shape)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """msgpack hook for types it cannot encode natively."""
+    if HAS_NUMPY and isinstance(obj, np.ndarray) and obj.dtype.kind in _NDARRAY_KINDS:
+        return msgpack.ExtType(EXT_NDARRAY, _pack_ndarray(obj))
+    # Anything else falls back to pickle
+    raise TypeError(f"Cannot msgpack {type(obj).__name__}")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_NDARRAY and HAS_NUMPY:
+        return _unpack_ndarray(data)
+    if code == EXT_BF16 and HAS_NUMPY:
+        return _unpack_bf16(data)
+    return msgpack.ExtType(code, data)
+
+
+def _msgspec_ext_hook(code: int, data: memoryview) -> Any:
+    if code == EXT_NDARRAY and HAS_NUMPY:
+        return _unpack_ndarray(data)
+    if code == EXT_BF16 and HAS_NUMPY:
+        return _unpack_bf16(data)
+    return msgspec.msgpack.Ext(code, bytes(data))
+
+
+# Pickle with out-of-band buffers (protocol 5). Data:
+# [u32 pickle_len][u32 nbuf][pickle stream][(u64 len, raw bytes) x nbuf]
+_OOB_HEAD = struct.Struct('<II')
+_OOB_LEN = struct.Struct('<Q')
+
+
+def _pickle_frames(obj: Any) -> Any:
+    """
+    Pickle obj, keeping large buffers (numpy arrays, pandas blocks...) out
+    of the pickle stream.
+    
+    Returns:
+        The pickle bytes when nothing went out of band, otherwise the list
+        of frames making up the out-of-band format
+    """
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return data
+    frames = [_OOB_HEAD.pack(len(data), len(buffers)), data]
+    for buffer in buffers:
+        raw = buffer.raw()
+        frames.append(_OOB_LEN.pack(raw.nbytes))
+        frames.append(raw)
+    return frames
+
+
+def _unpickle_frames(payload) -> Any:
+    """Load _pickle_frames() output (bytes or memoryview)."""
+    view = memoryview(payload)
+    pickle_len, nbuf = _OOB_HEAD.unpack_from(view, 0)
+    pos = _OOB_HEAD.size + pickle_len
+    buffers = []
+    for _ in range(nbuf):
+        n = _OOB_LEN.unpack_from(view, pos)[0]
+        pos += _OOB_LEN.size
+        # Own writable copies: the loaded objects keep these buffers, so
+        # they must not alias pool memory
+        buffers.append(bytearray(view[pos:pos + n]))
+        pos += n
+    return pickle.loads(view[_OOB_HEAD.size:_OOB_HEAD.size + pickle_len], buffers=buffers)
+
+
+def _compress(data: bytes) -> tuple:
+    """
+    Compress with lz4 for small data, zstd for large, zlib as the fallback.
+    
+    Returns:
+        (codec, compressed bytes)
+    """
+    if HAS_LZ4 and len(data) < LZ4_MAX_SIZE:
+        return CODEC_LZ4, lz4.block.compress(data)
+    if HAS_ZSTD:
+        compressor = getattr(_zstd_local, 'compressor', None)
+        if compressor is None:
+            compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        return CODEC_ZSTD, compressor.compress(data)
+    return CODEC_ZLIB, zlib.compress(data, level=1)  # Level 1 = fast
+
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    """Decompress output of _compress()."""
+    if codec == CODEC_LZ4:
+        return lz4.block.decompress(data)
+    if codec == CODEC_ZSTD:
+        decompressor = getattr(_zstd_local, 'decompressor', None)
+        if decompressor is None:
+            decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
+    return zlib.decompress(data)
+
+
+def _decompressed(codec: int, load, data) -> Any:
+    """load() the decompressed payload (a Serializer decoder table entry)."""
+    return load(_decompress(codec, data))
+
+
+# Serializer format bytes as ints, compared on every deserialize
+_MSGPACK = 0x01
+_PICKLE = 0x02
+_PICKLE_OOB = 0x04
+_CODEC_MASK = 0x60
+
 
 class Serializer:
     """
@@ -33,14 +292,24 @@ class Serializer:
     
     msgpack is ~3-5x faster than pickle for common types.
     Falls back to pickle for complex Python objects.
+    
+    Encoding stays on msgpack, whose TypeError on sets, datetimes etc.
+    routes them to pickle so they round-trip with their types; msgspec
+    would encode them natively as lists/strings. Decoding uses msgspec
+    when installed. Numeric numpy arrays (also nested in containers) are
+    stored as raw bytes in a msgpack extension type.
     """
     
-    __slots__ = ('_use_msgpack', '_compress_threshold')
+    __slots__ = (
+        '_use_msgpack', '_compress_threshold', '_decode_msgpack', '_local',
+        '_ratio', '_skipped', '_decoders'
+    )
     
     # Header byte to indicate serialization format
-    MSGPACK_HEADER = b'\x01'
-    PICKLE_HEADER = b'\x02'
-    COMPRESSED_FLAG = 0x80  # High bit set = compressed
+    MSGPACK_HEADER = bytes([_MSGPACK])
+    PICKLE_HEADER = bytes([_PICKLE])
+    PICKLE_OOB_HEADER = bytes([_PICKLE_OOB])  # Pickle with out-of-band buffers
+    CODEC_MASK = _CODEC_MASK  # Bits 5-6 = compression codec (CODEC_*), 0 = none
     
     def __init__(self, prefer_msgpack: bool = True, compress_threshold: int = 10240):
         """
@@ -50,6 +319,34 @@ class Serializer:
         """
         self._use_msgpack = prefer_msgpack and HAS_MSGPACK
         self._compress_threshold = compress_threshold
+        # Reused msgpack Packer per thread: a Packer keeps its internal
+        # buffer between calls and must not be shared across threads
+        self._local = threading.local()
+        # Running (exponentially weighted) compression ratio
+        self._ratio = 2.0
+        self._skipped = 0
+        if HAS_MSGSPEC:
+            self._decode_msgpack = msgspec.msgpack.Decoder(ext_hook=_msgspec_ext_hook).decode
+        else:
+            self._decode_msgpack = lambda payload: msgpack.unpackb(
+                payload, raw=False, ext_hook=_msgpack_ext_hook
+            )
+        self._decoders = self._decoder_table()
+    
+    def _decoder_table(self) -> tuple:
+        """
+        Decoder for every header byte (format | codec), indexed by the byte.
+        
+        Compressed formats get their decompression folded in; unknown
+        formats fall back to pickle.
+        """
+        formats = {_MSGPACK: self._decode_msgpack, _PICKLE_OOB: _unpickle_frames}
+        table = []
+        for header in range(256):
+            codec = header & _CODEC_MASK
+            load = formats.get(header ^ codec, pickle.loads)
+            table.append(partial(_decompressed, codec, load) if codec else load)
+        return tuple(table)
     
     def serialize(self, obj: Any) -> bytes:
         """Serialize object to bytes."""
@@ -58,42 +355,177 @@ class Serializer:
         
         if self._use_msgpack:
             try:
-                data = msgpack.packb(obj, use_bin_type=True)
-                header = self.MSGPACK_HEADER[0]
+                if HAS_NUMPY and type(obj) is np.ndarray and obj.dtype.kind in _NDARRAY_KINDS:
+                    data = _ndarray_msgpack(obj)
+                else:
+                    packer = getattr(self._local, 'packer', None)
+                    if packer is None:
+                        packer = self._local.packer = msgpack.Packer(
+                            use_bin_type=True, default=_msgpack_default
+                        )
+                    data = packer.pack(obj)
+                header = _MSGPACK
             except (TypeError, ValueError):
                 # msgpack can't handle this type, fall back to pickle
-                data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
-                header = self.PICKLE_HEADER[0]
+                data = _pickle_frames(obj)
+                header = _PICKLE
         else:
-            data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
-            header = self.PICKLE_HEADER[0]
+            data = _pickle_frames(obj)
+            header = _PICKLE
         
-        # Compress if beneficial (only for large data)
-        if self._compress_threshold >= 0 and len(data) > self._compress_threshold:
-            compressed = zlib.compress(data, level=1)  # Level 1 = fast
+        if type(data) is list:
+            # Out-of-band frames; judge compressibility by the largest buffer
+            header = _PICKLE_OOB
+            size = sum(map(len, data))
+            sample = max(data[3::2], key=len)
+        else:
+            size = len(data)
+            sample = data
+        
+        # Compress if beneficial (only for large, plausibly compressible data)
+        if (self._compress_threshold >= 0 and size > self._compress_threshold
+                and self._worth_compressing(sample)):
+            if type(data) is list:
+                data = b''.join(data)
+            codec, compressed = _compress(data)
+            self._ratio = self._ratio * 0.75 + len(data) / max(len(compressed), 1) * 0.25
             if len(compressed) < len(data) * 0.9:  # Only if 10%+ savings
                 data = compressed
-                header |= self.COMPRESSED_FLAG
+                header |= codec
         
+        if type(data) is list:
+            # Each buffer is copied exactly once, straight into the result
+            return b''.join([bytes([header]), *data])
         return bytes([header]) + data
     
+    def _worth_compressing(self, data: bytes) -> bool:
+        """Cheap guess whether compressing data can pay off."""
+        if self._ratio < MIN_COMPRESS_RATIO:
+            self._skipped += 1
+            if self._skipped % PROBE_INTERVAL:
+                return False
+        step = len(data) // ENTROPY_SAMPLE or 1
+        return len(set(data[::step][:ENTROPY_SAMPLE])) < MAX_DISTINCT_BYTES
+    
     def deserialize(self, data: bytes) -> Any:
-        """Deserialize bytes to object."""
+        """Deserialize bytes (or any bytes-like view, e.g. of shared memory) to object."""
         if not data:
             return None
-        
-        header = data[0]
-        payload = data[1:]
-        
-        # Check compression
-        if header & self.COMPRESSED_FLAG:
-            payload = zlib.decompress(payload)
-            header &= ~self.COMPRESSED_FLAG
-        
-        if header == self.MSGPACK_HEADER[0]:
-            return msgpack.unpackb(payload, raw=False)
-        else:
-            return pickle.loads(payload)
+        return self._decoders[data[0]](data[1:])
+
+# Pool data layout (see SharedMemoryPoolData):
+# header: heap_top u64 | version u64 | garbage u64 | slot_count u32 | live u32 |
+#         deleted u32 | segments u32 | dir_gen u32 | dir_owner u32 | next_expiry f64
+# slot:   key_hash u64 | offset u32 | value_len u32 | timestamp f64 | auto_clean f32 |
+#         key_len u16 | state u16
+_HEADER = struct.Struct('<QQQIIIIII')
+_SLOT = struct.Struct('<QIIdfHH')
+_SLOT_STATE = struct.Struct('<H')
+# Header fields are stored in groups: pack_into() zero-fills its whole span
+# before packing, so a store covering the version or the directory fields
+# would briefly show readers a version or generation of 0. Only
+# _write_begin()/_write_end() store the version, and only _swap_dir() the
+# directory fields; _write_header() stores the rest
+_HEAP_TOP = struct.Struct('<Q')
+_VERSION = struct.Struct('<Q')
+_VERSION_OFFSET = 8
+# garbage u64 | slot_count u32 | live u32 | deleted u32 | segments u32
+_COUNTS = struct.Struct('<QIIII')
+_COUNTS_OFFSET = 16
+# dir_gen u32 | dir_owner u32
+_DIR = struct.Struct('<II')
+_DIR_OFFSET = 40
+# The version doubles as a seqlock: odd while a mutation is in progress.
+# Readers retry a read that saw an odd or moving version. Once it has
+# stayed odd for SEQLOCK_STALL seconds they check whether its writer died
+# mid-mutation (see _recover_version); without flock() there is no writer
+# to check, and a version odd for SEQLOCK_TIMEOUT seconds counts as dead
+SEQLOCK_STALL = 0.01
+SEQLOCK_TIMEOUT = 1.0
+# Earliest auto_clean deadline (0 = none), lowered by TTL writes and
+# recomputed by cleanup_expired() so idle passes need no directory scan
+_EXPIRY = struct.Struct('<d')
+_EXPIRY_OFFSET = _HEADER.size
+
+# Value cache entry for a key known to be missing at the cache version;
+# the zero timestamp never matches a live slot's
+_ABSENT = (None, 0.0, 0)
+# Most misses remembered per cache version: a live key is cached at most
+# once, but lookups of ever-new missing keys would grow the cache without end
+MAX_CACHED_MISSES = 4096
+
+# First byte of an encrypted value record; the raw AES-GCM output of the
+# serialized value follows. Serializer headers are 0x01/0x02/0x04 (| codec bits),
+# so the two never collide
+_ENCRYPTED = 0x03
+
+# Slot states
+_SLOT_EMPTY = 0
+_SLOT_LIVE = 1
+_SLOT_DELETED = 2
+
+# The slot layout as a numpy record, for scanning the whole directory at once
+if HAS_NUMPY:
+    _SLOT_DTYPE = np.dtype([
+        ('key_hash', '<u8'), ('offset', '<u4'), ('value_len', '<u4'), ('timestamp', '<f8'),
+        ('auto_clean', '<f4'), ('key_len', '<u2'), ('state', '<u2'),
+    ])
+
+# Directories of at least this many slots are rebuilt with numba; below
+# it the Python loop takes under ~60ms, less than importing numba
+NUMBA_MIN_SLOTS = 1 << 17
+
+
+def _reinsert_slots(old, new, mask):
+    """
+    Linear-probe every live slot of one directory into an empty one.
+    
+    Both are int64 arrays, 4 words per slot; the last word holds
+    auto_clean | key_len << 32 | state << 48. Compiled by _reinsert_kernel().
+    
+    Returns:
+        Number of slots moved
+    """
+    moved = 0
+    for s in range(old.shape[0] // 4):
+        if (old[s * 4 + 3] >> 48) & 0xFFFF != _SLOT_LIVE:
+            continue
+        i = old[s * 4] & mask
+        while (new[i * 4 + 3] >> 48) & 0xFFFF != _SLOT_EMPTY:
+            i = (i + 1) & mask
+        new[i * 4:i * 4 + 4] = old[s * 4:s * 4 + 4]
+        moved += 1
+    return moved
+
+
+_reinsert_compiled = None
+
+
+def _reinsert_kernel():
+    """_reinsert_slots compiled with numba (on first use), or None."""
+    global _reinsert_compiled, HAS_NUMBA
+    if _reinsert_compiled is None:
+        try:
+            from numba import njit
+        except ImportError:
+            HAS_NUMBA = False
+            return None
+        _reinsert_compiled = njit(cache=True, nogil=True)(_reinsert_slots)
+    return _reinsert_compiled
+
+
+# Heap copies at least this large go through numpy, which releases the GIL
+# while copying, so other threads (an event listener, say) keep running
+NOGIL_COPY_SIZE = 256 * 1024
+
+
+def _copy_into(dst: memoryview, start: int, data) -> None:
+    """dst[start:start + len(data)] = data; the source and target may overlap."""
+    n = len(data)
+    if HAS_NUMPY and n >= NOGIL_COPY_SIZE:
+        np.frombuffer(dst, dtype=np.uint8, count=n, offset=start)[:] = np.frombuffer(data, dtype=np.uint8)
+    else:
+        dst[start:start + n] = data
 
 
 # Global serializer instance (can be reconfigured)
@@ -111,30 +543,256 @@ def configure_serializer(prefer_msgpack: bool = True, compress_threshold: int =
     _serializer = Serializer(prefer_msgpack, compress_threshold)
 
 
+# Where POSIX shared memory segments show up as files (Linux)
+_SHM_DIR = '/dev/shm'
+
+
+def _lock_file(shm_name: str) -> str:
+    """Writer lock file of a pool on systems without _SHM_DIR."""
+    return os.path.join(tempfile.gettempdir(), f'latzero_{shm_name}.lock')
+
+
+def _open_lock(shm_name: str) -> int:
+    """
+    Open the file whose flock() serializes a pool's writers.
+    
+    On Linux that is the heap segment's own file in /dev/shm, so it goes
+    away with the segment. Elsewhere it is _lock_file(shm_name), which
+    destroy() removes.
+    """
+    if os.path.isdir(_SHM_DIR):
+        return os.open(os.path.join(_SHM_DIR, shm_name), os.O_RDONLY)
+    return os.open(_lock_file(shm_name), os.O_RDWR | os.O_CREAT, 0o600)
+
+
+def _open_segment(name: str, size: int) -> tuple:
+    """
+    Create a shared memory segment, or take over a leftover one.
+    
+    Returns:
+        (segment, True if it was freshly created and therefore zeroed)
+    """
+    try:
+        return shm.SharedMemory(name=name, create=True, size=size), True
+    except FileExistsError:
+        segment = shm.SharedMemory(name=name, create=False)
+        if len(segment.buf) >= size:
+            return segment, False
+        # Stale segment from an earlier, smaller pool
+        segment.close()
+        segment.unlink()
+        return shm.SharedMemory(name=name, create=True, size=size), True
+
+
+class SegmentChain:
+    """
+    One logical byte range stitched together from shared memory segments.
+    
+    Segment 0 covers [0, base); segment i >= 1 covers
+    [base << (i - 1), base << i), capped at max_size. Each new segment
+    doubles the total, so growing never copies or moves existing data.
+    Records must not straddle a segment boundary (see fit()).
+    """
+    
+    __slots__ = ('name', 'base', 'max_size', 'segments', 'bufs', 'capacity')
+    
+    def __init__(self, name: str, base: int, max_size: int, first: shm.SharedMemory):
+        self.name = name
+        self.base = base
+        self.max_size = max_size
+        self.segments = [first]
+        self.bufs = [first.buf]
+        # End of the last segment, kept as an attribute for the write path
+        self.capacity = base
+    
+    def segment_name(self, i: int) -> str:
+        return self.name if i == 0 else f"{self.name}_h{i}"
+    
+    def span(self, i: int) -> tuple:
+        """(start, end) logical offsets of segment i."""
+        if i == 0:
+            return 0, self.base
+        start = self.base << (i - 1)
+        return start, min(start << 1, self.max_size)
+    
+    def index(self, offset: int) -> int:
+        """Segment holding a logical offset."""
+        return 0 if offset < self.base else (offset // self.base).bit_length()
+    
+    def locate(self, offset: int) -> tuple:
+        """(segment buffer, local offset) for a logical offset."""
+        if offset < self.base:
+            return self.bufs[0], offset
+        i = (offset // self.base).bit_length()
+        return self.bufs[i], offset - (self.base << (i - 1))
+    
+    def fit(self, offset: int, length: int) -> int:
+        """First offset >= offset where length bytes fit inside one segment."""
+        while offset < self.max_size:
+            end = self.span(self.index(offset))[1]
+            if offset + length <= end:
+                return offset
+            offset = end
+        from ..utils.exceptions import MemoryFullError
+        raise MemoryFullError(f"Cannot expand beyond {self.max_size} bytes")
+    
+    def grow(self) -> None:
+        """Append the next segment."""
+        i = len(self.segments)
+        start, end = self.span(i)
+        if start >= self.max_size:
+            from ..utils.exceptions import MemoryFullError
+            raise MemoryFullError(f"Cannot expand beyond {self.max_size} bytes")
+        segment, _ = _open_segment(self.segment_name(i), end - start)
+        self.segments.append(segment)
+        self.bufs.append(segment.buf)
+        self.capacity = end
+    
+    def attach(self, count: int) -> None:
+        """Attach segments another process appended."""
+        while len(self.segments) < count:
+            segment = shm.SharedMemory(name=self.segment_name(len(self.segments)), create=False)
+            self.segments.append(segment)
+            self.bufs.append(segment.buf)
+        self.capacity = self.span(len(self.segments) - 1)[1]
+    
+    def close(self) -> None:
+        for segment in self.segments:
+            try:
+                segment.close()
+            except Exception:
+                pass
+    
+    def unlink(self) -> None:
+        for segment in self.segments:
+            try:
+                segment.unlink()
+            except Exception:
+                pass
+
+
+class LazyValue:
+    """
+    A value read by mget(lazy=True), decoded on first use.
+    
+    Holds a private copy of the stored bytes, not a view of shared
+    memory: records are overwritten in place and moved by compaction once
+    the read that found them is over. Comparisons and indexing decode
+    implicitly; get() returns the decoded value.
+    """
+    
+    __slots__ = ('_raw', '_decode', '_value')
+    
+    _PENDING = object()
+    
+    def __init__(self, raw: Optional[bytes], decode, value: Any = _PENDING):
+        self._raw = raw
+        self._decode = decode
+        self._value = value
+    
+    def get(self) -> Any:
+        """The decoded value (decoded once, then kept)."""
+        if self._value is LazyValue._PENDING:
+            self._value = self._decode(self._raw)
+            self._raw = None
+        return self._value
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyValue):
+            other = other.get()
+        return self.get() == other
+    
+    __hash__ = None
+    
+    def __getitem__(self, item: Any) -> Any:
+        return self.get()[item]
+    
+    def __repr__(self) -> str:
+        if self._value is LazyValue._PENDING:
+            return f"LazyValue(<{len(self._raw)} bytes>)"
+        return f"LazyValue({self._value!r})"
+
+
+def _dir_name(shm_name: str, gen: int, owner: int) -> str:
+    """
+    Segment name of a directory generation.
+    
+    Qualified by the pid that built it: two processes rebuilding at once
+    get separate segments instead of one zeroing the other's, and a
+    leftover from a crashed run is never mistaken for the current one.
+    """
+    return f"{shm_name}_d{gen}_{owner}"
+
+
+def unlink_pool_data(shm_name: str) -> None:
+    """Unlink every segment of a pool's data (heap chain and directory)."""
+    try:
+        first = shm.SharedMemory(name=shm_name, create=False)
+    except FileNotFoundError:
+        return
+    header = _HEADER.unpack_from(first.buf, 0)
+    segments, dir_gen, dir_owner = header[6], header[7], header[8]
+    first.close()
+    names = [shm_name] + [f"{shm_name}_h{i}" for i in range(1, segments)]
+    if dir_gen:
+        names.append(_dir_name(shm_name, dir_gen, dir_owner))
+    for name in names:
+        try:
+            segment = shm.SharedMemory(name=name, create=False)
+            segment.close()
+            segment.unlink()
+        except Exception:
+            pass
+
+
 class SharedMemoryPoolData:
     """
     Manages data storage in shared memory for a single pool.
     
     Features:
-    - Dynamic expansion: starts at 1MB, grows up to 100MB
-    - Efficient binary format with length prefixes
-    - Per-key locking via StripedLock
+    - Dynamic expansion: starts at 1MB, grows up to 100MB by chaining
+      segments, without copying existing data
+    - Per-key slots: a write serializes and copies only its own entry
+    - Reads decode a single entry straight from shared memory
     - Lazy cleanup of expired entries
-    - Cached reads with dirty tracking for performance
     """
 
     INITIAL_SIZE = 1024 * 1024      # 1MB initial
-    GROWTH_FACTOR = 2               # Double each expansion
     MAX_SIZE = 100 * 1024 * 1024    # 100MB max
     
     # Memory layout:
-    # [8 bytes: data_length][8 bytes: version][data...]
-    HEADER_SIZE = 16
+    # heap:      [header][records...] in a SegmentChain named shm_name
+    # directory: [slot_count x slot] in segment "{shm_name}_d{dir_gen}_{dir_owner}"
+    #
+    # The slot directory is an open-addressed (linear probing) hash table
+    # keyed by a process-independent 64-bit key hash. Each live slot points
+    # at one heap record: the UTF-8 key immediately followed by the
+    # serialized value. Records are appended at heap_top; overwritten and
+    # deleted records count as garbage and are reclaimed by compaction
+    # once they make up half the heap, otherwise the chain grows. A full
+    # directory is rebuilt into the next generation without touching the
+    # heap. The header records the segment count and directory generation
+    # so other processes attach whatever was added since their last look.
+    #
+    # Every mutation bumps the header version by two, making it odd while
+    # it writes (a seqlock), so readers in other processes take no lock:
+    # they retry whenever a write was in progress or landed meanwhile.
+    # Writers exclude each other with flock() on a lock fd opened once per
+    # instance: the heap segment's file in /dev/shm on Linux, a lock file
+    # in the temp directory elsewhere (see _open_lock).
+    # Decoded values are cached per process and the cache is dropped
+    # whenever the version moved on without us, so repeated reads skip the
+    # probe and the decode.
+    HEADER_SIZE = _HEADER.size + _EXPIRY.size
+    SLOT_SIZE = _SLOT.size
+    INITIAL_SLOTS = 1024            # Power of two
+    MAX_LOAD = 0.75                 # Max (live + deleted) / slot_count
 
     __slots__ = (
         'shm_name', 'encryption', 'auth_key', 'is_creator',
-        'shm', '_data', '_lock', '_key_locks', '_serializer',
-        '_current_size', '_version', '_last_read_version', '_dirty'
+        'shm', '_lock', '_serializer', '_chain', '_buf',
+        '_dir', '_dir_buf', '_dir_gen', '_dir_owner', '_cache', '_cache_version',
+        '_cache_misses', '_key_table', '_key_table_version', '_write_depth', '_lock_fd'
     )
 
     def __init__(
@@ -149,18 +807,27 @@ class SharedMemoryPoolData:
         self.auth_key = auth_key
         self.is_creator = False
         self._serializer = serializer or get_serializer()
+        # The only lock on the hot path: a mutation touches one slot, one
+        # heap record and the header, so there is nothing to refresh or save
         self._lock = threading.RLock()
-        self._key_locks = StripedLock(num_stripes=64)
-        self._data: Dict[str, dict] = {}
-        self._current_size = self.INITIAL_SIZE
-        self._version = 0
-        self._last_read_version = -1
-        self._dirty = False
+        self._dir = None
+        self._dir_buf = None
+        self._dir_gen = 0
+        self._dir_owner = 0
+        # Nesting of _write_begin() sections; only the outermost one locks
+        self._write_depth = 0
+        # key -> (value, timestamp, auto_clean) or _ABSENT, valid at _cache_version
+        self._cache: Dict[str, tuple] = {}
+        self._cache_version = -1
+        # _ABSENT entries added to _cache since it was last emptied
+        self._cache_misses = 0
+        # Sorted live keys, valid at _key_table_version
+        self._key_table: List[str] = []
+        self._key_table_version = -1
 
         try:
             # Try to connect to existing shared memory
             self.shm = shm.SharedMemory(name=shm_name, create=False)
-            self._current_size = len(self.shm.buf)
         except FileNotFoundError:
             # Create new shared memory for this pool
             try:
@@ -170,282 +837,1045 @@ class SharedMemoryPoolData:
                     size=self.INITIAL_SIZE
                 )
                 self.is_creator = True
-                self._current_size = self.INITIAL_SIZE
-                # Initialize with empty data
-                self._write_data_raw({})
             except FileExistsError:
                 # Race: another process created it
                 self.shm = shm.SharedMemory(name=shm_name, create=False)
-                self._current_size = len(self.shm.buf)
             except Exception as e:
                 raise RuntimeError(f"Could not create shared memory for pool {shm_name}: {e}")
+        # Cross-process writer lock; -1 where flock() is unavailable
+        self._lock_fd = _open_lock(self.shm.name) if HAS_FCNTL else -1
+        
+        self._chain = SegmentChain(shm_name, self.INITIAL_SIZE, self.MAX_SIZE, self.shm)
+        # Segment buffers are cached: SharedMemory.buf is a property, and
+        # the write path would otherwise look it up half a dozen times
+        self._buf = self.shm.buf
+        # Lay out an empty slot directory unless one exists. The creator may
+        # lose the writer lock to a process that attached first, so both
+        # check under it; readers never lay out a pool
+        self._write_begin()
+        try:
+            if _DIR.unpack_from(self._buf, _DIR_OFFSET)[0] == 0:
+                self._init_layout(self.INITIAL_SLOTS)
+        finally:
+            self._write_end()
+        self._header()
 
-        self._sync_from_shm()
+    # =========== Layout ===========
 
-    def _write_data_raw(self, data: dict) -> None:
-        """Write data dict to shared memory (low-level)."""
-        serialized = self._serializer.serialize(data)
-        total_needed = len(serialized) + self.HEADER_SIZE
-        
-        # Check if expansion needed
-        if total_needed > self._current_size:
-            self._expand_memory(total_needed)
+    @staticmethod
+    def _hash(key_bytes: bytes) -> int:
+        """64-bit key hash, stable across processes (unlike hash())."""
+        return int.from_bytes(blake2b(key_bytes, digest_size=8).digest(), 'little')
+
+    def _header(self) -> tuple:
+        """
+        Read (heap_top, version, slot_count, live, deleted, garbage).
         
-        self._version += 1
+        Attaches heap segments or a directory generation added by other
+        processes.
+        """
+        header = _HEADER.unpack_from(self._buf, 0)
+        heap_top, version, garbage, slot_count, live, deleted, segments, dir_gen, dir_owner = header
+        if dir_gen != self._dir_gen or dir_owner != self._dir_owner:
+            directory = shm.SharedMemory(name=_dir_name(self.shm_name, dir_gen, dir_owner), create=False)
+            self._swap_dir(directory, dir_gen, dir_owner, False)
+        if segments > len(self._chain.segments):
+            self._chain.attach(segments)
+        return heap_top, version, slot_count, live, deleted, garbage
+
+    def _write_header(self, heap_top: int, garbage: int,
+                      slot_count: int, live: int, deleted: int) -> None:
+        """Store the heap and slot counters; never the version or directory fields."""
+        _HEAP_TOP.pack_into(self._buf, 0, heap_top)
+        _COUNTS.pack_into(
+            self._buf, _COUNTS_OFFSET, garbage, slot_count, live, deleted, len(self._chain.segments)
+        )
+
+    def _new_dir(self, slot_count: int) -> tuple:
+        """
+        Create the next directory generation, zeroed (low-level).
         
-        # Write: [length][version][data]
-        length_bytes = struct.pack('Q', len(serialized))
-        version_bytes = struct.pack('Q', self._version)
+        Returns:
+            (segment, generation)
+        """
+        gen = _DIR.unpack_from(self._buf, _DIR_OFFSET)[0] + 1
+        size = slot_count * self.SLOT_SIZE
+        directory, fresh = _open_segment(_dir_name(self.shm_name, gen, os.getpid()), size)
+        if not fresh:
+            directory.buf[:size] = bytes(size)
+        return directory, gen
+
+    def _swap_dir(self, directory: shm.SharedMemory, gen: int, owner: int, own: bool) -> None:
+        """
+        Switch to another directory generation, dropping ours.
         
-        self.shm.buf[:8] = length_bytes
-        self.shm.buf[8:16] = version_bytes
-        self.shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + len(serialized)] = serialized
+        A generation of our own (own=True) is also published in the header,
+        and the one it replaces unlinked.
+        """
+        old = self._dir
+        self._dir = directory
+        self._dir_buf = directory.buf
+        self._dir_gen = gen
+        self._dir_owner = owner
+        if own:
+            _DIR.pack_into(self._buf, _DIR_OFFSET, gen, owner)
+        if old is not None:
+            try:
+                old.close()
+                if own:
+                    old.unlink()
+            except Exception:
+                pass
 
-    def _read_data_raw(self) -> tuple:
-        """Read data dict from shared memory (low-level). Returns (data, version)."""
+    def _init_layout(self, slot_count: int) -> None:
+        """Write an empty header and slot directory (a whole mutation)."""
+        self._write_begin()
         try:
-            length = struct.unpack('Q', bytes(self.shm.buf[:8]))[0]
-            version = struct.unpack('Q', bytes(self.shm.buf[8:16]))[0]
-            
-            if length == 0:
-                return {}, version
-            
-            data_bytes = bytes(self.shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + length])
-            return self._serializer.deserialize(data_bytes), version
-        except Exception:
-            return {}, 0
+            directory, gen = self._new_dir(slot_count)
+            self._swap_dir(directory, gen, os.getpid(), True)
+            _EXPIRY.pack_into(self._buf, _EXPIRY_OFFSET, 0.0)
+            self._write_header(self.HEADER_SIZE, 0, slot_count, 0, 0)
+        finally:
+            self._write_end()
 
-    def _sync_from_shm(self) -> bool:
-        """Sync local cache from shared memory if version changed. Returns True if synced."""
-        data, version = self._read_data_raw()
-        if version != self._last_read_version:
-            self._data = data
-            self._last_read_version = version
-            self._version = version
-            return True
-        return False
+    def _probe(self, key_bytes: bytes, key_hash: int, slot_count: int) -> tuple:
+        """
+        Find a key in the slot directory.
+        
+        Returns:
+            (slot index or -1, slot fields or None, first reusable slot index)
+        """
+        buf = self._dir_buf
+        locate = self._chain.locate
+        mask = slot_count - 1
+        key_len = len(key_bytes)
+        i = key_hash & mask
+        free = -1
+        
+        # The load limit guarantees an empty slot, so this always terminates
+        while True:
+            slot = _SLOT.unpack_from(buf, i * self.SLOT_SIZE)
+            state = slot[6]
+            if state == _SLOT_EMPTY:
+                return -1, None, (i if free < 0 else free)
+            if state == _SLOT_DELETED:
+                if free < 0:
+                    free = i
+            elif slot[0] == key_hash and slot[5] == key_len:
+                heap, offset = locate(slot[1])
+                if heap[offset:offset + key_len] == key_bytes:
+                    return i, slot, free
+            i = (i + 1) & mask
 
-    def _sync_to_shm(self) -> None:
-        """Write local cache to shared memory."""
-        self._write_data_raw(self._data)
-        self._dirty = False
-        self._last_read_version = self._version
+    def _live_slots(self, slot_count: int) -> List[tuple]:
+        """(index, slot fields) of every live slot."""
+        return [
+            (i, slot)
+            for i, slot in enumerate(_SLOT.iter_unpack(self._dir_buf[:slot_count * self.SLOT_SIZE]))
+            if slot[6] == _SLOT_LIVE
+        ]
 
-    def _expand_memory(self, needed_size: int) -> None:
+    def _slot_array(self, slot_count: int) -> 'np.ndarray':
         """
-        Expand shared memory to accommodate more data.
+        The whole slot directory as a numpy record array (_SLOT_DTYPE),
+        one column per slot field.
         
-        Strategy: Create new segment, copy data, switch over.
+        A copy, so no view keeps the directory segment from closing.
         """
-        new_size = self._current_size
-        while new_size < needed_size and new_size < self.MAX_SIZE:
-            new_size = min(new_size * self.GROWTH_FACTOR, self.MAX_SIZE)
-        
-        if new_size >= self.MAX_SIZE and needed_size > new_size:
-            from ..utils.exceptions import MemoryFullError
-            raise MemoryFullError(f"Cannot expand beyond {self.MAX_SIZE} bytes")
+        return np.frombuffer(self._dir_buf, dtype=_SLOT_DTYPE, count=slot_count).copy()
+
+    def _key(self, slot: tuple) -> str:
+        """Key of a live slot."""
+        heap, offset = self._chain.locate(slot[1])
+        return str(heap[offset:offset + slot[5]], 'utf-8')
+
+    def _version(self) -> int:
+        """Current header version (bumped by every mutation)."""
+        return _VERSION.unpack_from(self._buf, _VERSION_OFFSET)[0]
+
+    def _write_begin(self) -> int:
+        """
+        Take the writer lock and mark a mutation in progress: make the
+        version odd (seqlock).
         
-        # Create new segment with larger size
-        new_name = f"{self.shm_name}_exp_{int(time.time() * 1000)}"
-        new_shm = shm.SharedMemory(name=new_name, create=True, size=new_size)
+        Writers in other processes are excluded with flock() on _lock_fd,
+        which the kernel releases if a writer dies. Callers hold _lock,
+        which covers threads of this process.
         
-        # Copy existing data
-        old_length = struct.unpack('Q', bytes(self.shm.buf[:8]))[0]
-        if old_length > 0:
-            new_shm.buf[:self.HEADER_SIZE + old_length] = self.shm.buf[:self.HEADER_SIZE + old_length]
+        Returns:
+            The version before the mutation
+        """
+        if self._write_depth == 0 and self._lock_fd >= 0:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        self._write_depth += 1
+        version = self._version()
+        if self._write_depth == 1:
+            _VERSION.pack_into(self._buf, _VERSION_OFFSET, version | 1)
+        return version
+
+    def _write_end(self) -> int:
+        """Mark the mutation done: make the version even again and drop the writer lock. Returns it."""
+        self._write_depth -= 1
+        if self._write_depth:
+            return self._version()
+        version = (self._version() | 1) + 1
+        _VERSION.pack_into(self._buf, _VERSION_OFFSET, version)
+        if self._lock_fd >= 0:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        return version
+
+    def _stable(self, read, *args) -> tuple:
+        """
+        Run read(*args) without tearing against writers in other processes
+        (seqlock reader side).
         
-        # Close old segment
-        old_shm = self.shm
+        The stores of a mutation are not reordered past the version stores
+        on x86-64 (TSO), where aligned 8-byte loads and stores are atomic.
+        A result is only returned once the version was even and unchanged
+        around it. Callers hold _lock.
         
-        # Switch to new segment
-        self.shm = new_shm
-        self.shm_name = new_name
-        self._current_size = new_size
+        Returns:
+            (result, version it was read at)
+        """
+        if self._write_depth:
+            # Our own mutation; no other writer can be in one
+            return read(*args), self._version()
+        stalled = None
+        while True:
+            version = self._version()
+            if not version & 1:
+                try:
+                    result = read(*args)
+                except Exception:
+                    # A torn read may fail in any way; only a stable one counts
+                    if self._version() == version:
+                        raise
+                else:
+                    if self._version() == version:
+                        return result, version
+            elif stalled is None or stalled[0] != version:
+                stalled = (version, time.monotonic())
+            elif time.monotonic() - stalled[1] > (SEQLOCK_STALL if self._lock_fd >= 0 else SEQLOCK_TIMEOUT):
+                self._recover_version()
+                stalled = None
+            time.sleep(0)
+
+    def _recover_version(self) -> None:
+        """
+        Make an odd version even again if the writer that left it odd died.
         
-        # Cleanup old
+        A live writer holds the flock() writer lock until the version is
+        even again, so an odd version under a free lock is abandoned. What
+        the dead writer had half done stays as it left it; the new version
+        still drops every process's cache.
+        """
+        if self._lock_fd < 0:
+            version = self._version()
+            if version & 1:
+                _VERSION.pack_into(self._buf, _VERSION_OFFSET, version + 1)
+            return
         try:
-            old_shm.close()
-            if self.is_creator:
-                old_shm.unlink()
-        except Exception:
-            pass
+            fcntl.flock(self._lock_fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # The writer is alive, just slow
+            return
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            version = self._version()
+            if version & 1:
+                _VERSION.pack_into(self._buf, _VERSION_OFFSET, version + 1)
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _put(self, key_bytes: bytes, payload: bytes, auto_clean: float) -> tuple:
+        """
+        Write one record and point its slot at it (low-level).
+        
+        A value that fits in its key's current record overwrites it in
+        place; anything else is appended at heap_top.
+        
+        Returns:
+            Timestamp written
+        """
+        key_len = len(key_bytes)
+        value_len = len(payload)
+        if key_len > 0xFFFF:
+            raise ValueError("Key too long (max 65535 bytes)")
+        
+        record_len = key_len + value_len
+        heap_top, _, slot_count, live, deleted, garbage = self._header()
+        key_hash = self._hash(key_bytes)
+        index, slot, free = self._probe(key_bytes, key_hash, slot_count)
+        chain = self._chain
+        
+        if index >= 0 and value_len <= slot[2]:
+            # Overwrite in place; the unused tail of the old value is garbage
+            offset = slot[1]
+            garbage += slot[2] - value_len
+            heap, local = chain.locate(offset)
+            _copy_into(heap, local + key_len, payload)
+            top = heap_top
+        else:
+            moved = False
+            if index < 0 and live + deleted + 1 > slot_count * self.MAX_LOAD:
+                # Rebuild the directory: double it if live keys alone would
+                # keep it over half full, otherwise just drop the tombstones
+                if (live + 1) * 2 > slot_count * self.MAX_LOAD:
+                    slot_count *= 2
+                self._rebuild_dir(slot_count)
+                heap_top, _, slot_count, live, deleted, garbage = self._header()
+                moved = True
+            
+            offset = chain.fit(heap_top, record_len)
+            if offset + record_len > chain.capacity:
+                offset = self._alloc(record_len)
+                heap_top, _, slot_count, live, deleted, garbage = self._header()
+                moved = True
+            # Bytes skipped at the end of a segment are never reused
+            garbage += offset - heap_top
+            
+            if moved:
+                # Slots moved to a new directory, or records to new offsets
+                index, slot, free = self._probe(key_bytes, key_hash, slot_count)
+            if index < 0:
+                index = free
+                live += 1
+                if _SLOT_STATE.unpack_from(self._dir_buf, (index + 1) * self.SLOT_SIZE - _SLOT_STATE.size)[0] == _SLOT_DELETED:
+                    deleted -= 1
+            else:
+                garbage += slot[5] + slot[2]
+            
+            heap, local = chain.locate(offset)
+            key_end = local + key_len
+            heap[local:key_end] = key_bytes
+            _copy_into(heap, key_end, payload)
+            top = offset + record_len
+        
+        dir_buf = self._dir_buf
+        timestamp = time.time()
+        _SLOT.pack_into(
+            dir_buf, index * self.SLOT_SIZE,
+            key_hash, offset, value_len, timestamp, auto_clean, key_len, _SLOT_LIVE
+        )
+        if auto_clean:
+            deadline = timestamp + auto_clean
+            next_expiry = _EXPIRY.unpack_from(self._buf, _EXPIRY_OFFSET)[0]
+            if not next_expiry or deadline < next_expiry:
+                _EXPIRY.pack_into(self._buf, _EXPIRY_OFFSET, deadline)
+        self._write_header(top, garbage, slot_count, live, deleted)
+        return timestamp
+
+    def _alloc(self, length: int) -> int:
+        """
+        Make heap space for a record that does not fit, compacting or
+        growing the chain (low-level).
+        
+        Returns:
+            Logical offset the record can be written at
+        """
+        chain = self._chain
+        heap_top, _, _, _, _, garbage = self._header()
+        offset = chain.fit(heap_top, length)
+        if garbage * 2 >= heap_top - self.HEADER_SIZE:
+            self._compact()
+            heap_top = self._header()[0]
+            offset = chain.fit(heap_top, length)
+        
+        while offset + length > chain.capacity:
+            chain.grow()
+        return offset
+
+    def _remove_slots(self, indices: List[int]) -> None:
+        """Tombstone slots in place (low-level)."""
+        if not indices:
+            return
+        heap_top, _, slot_count, live, deleted, garbage = self._header()
+        buf = self._dir_buf
+        for index in indices:
+            _, _, value_len, _, _, key_len, _ = _SLOT.unpack_from(buf, index * self.SLOT_SIZE)
+            garbage += key_len + value_len
+            # state is the last field of the slot
+            _SLOT_STATE.pack_into(buf, (index + 1) * self.SLOT_SIZE - _SLOT_STATE.size, _SLOT_DELETED)
+        n = len(indices)
+        self._write_header(heap_top, garbage, slot_count, live - n, deleted + n)
+
+    def _rebuild_dir(self, slot_count: int) -> None:
+        """Reinsert live slots into a fresh directory generation (low-level)."""
+        heap_top, _, old_slots, live, deleted, garbage = self._header()
+        directory, gen = self._new_dir(slot_count)
+        mask = slot_count - 1
+        
+        kernel = _reinsert_kernel() if HAS_NUMBA and slot_count >= NUMBA_MIN_SLOTS else None
+        if kernel is not None:
+            # The kernel gets arrays owning their data: numba may keep
+            # references to its arguments, which must not pin a segment
+            new = np.zeros(slot_count * 4, dtype=np.int64)
+            moved = kernel(np.frombuffer(self._dir_buf, dtype=np.int64, count=old_slots * 4).copy(), new, mask)
+            np.frombuffer(directory.buf, dtype=np.int64, count=slot_count * 4)[:] = new
+        else:
+            buf = directory.buf
+            taken = set()
+            moved = 0
+            for _, slot in self._live_slots(old_slots):
+                i = slot[0] & mask
+                while i in taken:
+                    i = (i + 1) & mask
+                taken.add(i)
+                _SLOT.pack_into(buf, i * self.SLOT_SIZE, *slot)
+                moved += 1
+        
+        self._swap_dir(directory, gen, os.getpid(), True)
+        self._write_header(heap_top, garbage, slot_count, moved, 0)
+
+    def _compact(self) -> None:
+        """Slide live records down over the garbage, in heap order (low-level)."""
+        heap_top, _, slot_count, live, deleted, _ = self._header()
+        chain = self._chain
+        dir_buf = self._dir_buf
+        
+        top = self.HEADER_SIZE
+        garbage = 0
+        # Every record lands at or below its old offset, so moving them in
+        # heap order never overwrites one that has not moved yet
+        for index, slot in sorted(self._live_slots(slot_count), key=lambda item: item[1][1]):
+            key_hash, offset, value_len, timestamp, auto_clean, key_len, state = slot
+            length = key_len + value_len
+            new_offset = chain.fit(top, length)
+            garbage += new_offset - top
+            if new_offset != offset:
+                src, start = chain.locate(offset)
+                dst, local = chain.locate(new_offset)
+                if length >= NOGIL_COPY_SIZE:
+                    _copy_into(dst, local, src[start:start + length])
+                else:
+                    dst[local:local + length] = bytes(src[start:start + length])
+                _SLOT.pack_into(
+                    dir_buf, index * self.SLOT_SIZE,
+                    key_hash, new_offset, value_len, timestamp, auto_clean, key_len, state
+                )
+            top = new_offset + length
+        self._write_header(top, garbage, slot_count, live, deleted)
+
+    # =========== Operations ===========
+
+    def _decode(self, slot: tuple) -> Any:
+        """Deserialize (and decrypt) the value a live slot points at."""
+        _, offset, value_len, _, _, key_len, _ = slot
+        heap, start = self._chain.locate(offset)
+        start += key_len
+        # Decode (and decrypt) straight from shared memory. Records never
+        # straddle a segment boundary, so this is one contiguous view; the
+        # decoders copy what they keep, and the view is released before any
+        # segment is closed
+        with heap[start:start + value_len] as view:
+            return self._decode_bytes(view)
+
+    def _decode_bytes(self, data) -> Any:
+        """Deserialize (and decrypt) a value's stored bytes."""
+        if not (data and data[0] == _ENCRYPTED):
+            return self._serializer.deserialize(data)
+        # Without encryption enabled the ciphertext is all we can return
+        if not self.encryption:
+            return bytes(data[1:])
+        from .encryption import decrypt_data
+        return self._serializer.deserialize(decrypt_data(data[1:], self.auth_key))
+
+    def _load_lazy(self, slot: tuple) -> LazyValue:
+        """Copy out the value a live slot points at, to be decoded later."""
+        _, offset, value_len, _, _, key_len, _ = slot
+        heap, start = self._chain.locate(offset)
+        start += key_len
+        return LazyValue(bytes(heap[start:start + value_len]), self._decode_bytes)
+
+    def _lookup(self, key_bytes: bytes, now: float, load=None) -> tuple:
+        """
+        Find and decode a key (with load(slot) instead, if given).
+        
+        Returns:
+            (slot index or -1, slot fields, value); value is None for
+            entries whose auto_clean has elapsed at now
+        """
+        index, slot, _ = self._probe(key_bytes, self._hash(key_bytes), self._header()[2])
+        if index < 0 or (slot[4] and now - slot[3] > slot[4]):
+            return index, slot, None
+        return index, slot, self._decode(slot) if load is None else load(slot)
 
     def get(self, key: str) -> Any:
         """Get a value by key."""
         with self._lock:
-            # Use cached data - caller should call refresh() if multi-process sync needed
-            entry = self._data.get(key)
-            if not entry:
+            now = time.time()
+            if self._version() == self._cache_version:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    value, timestamp, auto_clean = cached
+                    if not auto_clean or now - timestamp <= auto_clean:
+                        return value
+            
+            (index, slot, value), version = self._stable(self._lookup, key.encode('utf-8'), now)
+            if version != self._cache_version:
+                # Someone else wrote since our last look
+                self._cache = {}
+                self._cache_misses = 0
+                self._cache_version = version
+            if index < 0:
+                # Repeated misses skip the probe until the next write
+                if self._cache_misses < MAX_CACHED_MISSES:
+                    self._cache[key] = _ABSENT
+                    self._cache_misses += 1
                 return None
 
             # Check auto-clean
-            if entry.get('auto_clean'):
-                elapsed = time.time() - entry['timestamp']
-                if elapsed > entry['auto_clean']:
-                    del self._data[key]
-                    self._dirty = True
-                    return None
-
-            value = entry['value']
-            
-            # Handle encryption
-            if self.encryption and isinstance(value, str) and value.startswith('enc:'):
-                from .encryption import decrypt_data
-                enc_bytes = bytes.fromhex(value[4:])
-                decrypted = decrypt_data(enc_bytes, self.auth_key)
-                value = self._serializer.deserialize(decrypted)
+            auto_clean = slot[4]
+            if auto_clean and now - slot[3] > auto_clean:
+                self._cache.pop(key, None)
+                self._remove_unchanged([(index, slot)])
+                return None
 
+            self._cache[key] = (value, slot[3], auto_clean)
             return value
 
-    def set(self, key: str, value: Any, auto_clean: Optional[int] = None, _sync: bool = True) -> None:
+    def set(self, key: str, value: Any, auto_clean: Optional[int] = None, _sync: bool = True,
+            dtype: Optional[str] = None) -> None:
         """Set a value by key.
         
         Args:
             key: Key name
             value: Value to store
             auto_clean: Auto-expire after N seconds
-            _sync: If True, sync to shared memory immediately (default). 
-                   Set to False for batched operations, then call flush().
+            _sync: Kept for compatibility; every write goes straight to
+                   shared memory and only touches this key's slot.
+            dtype: 'bf16' stores a numpy float array as bfloat16; it reads
+                   back as float32 with 8 bits of precision.
         """
+        if dtype is not None:
+            if dtype != 'bf16':
+                raise ValueError(f"Unsupported dtype: {dtype!r}")
+            if not self._serializer._use_msgpack:
+                raise ValueError("bf16 storage requires msgpack")
+            value = bf16_ext(value)
+        
+        payload = self._encode(value)
         with self._lock:
-            stored_value = value
-            
-            # Handle encryption
-            if self.encryption:
-                from .encryption import encrypt_data
-                serialized = self._serializer.serialize(value)
-                encrypted = encrypt_data(serialized, self.auth_key)
-                stored_value = 'enc:' + encrypted.hex()
-
-            self._data[key] = {
-                'value': stored_value,
-                'timestamp': time.time(),
-                'auto_clean': auto_clean,
-            }
+            before = self._write_begin()
+            current = before == self._cache_version
+            try:
+                timestamp = self._put(key.encode('utf-8'), payload, auto_clean or 0)
+            finally:
+                version = self._write_end()
+            self._note_keys(before, version, added=(key,))
+            if current and dtype is not None:
+                # Readers get the rounded float32 array, not what was passed in
+                self._cache.pop(key, None)
+                self._cache_version = version
+            elif current:
+                # Only our own write happened since the cache was valid
+                self._cache[key] = (value, timestamp, auto_clean or 0)
+                self._cache_version = version
+
+    def mset(self, items: Dict[str, Any], auto_clean: Optional[int] = None) -> None:
+        """Set several keys under one lock.
+        
+        Everything is serialized first, then the directory and heap are
+        sized once for the whole batch, so a large batch costs at most one
+        rebuild and one round of growth instead of one per key.
+        """
+        if not items:
+            return
+        records = [(key, key.encode('utf-8'), self._encode(value), value) for key, value in items.items()]
+        
+        with self._lock:
+            before = self._write_begin()
+            current = before == self._cache_version
+            try:
+                self._reserve(len(records), sum(len(k) + len(p) for _, k, p, _ in records))
+                for key, key_bytes, payload, value in records:
+                    timestamp = self._put(key_bytes, payload, auto_clean or 0)
+                    if current:
+                        self._cache[key] = (value, timestamp, auto_clean or 0)
+            finally:
+                version = self._write_end()
+            self._note_keys(before, version, added=items)
+            if current:
+                self._cache_version = version
+
+    def mget(self, keys: List[str], lazy: bool = False) -> Dict[str, Any]:
+        """Get several keys at once (missing keys map to None).
+        
+        Values this process already decoded come from the cache; the rest
+        are probed and decoded in one consistent read.
+        
+        Args:
+            keys: Key names
+            lazy: Return found values as LazyValue, copying their bytes
+                  now and decoding each one only when it is used
+        """
+        with self._lock:
+            now = time.time()
+            result = {}
+            missing = []
+            cache = self._cache if self._version() == self._cache_version else {}
+            for key in keys:
+                cached = cache.get(key)
+                if cached is not None and (not cached[2] or now - cached[1] <= cached[2]):
+                    value = cached[0]
+                    result[key] = LazyValue(None, None, value) if lazy and value is not None else value
+                else:
+                    missing.append(key)
+            if not missing:
+                return result
             
-            self._dirty = True
-            if _sync:
-                self._sync_to_shm()
+            found, version = self._stable(self._lookup_many, missing, now, self._load_lazy if lazy else None)
+            if version != self._cache_version:
+                self._cache = {}
+                self._cache_misses = 0
+                self._cache_version = version
+            cache = self._cache
+            expired = []
+            for key, (index, slot, value) in zip(missing, found):
+                result[key] = value
+                if index < 0:
+                    if self._cache_misses < MAX_CACHED_MISSES:
+                        cache[key] = _ABSENT
+                        self._cache_misses += 1
+                    continue
+                if slot[4] and now - slot[3] > slot[4]:
+                    cache.pop(key, None)
+                    expired.append((index, slot))
+                elif not lazy:
+                    cache[key] = (value, slot[3], slot[4])
+            if expired:
+                self._remove_unchanged(expired)
+            return {key: result[key] for key in keys}
+
+    def _lookup_many(self, keys: List[str], now: float, load=None) -> List[tuple]:
+        """_lookup() for each key."""
+        lookup = self._lookup
+        return [lookup(key.encode('utf-8'), now, load) for key in keys]
+
+    def _remove_unchanged(self, entries: List[tuple]) -> None:
+        """
+        Tombstone (slot index, slot fields) pairs read earlier, skipping
+        slots another process rewrote meanwhile (a whole mutation).
+        """
+        self._write_begin()
+        try:
+            buf = self._dir_buf
+            self._remove_slots([
+                index for index, slot in entries
+                if _SLOT.unpack_from(buf, index * self.SLOT_SIZE) == slot
+            ])
+        finally:
+            self._write_end()
+
+    def _encode(self, value: Any) -> bytes:
+        """Serialize (and encrypt) a value for the heap."""
+        serialized = self._serializer.serialize(value)
+        if self.encryption:
+            from .encryption import encrypt_data
+            return bytes([_ENCRYPTED]) + encrypt_data(serialized, self.auth_key)
+        return serialized
+
+    def _reserve(self, count: int, nbytes: int) -> None:
+        """Make room for count new keys and nbytes of records in one step (low-level)."""
+        heap_top, _, slot_count, live, deleted, garbage = self._header()
+        if live + deleted + count > slot_count * self.MAX_LOAD:
+            while (live + count) * 2 > slot_count * self.MAX_LOAD:
+                slot_count *= 2
+            self._rebuild_dir(slot_count)
+        
+        chain = self._chain
+        if heap_top + nbytes <= chain.capacity:
+            return
+        if garbage * 2 >= heap_top - self.HEADER_SIZE:
+            self._compact()
+            heap_top = self._header()[0]
+        # Best effort: whatever does not fit is handled per record by _put
+        while heap_top + nbytes > chain.capacity and chain.span(len(chain.segments))[0] < self.MAX_SIZE:
+            chain.grow()
+        heap_top, _, slot_count, live, deleted, garbage = self._header()
+        self._write_header(heap_top, garbage, slot_count, live, deleted)
 
     def set_fast(self, key: str, value: Any, auto_clean: Optional[int] = None) -> None:
-        """Set a value without immediate sync - much faster for batched operations.
+        """Set a value (same as set(); per-key writes need no batching).
         
-        Call flush() when done to persist to shared memory.
+        flush() is kept as a no-op for callers written against batched writes.
         """
-        self.set(key, value, auto_clean, _sync=False)
+        self.set(key, value, auto_clean)
 
     def flush(self) -> None:
         """Flush pending writes to shared memory.
         
-        Call this after batched set_fast() calls to persist data.
+        Writes are never buffered, so there is nothing to do.
         """
-        with self._lock:
-            if self._dirty:
-                self._sync_to_shm()
 
     def delete(self, key: str) -> bool:
         """Delete a key. Returns True if key existed."""
         with self._lock:
-            if key in self._data:
-                del self._data[key]
-                self._dirty = True
-                self._sync_to_shm()
-                return True
-            return False
+            key_bytes = key.encode('utf-8')
+            if self._stable(self._probe_key, key_bytes)[0] < 0:
+                return False
+            before = self._write_begin()
+            current = before == self._cache_version
+            try:
+                index = self._probe_key(key_bytes)
+                if index >= 0:
+                    self._remove_slots([index])
+            finally:
+                version = self._write_end()
+            if index >= 0:
+                self._note_keys(before, version, removed=(key,))
+            if current:
+                self._cache.pop(key, None)
+                self._cache_version = version
+            return index >= 0
+
+    def replace(self, old_key: str, key: str, value: Any) -> bool:
+        """Set key and delete old_key in one write section.
+
+        Costs one writer lock and one version bump instead of two, e.g.
+        for a reply written in place of the request it answers. With
+        old_key == key this is a plain set.
+
+        Returns:
+            True if old_key existed and was deleted
+        """
+        payload = self._encode(value)
+        old_bytes = old_key.encode('utf-8')
+        with self._lock:
+            before = self._write_begin()
+            current = before == self._cache_version
+            try:
+                timestamp = self._put(key.encode('utf-8'), payload, 0)
+                # Probe after the put, which may have rebuilt the directory
+                index = self._probe_key(old_bytes) if old_key != key else -1
+                if index >= 0:
+                    self._remove_slots([index])
+            finally:
+                version = self._write_end()
+            self._note_keys(before, version, added=(key,), removed=(old_key,) if index >= 0 else ())
+            if current:
+                self._cache.pop(old_key, None)
+                self._cache[key] = (value, timestamp, 0)
+                self._cache_version = version
+            return index >= 0
+
+    def pop(self, key: str) -> Any:
+        """Delete a key and return its value (None if missing or expired).
+        
+        One probe and one write, decoding straight from shared memory
+        before the slot is dropped; nothing is cached.
+        """
+        with self._lock:
+            key_bytes = key.encode('utf-8')
+            if self._stable(self._probe_key, key_bytes)[0] < 0:
+                return None
+            before = self._write_begin()
+            current = before == self._cache_version
+            try:
+                index, _, value = self._lookup(key_bytes, time.time())
+                if index >= 0:
+                    self._remove_slots([index])
+            finally:
+                version = self._write_end()
+            if index >= 0:
+                self._note_keys(before, version, removed=(key,))
+            if current:
+                self._cache.pop(key, None)
+                self._cache_version = version
+            return value
+
+    def increment(self, key: str, delta: Any) -> Any:
+        """Add delta to a numeric value and return the result.
+        
+        The read, the add and the write form one write section, so
+        concurrent increments never lose an update. A missing or expired
+        key counts as 0, and the result is stored without auto_clean.
+        
+        Raises:
+            TypeError: If the current value is not numeric
+        """
+        key_bytes = key.encode('utf-8')
+        with self._lock:
+            now = time.time()
+            before = self._write_begin()
+            current = before == self._cache_version
+            try:
+                cached = self._cache.get(key) if current else None
+                if cached is not None and (not cached[2] or now - cached[1] <= cached[2]):
+                    value = cached[0]
+                else:
+                    value = self._lookup(key_bytes, now)[2]
+                if value is None:
+                    value = 0
+                if not isinstance(value, (int, float)):
+                    raise TypeError(f"Cannot increment non-numeric value: {type(value)}")
+                value += delta
+                timestamp = self._put(key_bytes, self._encode(value), 0)
+            finally:
+                version = self._write_end()
+            self._note_keys(before, version, added=(key,))
+            if not current:
+                # Whatever else changed, our own result is known
+                self._cache = {}
+                self._cache_misses = 0
+            self._cache[key] = (value, timestamp, 0)
+            self._cache_version = version
+            return value
 
     def exists(self, key: str) -> bool:
         """Check if key exists."""
         with self._lock:
-            return key in self._data
+            key_bytes = key.encode('utf-8')
+            return self._stable(self._probe_key, key_bytes)[0] >= 0
+
+    def _probe_key(self, key_bytes: bytes) -> int:
+        """Slot index of a key, or -1."""
+        return self._probe(key_bytes, self._hash(key_bytes), self._header()[2])[0]
 
     def keys(self) -> List[str]:
-        """Get all keys."""
+        """Get all keys, in sorted (code point) order."""
         with self._lock:
-            return list(self._data.keys())
+            return list(self._keys())
 
-    def keys_with_prefix(self, prefix: str) -> List[str]:
-        """Get keys matching prefix."""
+    def _keys(self) -> List[str]:
+        """
+        The live keys in sorted order, rebuilt when the version moves.
+        
+        Keys sharing a prefix are contiguous, so prefix queries are a
+        bisect plus a slice.
+        """
+        if self._version() != self._key_table_version:
+            self._key_table, self._key_table_version = self._stable(self._build_key_table)
+        return self._key_table
+
+    def _build_key_table(self) -> List[str]:
+        """Read the live keys into a fresh _keys() table."""
+        locate = self._chain.locate
+        slot_count = self._header()[2]
+        if HAS_NUMPY:
+            slots = self._slot_array(slot_count)
+            live = slots[slots['state'] == _SLOT_LIVE]
+            spans = zip(live['offset'].tolist(), live['key_len'].tolist())
+        else:
+            spans = [(slot[1], slot[5]) for _, slot in self._live_slots(slot_count)]
+        keys = []
+        for start, key_len in spans:
+            heap, offset = locate(start)
+            keys.append(str(heap[offset:offset + key_len], 'utf-8'))
+        keys.sort()
+        return keys
+
+    def _note_keys(self, before: int, version: int, added=(), removed=()) -> None:
+        """
+        Carry the _keys() table across our own write section, from the
+        version it started at to the one it ended at, instead of letting
+        the next query rebuild it from the whole directory.
+        """
+        if before != self._key_table_version:
+            return
+        keys = self._key_table
+        for key in removed:
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        new_keys = []
+        for key in added:
+            i = bisect_left(keys, key)
+            if i == len(keys) or keys[i] != key:
+                new_keys.append(key)
+        if len(new_keys) > 16:
+            # One merge of two sorted runs beats an insert per key
+            keys.extend(new_keys)
+            keys.sort()
+        else:
+            for key in new_keys:
+                keys.insert(bisect_left(keys, key), key)
+        self._key_table_version = version
+
+    def _prefix_slots(self, prefix: str) -> List[tuple]:
+        """(key, slot fields) of every live slot whose key starts with prefix."""
+        locate = self._chain.locate
+        prefix_bytes = prefix.encode('utf-8')
+        n = len(prefix_bytes)
+        matches = []
+        for _, slot in self._live_slots(self._header()[2]):
+            if slot[5] >= n:
+                heap, offset = locate(slot[1])
+                if heap[offset:offset + n] == prefix_bytes:
+                    matches.append((str(heap[offset:offset + slot[5]], 'utf-8'), slot))
+        return matches
+
+    def keys_with_prefix(self, prefix: str, after: Optional[str] = None,
+                         count: Optional[int] = None) -> List[str]:
+        """
+        Get keys matching prefix, in sorted order.
+        
+        Args:
+            prefix: Key prefix ('' for all keys)
+            after: Only keys sorting after this one
+            count: At most this many keys
+        """
+        with self._lock:
+            keys = self._keys()
+            lo = bisect_left(keys, prefix)
+            if not prefix:
+                hi = len(keys)
+            elif ord(prefix[-1]) == 0x10FFFF:
+                hi = lo
+                while hi < len(keys) and keys[hi].startswith(prefix):
+                    hi += 1
+            else:
+                # Every key starting with prefix sorts below this one
+                hi = bisect_left(keys, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo)
+            if after is not None:
+                lo = max(lo, bisect_right(keys, after))
+            if count is not None:
+                hi = min(hi, lo + count)
+            return keys[lo:hi]
+
+    def items_with_prefix(self, prefix: str) -> List[tuple]:
+        """
+        Get (key, value) pairs for keys matching prefix, skipping expired ones.
+        
+        One directory pass; only matching values are decoded, and values
+        this process already decoded come from the cache.
+        """
         with self._lock:
-            return [k for k in self._data.keys() if k.startswith(prefix)]
+            entries, version = self._stable(self._prefix_items, prefix, time.time())
+            if version != self._cache_version:
+                self._cache = {}
+                self._cache_misses = 0
+                self._cache_version = version
+            cache = self._cache
+            for key, value, timestamp, auto_clean in entries:
+                cache[key] = (value, timestamp, auto_clean)
+            return [(key, value) for key, value, _, _ in entries]
+
+    def _prefix_items(self, prefix: str, now: float) -> List[tuple]:
+        """(key, value, timestamp, auto_clean) of the unexpired keys matching prefix."""
+        cache = self._cache if self._cache_version == self._version() else {}
+        entries = []
+        for key, slot in self._prefix_slots(prefix):
+            auto_clean = slot[4]
+            if auto_clean and now - slot[3] > auto_clean:
+                continue
+            cached = cache.get(key)
+            value = cached[0] if cached is not None and cached[1] == slot[3] else self._decode(slot)
+            entries.append((key, value, slot[3], auto_clean))
+        return entries
 
     def size(self) -> int:
         """Get number of keys."""
         with self._lock:
-            return len(self._data)
+            return self._header()[3]
 
     def items(self) -> List[tuple]:
         """Get all (key, value) pairs."""
         with self._lock:
-            result = []
-            for key, entry in self._data.items():
-                value = entry['value']
-                if self.encryption and isinstance(value, str) and value.startswith('enc:'):
-                    from .encryption import decrypt_data
-                    enc_bytes = bytes.fromhex(value[4:])
-                    decrypted = decrypt_data(enc_bytes, self.auth_key)
-                    value = self._serializer.deserialize(decrypted)
-                result.append((key, value))
-            return result
+            return self._stable(lambda: [
+                (self._key(slot), self._decode(slot))
+                for _, slot in self._live_slots(self._header()[2])
+            ])[0]
 
     def clear(self) -> None:
         """Clear all data."""
         with self._lock:
-            self._data = {}
-            self._sync_to_shm()
+            self._init_layout(self.INITIAL_SLOTS)
 
     def cleanup_expired(self) -> int:
-        """Remove expired entries. Returns count removed."""
+        """Remove expired entries. Returns count removed.
+        
+        Returns at once, without scanning, until the earliest recorded
+        deadline has passed.
+        """
         with self._lock:
             now = time.time()
-            to_remove = []
-            
-            for key, entry in self._data.items():
-                if entry.get('auto_clean'):
-                    elapsed = now - entry['timestamp']
-                    if elapsed > entry['auto_clean']:
-                        to_remove.append(key)
+            next_expiry = _EXPIRY.unpack_from(self._buf, _EXPIRY_OFFSET)[0]
+            if not next_expiry or now <= next_expiry:
+                return 0
             
-            for key in to_remove:
-                del self._data[key]
-            
-            if to_remove:
-                self._dirty = True
-                self._sync_to_shm()
-            
-            return len(to_remove)
+            self._write_begin()
+            try:
+                return self._remove_expired(now)
+            finally:
+                self._write_end()
+
+    def _remove_expired(self, now: float) -> int:
+        """Tombstone elapsed entries and record the next deadline (low-level)."""
+        slot_count = self._header()[2]
+        if HAS_NUMPY:
+            # One vectorized pass over the timestamp and TTL columns
+            slots = self._slot_array(slot_count)
+            ttl = slots['auto_clean']
+            timed = (slots['state'] == _SLOT_LIVE) & (ttl > 0)
+            deadlines = slots['timestamp'] + ttl
+            expired = timed & (now - slots['timestamp'] > ttl)
+            to_remove = np.flatnonzero(expired).tolist()
+            remaining = deadlines[timed & ~expired]
+            next_expiry = float(remaining.min()) if len(remaining) else 0.0
+        else:
+            to_remove = []
+            next_expiry = 0.0
+            for index, slot in self._live_slots(slot_count):
+                if slot[4]:
+                    if now - slot[3] > slot[4]:
+                        to_remove.append(index)
+                    elif not next_expiry or slot[3] + slot[4] < next_expiry:
+                        next_expiry = slot[3] + slot[4]
+        
+        _EXPIRY.pack_into(self._buf, _EXPIRY_OFFSET, next_expiry)
+        self._remove_slots(to_remove)
+        return len(to_remove)
 
     def memory_usage(self) -> dict:
         """Get memory usage statistics."""
         with self._lock:
-            length = struct.unpack('Q', bytes(self.shm.buf[:8]))[0]
+            header = self._header()
+            used = header[0]
+            capacity = self._chain.capacity
             return {
-                'used_bytes': length + self.HEADER_SIZE,
-                'capacity_bytes': self._current_size,
+                'used_bytes': used,
+                'garbage_bytes': header[5],
+                'capacity_bytes': capacity,
                 'max_bytes': self.MAX_SIZE,
-                'utilization': (length + self.HEADER_SIZE) / self._current_size,
+                'utilization': used / capacity,
             }
 
     def close(self) -> None:
         """Close the shared memory connection."""
+        self._chain.close()
         try:
-            self.shm.close()
+            if self._dir is not None:
+                self._dir.close()
         except Exception:
             pass
+        if self._lock_fd >= 0:
+            os.close(self._lock_fd)
+            self._lock_fd = -1
 
     def destroy(self) -> None:
-        """Destroy the shared memory segment."""
-        try:
-            self.shm.close()
-            self.shm.unlink()
-        except Exception:
-            pass
+        """Destroy the pool's shared memory segments."""
+        with self._lock:
+            try:
+                # Pick up segments other processes added
+                self._header()
+            except Exception:
+                pass
+            self.close()
+            self._chain.unlink()
+            try:
+                if self._dir is not None:
+                    self._dir.unlink()
+            except Exception:
+                pass
+            if HAS_FCNTL and not os.path.isdir(_SHM_DIR):
+                try:
+                    os.unlink(_lock_file(self.shm_name))
+                except OSError:
+                    pass
 
     def refresh(self) -> None:
-        """Force refresh from shared memory (for compatibility)."""
-        with self._lock:
-            self._sync_from_shm()
+        """Kept for compatibility; reads always see shared memory directly."""
 
     def save(self) -> None:
-        """Force save to shared memory (for compatibility)."""
-        with self._lock:
-            self._sync_to_shm()
+        """Kept for compatibility; writes always go to shared memory directly."""
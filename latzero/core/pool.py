@@ -9,7 +9,7 @@ Provides:
 
 import time
 import os
-from typing import Optional, Any, Dict, List, Callable, Iterator, Tuple
+from typing import Optional, Any, Dict, List, Callable, Iterator, Tuple, Union
 from contextlib import contextmanager
 
 from .registry import PoolRegistry
@@ -288,7 +288,8 @@ class PoolClient:
 
     # =========== Core Operations ===========
 
-    def set(self, key: str, value: Any, auto_clean: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, auto_clean: Optional[int] = None,
+            dtype: Optional[str] = None) -> None:
         """
         Set a value.
         
@@ -296,6 +297,8 @@ class PoolClient:
             key: Key name
             value: Any pickleable/msgpack-able value
             auto_clean: Auto-expire after N seconds (None = never)
+            dtype: 'bf16' to store a numpy float array as bfloat16
+                   (half the bytes of float32; reads back as float32)
         """
         self._check_connected()
         self._check_writable()
@@ -304,7 +307,7 @@ class PoolClient:
             raise ValueError("Key must be a string")
 
         full_key = self._data_key_prefix + key
-        self._pool_data.set(full_key, value, auto_clean)
+        self._pool_data.set(full_key, value, auto_clean, dtype=dtype)
         self._emit('on_update', key, value)
 
     def set_fast(self, key: str, value: Any, auto_clean: Optional[int] = None) -> None:
@@ -369,6 +372,47 @@ class PoolClient:
             self._emit('on_delete', key)
         return deleted
 
+    def replace(self, old_key: str, key: str, value: Any) -> bool:
+        """
+        Set key and delete old_key in a single write.
+
+        Returns:
+            True if old_key existed and was deleted
+        """
+        self._check_connected()
+        self._check_writable()
+
+        if not isinstance(key, str) or not isinstance(old_key, str):
+            raise ValueError("Key must be a string")
+
+        prefix = self._data_key_prefix
+        deleted = self._pool_data.replace(prefix + old_key, prefix + key, value)
+        self._emit('on_update', key, value)
+        if deleted:
+            self._emit('on_delete', old_key)
+        return deleted
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """
+        Delete a key and return its value.
+        
+        Args:
+            key: Key name
+            default: Value to return if key doesn't exist
+        
+        Returns:
+            The value the key held, or default
+        """
+        self._check_connected()
+        self._check_writable()
+        
+        full_key = self._data_key_prefix + key
+        result = self._pool_data.pop(full_key)
+        if result is None:
+            return default
+        self._emit('on_delete', key)
+        return result
+
     def exists(self, key: str) -> bool:
         """Check if a key exists."""
         self._check_connected()
@@ -391,12 +435,8 @@ class PoolClient:
         self._check_connected()
         self._check_writable()
         
-        current = self.get(key, 0)
-        if not isinstance(current, (int, float)):
-            raise TypeError(f"Cannot increment non-numeric value: {type(current)}")
-        
-        new_value = current + delta
-        self.set(key, new_value)
+        new_value = self._pool_data.increment(self._data_key_prefix + key, delta)
+        self._emit('on_update', key, new_value)
         return new_value
 
     def decrement(self, key: str, delta: int = 1) -> int:
@@ -452,21 +492,30 @@ class PoolClient:
         self._check_connected()
         self._check_writable()
         
+        for key in data:
+            if not isinstance(key, str):
+                raise ValueError("Key must be a string")
+        
+        prefix = self._data_key_prefix
+        self._pool_data.mset({prefix + key: value for key, value in data.items()}, auto_clean)
         for key, value in data.items():
-            self.set(key, value, auto_clean)
+            self._emit('on_update', key, value)
 
-    def mget(self, keys: List[str]) -> Dict[str, Any]:
+    def mget(self, keys: List[str], lazy: bool = False) -> Dict[str, Any]:
         """
         Get multiple keys at once.
         
         Args:
             keys: List of keys
+            lazy: Return values as LazyValue, decoded only when used
         
         Returns:
             Dict of {key: value} (missing keys have None)
         """
         self._check_connected()
-        return {key: self.get(key) for key in keys}
+        prefix = self._data_key_prefix
+        values = self._pool_data.mget([prefix + key for key in keys], lazy)
+        return {key: values[prefix + key] for key in keys}
 
     def delete_many(self, keys: List[str]) -> int:
         """
@@ -490,49 +539,61 @@ class PoolClient:
         """
         Get all keys (optionally matching pattern prefix).
         
+        Keys come in sorted (code point) order, not insertion order.
+        
         Args:
             pattern: Optional prefix to filter keys
         """
         self._check_connected()
-        all_keys = self._pool_data.keys_with_prefix(self._data_key_prefix)
-        
-        # Strip prefix
-        stripped = [k[len(self._data_key_prefix):] for k in all_keys]
-        
-        if pattern:
-            stripped = [k for k in stripped if k.startswith(pattern)]
-        
-        return stripped
+        n = len(self._data_key_prefix)
+        return [
+            key[n:]
+            for key in self._pool_data.keys_with_prefix(self._data_key_prefix + (pattern or ''))
+        ]
 
     def values(self, pattern: Optional[str] = None) -> List[Any]:
         """Get all values (optionally for keys matching pattern)."""
-        return [self.get(k) for k in self.keys(pattern)]
+        return [value for _, value in self.items(pattern)]
 
     def items(self, pattern: Optional[str] = None) -> List[Tuple[str, Any]]:
         """Get all (key, value) pairs."""
-        return [(k, self.get(k)) for k in self.keys(pattern)]
+        self._check_connected()
+        n = len(self._data_key_prefix)
+        return [
+            (key[n:], value)
+            for key, value in self._pool_data.items_with_prefix(self._data_key_prefix + (pattern or ''))
+        ]
 
-    def scan(self, cursor: int = 0, count: int = 100) -> Tuple[int, List[str]]:
+    def scan(self, cursor: Union[int, str] = 0, count: int = 100) -> Tuple[Union[int, str], List[str]]:
         """
-        Paginated key scanning.
+        Paginated key scanning, in keys() order.
+        
+        The cursor is the last key returned, so keys added or deleted
+        between calls never make a scan repeat or skip the others.
         
         Args:
-            cursor: Starting position
+            cursor: 0 to start, then the next_cursor of the previous call
             count: Max keys to return
         
         Returns:
             (next_cursor, keys) - cursor is 0 when complete
         """
-        all_keys = self.keys()
-        end = min(cursor + count, len(all_keys))
-        next_cursor = end if end < len(all_keys) else 0
-        return (next_cursor, all_keys[cursor:end])
+        self._check_connected()
+        prefix = self._data_key_prefix
+        after = prefix + cursor if isinstance(cursor, str) else None
+        page = self._pool_data.keys_with_prefix(prefix, after, count + 1)
+        keys = [key[len(prefix):] for key in page[:count]]
+        next_cursor = keys[-1] if len(page) > count else 0
+        return (next_cursor, keys)
 
     # =========== Pool Info ===========
 
     def size(self) -> int:
         """Get number of keys in this pool's namespace."""
-        return len(self.keys())
+        self._check_connected()
+        # The data segment belongs to this pool and every key in it carries
+        # the pool prefix, so the segment's live-key counter is the answer
+        return self._pool_data.size()
 
     def stats(self) -> dict:
         """Get pool statistics."""
@@ -582,6 +643,17 @@ class PoolClient:
         emitter = self.event_emitter()
         emitter.emit(event, **data)
 
+    def emit_event_many(self, event: str, payloads: List[dict]) -> None:
+        """
+        Fire-and-forget emission of several events in one batch.
+        
+        Args:
+            event: Event name
+            payloads: One dict of event data per emission
+        """
+        emitter = self.event_emitter()
+        emitter.emit_many(event, payloads)
+
     def call_event(self, event: str, _timeout: float = 5.0, **data):
         """
         RPC-style event call with response.
@@ -679,6 +751,12 @@ class NamespacedClient:
     def delete(self, key: str) -> bool:
         return self._client.delete(self._prefixed(key))
 
+    def replace(self, old_key: str, key: str, value: Any) -> bool:
+        return self._client.replace(self._prefixed(old_key), self._prefixed(key), value)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        return self._client.pop(self._prefixed(key), default)
+
     def exists(self, key: str) -> bool:
         return self._client.exists(self._prefixed(key))
 
@@ -697,7 +775,7 @@ class NamespacedClient:
         prefixed = {self._prefixed(k): v for k, v in data.items()}
         self._client.mset(prefixed, auto_clean)
 
-    def mget(self, keys: List[str]) -> Dict[str, Any]:
+    def mget(self, keys: List[str], lazy: bool = False) -> Dict[str, Any]:
         prefixed_keys = [self._prefixed(k) for k in keys]
-        result = self._client.mget(prefixed_keys)
+        result = self._client.mget(prefixed_keys, lazy)
         return {k: result.get(self._prefixed(k)) for k in keys}
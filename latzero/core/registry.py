@@ -12,6 +12,9 @@ from typing import Dict, Optional, Any
 
 from .locking import get_registry_lock, FileLock
 
+# Length prefix of the registry JSON (8-byte unsigned, native order)
+_LENGTH = struct.Struct('Q')
+
 
 class PoolRegistry:
     """
@@ -60,17 +63,17 @@ class PoolRegistry:
         """Write data to registry with length prefix. MUST hold lock."""
         if len(data) > self.REGISTRY_SIZE - 8:
             raise ValueError("Registry data too large")
-        length = struct.pack('Q', len(data))  # 8-byte unsigned long
-        self.shm.buf[:8] = length
-        self.shm.buf[8:8+len(data)] = data
+        buf = self.shm.buf
+        _LENGTH.pack_into(buf, 0, len(data))
+        buf[8:8+len(data)] = data
 
     def _read_registry_data_unsafe(self) -> dict:
         """Read data from registry. MUST hold lock."""
-        length = struct.unpack('Q', bytes(self.shm.buf[:8]))[0]
+        buf = self.shm.buf
+        length = _LENGTH.unpack_from(buf, 0)[0]
         if length == 0:
             return {'pools': {}, 'pools_data_keys': {}}
-        data = bytes(self.shm.buf[8:8+length]).decode('utf-8')
-        return json.loads(data)
+        return json.loads(str(buf[8:8+length], 'utf-8'))
 
     def _load_registry(self) -> None:
         """Load registry state into memory (acquires lock)."""
@@ -201,9 +204,8 @@ class PoolRegistry:
         if data_key:
             # Try to clean up shared memory for this pool
             try:
-                pool_shm = shm.SharedMemory(name=data_key)
-                pool_shm.close()
-                pool_shm.unlink()
+                from .memory import unlink_pool_data
+                unlink_pool_data(data_key)
             except Exception:
                 pass
             return True
@@ -1,18 +1,26 @@
 import pickle
 import zlib
 
+# First byte of the zlib streams written by earlier versions (pickle + zlib);
+# core serializer headers never take this value
+_LEGACY_ZLIB = 0x78
+
 def serialize(obj):
-    """Serialize an object using pickle and compress with zlib."""
+    """Serialize an object with the core serializer (msgpack, pickle fallback)."""
+    from ..core.memory import get_serializer
     try:
-        return zlib.compress(pickle.dumps(obj))
+        return get_serializer().serialize(obj)
     except Exception as e:
         from .exceptions import SerializationError
         raise SerializationError(f"Serialization failed: {e}")
 
 def deserialize(data):
-    """Deserialize compressed pickled data."""
+    """Deserialize serialize() output, including the older pickle + zlib format."""
+    from ..core.memory import get_serializer
     try:
-        return pickle.loads(zlib.decompress(data))
+        if data and data[0] == _LEGACY_ZLIB:
+            return pickle.loads(zlib.decompress(data))
+        return get_serializer().deserialize(data)
     except Exception as e:
         from .exceptions import SerializationError
         raise SerializationError(f"Deserialization failed: {e}")
@@ -36,7 +36,7 @@ setup(
         "psutil>=5.8",
     ],
     extras_require={
-        "fast": ["msgpack>=1.0"],
+        "fast": ["msgpack>=1.0", "msgspec>=0.18", "zstandard>=0.21", "lz4>=4.0", "numba>=0.57"],
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.20",
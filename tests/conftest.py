@@ -18,11 +18,13 @@ def unique_pool_name():
     return f"test_pool_{uuid.uuid4().hex[:8]}"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pool_manager():
-    """Create a SharedMemoryPool instance."""
+    """One SharedMemoryPool (and registry attachment) for the whole session."""
     from latzero import SharedMemoryPool
-    return SharedMemoryPool(auto_cleanup=False)
+    manager = SharedMemoryPool(auto_cleanup=False)
+    yield manager
+    manager.close()
 
 
 @pytest.fixture
@@ -10,6 +10,7 @@ Tests:
 Run with: python tests/test_events_latency.py
 """
 
+import os
 import time
 import statistics
 import threading
@@ -22,6 +23,9 @@ POOL_NAME = "benchmark_pool"
 WARMUP_ITERATIONS = 100
 LATENCY_ITERATIONS = 10000
 THROUGHPUT_ITERATIONS = 50000
+DRAIN_TIMEOUT = 10.0  # Max seconds to wait for the listener to catch up
+PRODUCER_CPU = 0
+LISTENER_CPU = 1
 
 
 def print_header(title: str):
@@ -50,6 +54,27 @@ def format_rate(ops_per_sec: float) -> str:
         return f"{ops_per_sec:.1f} ops/sec"
 
 
+# ============== CPU Affinity ==============
+
+# Producer and listener each get their own core, so results are not
+# dominated by the scheduler migrating threads and their cache lines
+# across a many-core machine
+_cpus = set(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else set()
+
+
+def pin_thread(tid: int, cpu: int):
+    """Pin one thread (0 = the caller) to a CPU, if affinity is supported and the CPU is ours."""
+    if cpu in _cpus:
+        os.sched_setaffinity(tid, {cpu})
+
+
+def pin_listener():
+    """Pin the event listener thread started by listen() to LISTENER_CPU."""
+    for thread in threading.enumerate():
+        if thread.name.startswith("latzero-event-listener"):
+            pin_thread(thread.native_id, LISTENER_CPU)
+
+
 # ============== Pool Manager ==============
 
 # Global pool manager - reuse across tests to avoid resource leaks
@@ -74,20 +99,28 @@ def test_emit_latency():
     
     try:
         with pm.connect(POOL_NAME) as ipc:
+            # The handler sets done once received_count reaches expected
             received_count = [0]
+            expected = [WARMUP_ITERATIONS]
+            done = threading.Event()
             
             @ipc.on_event("bench:emit")
             def handle_emit(value: int):
                 received_count[0] += 1
+                if received_count[0] == expected[0]:
+                    done.set()
             
             ipc.listen()
+            pin_listener()
             time.sleep(0.1)  # Let listener start
             
             # Warmup
             print(f"  Warming up ({WARMUP_ITERATIONS} iterations)...")
             for i in range(WARMUP_ITERATIONS):
                 ipc.emit_event("bench:emit", value=i)
-            time.sleep(0.2)  # Let events process
+            done.wait(DRAIN_TIMEOUT)  # Let events process
+            done.clear()
+            expected[0] += LATENCY_ITERATIONS
             
             # Benchmark
             print(f"  Running latency test ({LATENCY_ITERATIONS} iterations)...")
@@ -100,7 +133,7 @@ def test_emit_latency():
                 latencies.append(end - start)
             
             # Wait for processing
-            time.sleep(0.5)
+            done.wait(DRAIN_TIMEOUT)
             
             # Results
             latencies.sort()
@@ -133,6 +166,7 @@ def test_call_latency():
                 return x + y
             
             ipc.listen()
+            pin_listener()
             time.sleep(0.1)  # Let listener start
             
             # Warmup
@@ -186,12 +220,16 @@ def test_emit_throughput():
     try:
         with pm.connect(POOL_NAME) as ipc:
             received_count = [0]
+            done = threading.Event()
             
             @ipc.on_event("bench:throughput")
             def handle_throughput(value: int):
                 received_count[0] += 1
+                if received_count[0] == THROUGHPUT_ITERATIONS:
+                    done.set()
             
             ipc.listen()
+            pin_listener()
             time.sleep(0.1)
             
             print(f"  Running throughput test ({THROUGHPUT_ITERATIONS:,} emits)...")
@@ -208,7 +246,52 @@ def test_emit_throughput():
             print(f"    Emit rate:     {format_rate(emit_rate)}")
             
             # Wait and check receive rate
-            time.sleep(1.0)
+            done.wait(DRAIN_TIMEOUT)
+            print(f"    Received:      {received_count[0]:,} events")
+            
+            ipc.stop_events()
+    finally:
+        pm.destroy(POOL_NAME)
+
+
+def test_emit_many_throughput():
+    """Test batched emit throughput (ops/second)."""
+    print_header("EMIT Batched Throughput Test")
+    
+    pm = get_pool_manager()
+    pm.create(POOL_NAME)
+    
+    try:
+        with pm.connect(POOL_NAME) as ipc:
+            received_count = [0]
+            done = threading.Event()
+            
+            @ipc.on_event("bench:batch")
+            def handle_batch(value: int):
+                received_count[0] += 1
+                if received_count[0] == THROUGHPUT_ITERATIONS:
+                    done.set()
+            
+            ipc.listen()
+            pin_listener()
+            time.sleep(0.1)
+            
+            batch = 64
+            print(f"  Running throughput test ({THROUGHPUT_ITERATIONS:,} emits, batches of {batch})...")
+            
+            start = time.perf_counter()
+            for i in range(0, THROUGHPUT_ITERATIONS, batch):
+                ipc.emit_event_many("bench:batch", [{"value": j} for j in range(i, min(i + batch, THROUGHPUT_ITERATIONS))])
+            elapsed = time.perf_counter() - start
+            
+            emit_rate = THROUGHPUT_ITERATIONS / elapsed
+            print(f"\n  Results (emit dispatch rate):")
+            print(f"    Total emits:   {THROUGHPUT_ITERATIONS:,}")
+            print(f"    Time elapsed:  {elapsed:.3f}s")
+            print(f"    Emit rate:     {format_rate(emit_rate)}")
+            
+            # Wait and check receive rate
+            done.wait(DRAIN_TIMEOUT)
             print(f"    Received:      {received_count[0]:,} events")
             
             ipc.stop_events()
@@ -226,12 +309,15 @@ def test_baseline_set_get():
     try:
         with pm.connect(POOL_NAME) as ipc:
             iterations = THROUGHPUT_ITERATIONS
+            # Built outside the timed loops, so only the library is measured
+            keys = [f"key_{j}" for j in range(1000)]
+            payload = {"value": 0, "data": "test"}
             
             # SET throughput
             print(f"  Testing SET throughput ({iterations:,} operations)...")
             start = time.perf_counter()
             for i in range(iterations):
-                ipc.set(f"key_{i % 1000}", {"value": i, "data": "test"})
+                ipc.set(keys[i % 1000], payload)
             elapsed = time.perf_counter() - start
             set_rate = iterations / elapsed
             print(f"    SET rate: {format_rate(set_rate)}")
@@ -240,7 +326,7 @@ def test_baseline_set_get():
             print(f"  Testing GET throughput ({iterations:,} operations)...")
             start = time.perf_counter()
             for i in range(iterations):
-                ipc.get(f"key_{i % 1000}")
+                ipc.get(keys[i % 1000])
             elapsed = time.perf_counter() - start
             get_rate = iterations / elapsed
             print(f"    GET rate: {format_rate(get_rate)}")
@@ -261,6 +347,8 @@ def main():
     print(f"    Latency iterations:    {LATENCY_ITERATIONS:,}")
     print(f"    Throughput iterations: {THROUGHPUT_ITERATIONS:,}")
     
+    pin_thread(0, PRODUCER_CPU)
+    
     try:
         # Run baseline first
         test_baseline_set_get()
@@ -268,6 +356,7 @@ def main():
         # Run emit tests
         test_emit_latency()
         test_emit_throughput()
+        test_emit_many_throughput()
         
         # Run call tests
         test_call_latency()
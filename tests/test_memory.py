@@ -5,6 +5,30 @@ Tests for latzero.core.memory module.
 import pytest
 
 
+def _increment_worker(shm_name, rounds):
+    """Increment "n" from a separate process."""
+    from latzero.core.memory import SharedMemoryPoolData
+    
+    pool_data = SharedMemoryPoolData(shm_name)
+    for _ in range(rounds):
+        pool_data.increment("n", 1)
+    pool_data.close()
+
+
+def _read_worker(shm_name, done):
+    """Read "n" from a separate process until done; fails on a torn or stale read."""
+    from latzero.core.memory import SharedMemoryPoolData
+    
+    pool_data = SharedMemoryPoolData(shm_name)
+    last = 0
+    while not done.is_set():
+        value = pool_data.get("n")
+        assert value >= last
+        last = value
+        assert pool_data.keys_with_prefix("n") == ["n"]
+    pool_data.close()
+
+
 class TestSharedMemoryPoolData:
     """Tests for SharedMemoryPoolData class."""
     
@@ -59,8 +83,44 @@ class TestSharedMemoryPoolData:
         assert "prefix:one" in keys
         assert "prefix:two" in keys
         
+        # Neighbours in sort order stay outside the range
+        pool_data.set("prefix;", 4)
+        pool_data.set("prefix", 5)
+        pool_data.set("\U0010ffffa", 6)
+        assert pool_data.keys_with_prefix("prefix:") == ["prefix:one", "prefix:two"]
+        assert pool_data.keys_with_prefix("prefix:one") == ["prefix:one"]
+        assert pool_data.keys_with_prefix("\U0010ffff") == ["\U0010ffffa"]
+        assert len(pool_data.keys_with_prefix("")) == 6
+
         pool_data.close()
-    
+
+    def test_keys_after_writes(self, unique_pool_name):
+        """Test that key queries follow writes from this and other instances."""
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+        other = SharedMemoryPoolData(shm_name)
+
+        pool_data.mset({f"ns:{i:02d}": i for i in range(40)})
+        assert len(pool_data.keys_with_prefix("ns:")) == 40
+        pool_data.set("ns:05", 0)
+        pool_data.set("ns:a", 1)
+        pool_data.delete("ns:00")
+        pool_data.pop("ns:01")
+        pool_data.increment("ns:b", 1)
+        pool_data.replace("ns:02", "ns:c", 2)
+        expected = [f"ns:{i:02d}" for i in range(3, 40)] + ["ns:a", "ns:b", "ns:c"]
+        assert pool_data.keys_with_prefix("ns:") == expected
+
+        # A write from elsewhere is picked up, and so are our writes after it
+        other.set("ns:d", 3)
+        pool_data.delete("ns:03")
+        assert pool_data.keys_with_prefix("ns:") == expected[1:] + ["ns:d"]
+
+        other.close()
+        pool_data.close()
+
     def test_memory_usage(self, unique_pool_name):
         """Test memory usage stats."""
         from latzero.core.memory import SharedMemoryPoolData
@@ -75,6 +135,14 @@ class TestSharedMemoryPoolData:
         assert usage['capacity_bytes'] >= usage['used_bytes']
         assert 0 < usage['utilization'] <= 1
         
+        # Same-size and smaller overwrites reuse the record in place
+        pool_data.set("key", "y" * 1000)
+        pool_data.set("key", "z" * 600)
+        after = pool_data.memory_usage()
+        assert after['used_bytes'] == usage['used_bytes']
+        assert after['garbage_bytes'] == 400
+        assert pool_data.get("key") == "z" * 600
+        
         pool_data.close()
     
     def test_size(self, unique_pool_name):
@@ -92,6 +160,414 @@ class TestSharedMemoryPoolData:
         
         pool_data.close()
 
+    def test_writes_visible_to_other_instance(self, unique_pool_name):
+        """Test that a second attachment reads writes without refresh()."""
+        from latzero.core.memory import SharedMemoryPoolData
+        
+        shm_name = f"l0p_{unique_pool_name}"
+        writer = SharedMemoryPoolData(shm_name)
+        reader = SharedMemoryPoolData(shm_name)
+        
+        writer.set("key", "v1")
+        assert reader.get("key") == "v1"
+        writer.set("key", "v2")
+        assert reader.get("key") == "v2"
+        writer.delete("key")
+        assert reader.get("key") is None
+        # A remembered miss does not hide a later write
+        writer.set("key", "v3")
+        assert reader.get("key") == "v3"
+        assert reader.mget(["other"]) == {"other": None}
+        writer.set("other", 1)
+        assert reader.mget(["other"]) == {"other": 1}
+        
+        writer.close()
+        reader.close()
+
+    def test_remembered_misses_are_bounded(self, unique_pool_name, monkeypatch):
+        """Test lookups of many missing keys do not grow the cache without end."""
+        from latzero.core import memory
+
+        monkeypatch.setattr(memory, "MAX_CACHED_MISSES", 4)
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = memory.SharedMemoryPoolData(shm_name)
+        pool_data.set("key", 1)
+
+        for i in range(10):
+            assert pool_data.get(f"missing:{i}") is None
+        assert pool_data.mget([f"other:{i}" for i in range(10)]) == {f"other:{i}": None for i in range(10)}
+        assert list(pool_data._cache.values()).count(memory._ABSENT) == 4
+        assert pool_data.get("missing:9") is None
+        assert pool_data.get("key") == 1
+
+        pool_data.close()
+
+    def test_attach_before_layout(self, unique_pool_name):
+        """Test attaching to a segment its creator has not laid out yet."""
+        from multiprocessing import shared_memory
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        raw = shared_memory.SharedMemory(name=shm_name, create=True,
+                                         size=SharedMemoryPoolData.INITIAL_SIZE)
+        first = SharedMemoryPoolData(shm_name)
+        assert not first.is_creator
+        first.set("key", "v1")
+
+        # Later attachments, and reads, find the layout and keep the data
+        second = SharedMemoryPoolData(shm_name)
+        assert second.get("key") == "v1"
+        assert first.keys() == ["key"]
+
+        second.close()
+        first.destroy()
+        raw.close()
+
+    def test_header_writes_keep_version_and_directory(self, unique_pool_name):
+        """Test counter stores never touch the seqlock version or directory fields."""
+        from latzero.core.memory import SharedMemoryPoolData, _DIR, _DIR_OFFSET
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+        pool_data.set("key", "v1")
+
+        with pool_data._lock:
+            before = pool_data._write_begin()
+            directory = _DIR.unpack_from(pool_data._buf, _DIR_OFFSET)
+            try:
+                heap_top, _, slot_count, live, deleted, garbage = pool_data._header()
+                pool_data._write_header(heap_top, garbage, slot_count, live, deleted)
+                assert pool_data._version() == before | 1
+                assert _DIR.unpack_from(pool_data._buf, _DIR_OFFSET) == directory
+            finally:
+                pool_data._write_end()
+        assert directory == (pool_data._dir_gen, pool_data._dir_owner)
+        assert pool_data.get("key") == "v1"
+
+        pool_data.destroy()
+
+    def test_reader_survives_odd_version(self, unique_pool_name):
+        """Test readers wait out live writers and repair after dead ones."""
+        import threading
+        import time
+        from latzero.core.memory import SharedMemoryPoolData, _VERSION, _VERSION_OFFSET
+        
+        shm_name = f"l0p_{unique_pool_name}"
+        writer = SharedMemoryPoolData(shm_name)
+        reader = SharedMemoryPoolData(shm_name)
+        writer.set("key", "v1")
+        
+        # A writer that died mid-mutation: odd version, nobody holds the lock
+        version = writer._version()
+        _VERSION.pack_into(writer._buf, _VERSION_OFFSET, version | 1)
+        start = time.monotonic()
+        assert reader.get("key") == "v1"
+        assert time.monotonic() - start < 0.5
+        assert not reader._version() & 1
+        
+        # A live writer in the middle of a mutation is waited for
+        results = []
+        with writer._lock:
+            writer._write_begin()
+            try:
+                thread = threading.Thread(target=lambda: results.append(reader.get("key")))
+                thread.start()
+                writer._put(b"key", writer._encode("v2"), 0)
+                thread.join(0.1)
+                assert results == []
+            finally:
+                writer._write_end()
+        thread.join()
+        assert results == ["v2"]
+        
+        writer.close()
+        reader.close()
+    
+    def test_increment_across_instances(self, unique_pool_name):
+        """Test increments through separate attachments are not lost."""
+        import sys
+        import threading
+        from latzero.core.memory import SharedMemoryPoolData
+        
+        shm_name = f"l0p_{unique_pool_name}"
+        first = SharedMemoryPoolData(shm_name)
+        second = SharedMemoryPoolData(shm_name)
+        
+        threads = [
+            threading.Thread(target=lambda pool=pool: [pool.increment("n", 1) for _ in range(2000)])
+            for pool in (first, second)
+        ]
+        # Switch threads often enough for the two writers to interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert first.get("n") == 4000
+        assert second.get("n") == 4000
+        
+        first.close()
+        second.close()
+    
+    def test_increment_across_processes(self, unique_pool_name):
+        """Test increments from several processes are not lost, with a reader running."""
+        import multiprocessing
+        from latzero.core.memory import SharedMemoryPoolData
+        
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("needs the fork start method")
+        ctx = multiprocessing.get_context("fork")
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+        pool_data.set("n", 0)
+        
+        done = ctx.Event()
+        reader = ctx.Process(target=_read_worker, args=(shm_name, done))
+        writers = [ctx.Process(target=_increment_worker, args=(shm_name, 2000)) for _ in range(4)]
+        reader.start()
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join(60)
+        done.set()
+        reader.join(60)
+        
+        assert [writer.exitcode for writer in writers] == [0] * 4
+        assert reader.exitcode == 0
+        assert pool_data.get("n") == 8000
+        assert pool_data.keys_with_prefix("n") == ["n"]
+        
+        pool_data.destroy()
+    
+    def test_many_keys_and_overwrites(self, unique_pool_name):
+        """Test slot directory growth and heap compaction."""
+        from latzero.core.memory import SharedMemoryPoolData
+        
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+        
+        for i in range(3000):
+            pool_data.set(f"k{i}", i)
+        for round_ in range(5):
+            for i in range(0, 3000, 2):
+                pool_data.set(f"k{i}", "x" * 500 + str(round_))
+        
+        assert pool_data.size() == 3000
+        assert pool_data.get("k1") == 1
+        assert pool_data.get("k2") == "x" * 500 + "4"
+
+        pool_data.destroy()
+
+    def test_large_values_survive_overwrite_and_compaction(self, unique_pool_name):
+        """Test values past the numpy copy threshold."""
+        import os
+        from latzero.core.memory import SharedMemoryPoolData, NOGIL_COPY_SIZE
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+
+        blobs = {f"blob{i}": os.urandom(NOGIL_COPY_SIZE + i) for i in range(4)}
+        pool_data.mset(blobs)
+        # Smaller values overwrite in place; larger ones leave garbage behind
+        blobs["blob0"] = os.urandom(NOGIL_COPY_SIZE)
+        pool_data.set("blob0", blobs["blob0"])
+        for round_ in range(40):
+            blobs["blob1"] = os.urandom(NOGIL_COPY_SIZE + 100 + round_)
+            pool_data.set("blob1", blobs["blob1"])
+
+        for key, blob in blobs.items():
+            assert pool_data.get(key) == blob
+
+        pool_data.destroy()
+
+    def test_directory_rebuild_with_numba(self, unique_pool_name, monkeypatch):
+        """Test the compiled rebuild loop, used for large directories."""
+        pytest.importorskip("numba")
+        from latzero.core import memory
+        
+        monkeypatch.setattr(memory, "NUMBA_MIN_SLOTS", 0)
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = memory.SharedMemoryPoolData(shm_name)
+        reader = memory.SharedMemoryPoolData(shm_name)
+        
+        # The batch outgrows the initial directory, which is rebuilt once
+        pool_data.mset({f"k{i}": i for i in range(2000)})
+        for i in range(0, 2000, 2):
+            pool_data.delete(f"k{i}")
+        pool_data.mset({f"n{i}": i for i in range(1000)})
+        
+        assert pool_data.size() == 2000
+        assert reader.get("k1999") == 1999
+        assert reader.get("k0") is None
+        assert reader.get("n999") == 999
+        
+        reader.close()
+        pool_data.destroy()
+    
+    def test_growth_visible_to_other_instance(self, unique_pool_name):
+        """Test that data in chained segments survives growth and is shared."""
+        import os
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        writer = SharedMemoryPoolData(shm_name)
+        reader = SharedMemoryPoolData(shm_name)
+
+        first = os.urandom(500_000)
+        writer.set("first", first)
+        big = os.urandom(3_000_000)
+        writer.set("big", big)
+
+        assert writer.memory_usage()['capacity_bytes'] > SharedMemoryPoolData.INITIAL_SIZE
+        assert reader.get("big") == big
+        assert reader.get("first") == first
+
+        reader.close()
+        writer.destroy()
+
+    def test_mset_mget(self, unique_pool_name):
+        """Test bulk writes and reads."""
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+        reader = SharedMemoryPoolData(shm_name)
+
+        pool_data.set("k0", "old")
+        items = {f"k{i}": {"i": i, "pad": "x" * 1000} for i in range(3000)}
+        pool_data.mset(items)
+
+        assert pool_data.size() == 3000
+        assert reader.mget(["k0", "k2999", "missing"]) == {
+            "k0": items["k0"], "k2999": items["k2999"], "missing": None
+        }
+
+        reader.close()
+        pool_data.destroy()
+
+    def test_bf16_arrays(self, unique_pool_name):
+        """Test storing float arrays as bfloat16."""
+        np = pytest.importorskip("numpy")
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+
+        arr = np.linspace(-3, 3, 1000).reshape(10, 100)
+        pool_data.set("w", arr, dtype="bf16")
+        restored = pool_data.get("w")
+        assert restored.dtype == np.float32 and restored.shape == arr.shape
+        assert np.allclose(restored, arr, rtol=2 ** -7)
+
+        with pytest.raises(ValueError):
+            pool_data.set("w", [1.0, 2.0], dtype="bf16")
+
+        pool_data.destroy()
+
+    def test_encrypted_values(self, unique_pool_name):
+        """Test that encrypted values round-trip and are stored as ciphertext."""
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name, encryption=True, auth_key="secret")
+        plain = SharedMemoryPoolData(shm_name)
+
+        value = {"user": "alice", "scores": [1, 2, 3]}
+        pool_data.set("k", value)
+        assert pool_data.get("k") == value
+        assert pool_data.items() == [("k", value)]
+
+        raw = plain.get("k")
+        assert isinstance(raw, bytes) and b"alice" not in raw
+
+        plain.close()
+        pool_data.destroy()
+
+    def test_cleanup_expired(self, unique_pool_name):
+        """Test that cleanup removes only elapsed entries, also written elsewhere."""
+        import time
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+        other = SharedMemoryPoolData(shm_name)
+
+        pool_data.set("keep", 1)
+        pool_data.set("long", 2, auto_clean=60)
+        other.set("short", 3, auto_clean=0.05)
+        assert pool_data.cleanup_expired() == 0
+
+        time.sleep(0.1)
+        assert pool_data.cleanup_expired() == 1
+        assert pool_data.cleanup_expired() == 0
+        assert sorted(pool_data.keys()) == ["keep", "long"]
+
+        other.close()
+        pool_data.destroy()
+
+    def test_version_even_between_writes(self, unique_pool_name):
+        """Test that the header version (a seqlock) is only odd during a write."""
+        from latzero.core.memory import SharedMemoryPoolData
+
+        shm_name = f"l0p_{unique_pool_name}"
+        pool_data = SharedMemoryPoolData(shm_name)
+
+        versions = [pool_data._version()]
+        pool_data.set("k", 1)
+        versions.append(pool_data._version())
+        with pytest.raises(ValueError):
+            pool_data.set("x" * 70000, 1)
+        versions.append(pool_data._version())
+        pool_data.delete("k")
+        versions.append(pool_data._version())
+        pool_data.clear()
+        versions.append(pool_data._version())
+
+        assert all(v % 2 == 0 for v in versions)
+        assert versions == sorted(set(versions))
+
+        pool_data.destroy()
+
+    def test_without_optional_dependencies(self, unique_pool_name):
+        """Test the pool with none of the optional accelerators installed."""
+        import os
+        import subprocess
+        import sys
+        import textwrap
+
+        script = textwrap.dedent(f"""
+            import sys
+
+            class Blocker:
+                def find_spec(self, name, path=None, target=None):
+                    if name.split(".")[0] in {{"msgspec", "zstandard", "lz4", "numba", "numpy"}}:
+                        raise ImportError(name)
+
+            sys.meta_path.insert(0, Blocker())
+            from latzero.core import memory
+
+            assert not (memory.HAS_MSGSPEC or memory.HAS_ZSTD or memory.HAS_LZ4
+                        or memory.HAS_NUMPY or memory.HAS_NUMBA)
+            pool_data = memory.SharedMemoryPoolData("l0p_{unique_pool_name}")
+            values = {{"s": "x", "d": {{"a": [1, 2]}}, "big": "y" * 100000, "set": {{1, 2}}}}
+            pool_data.mset(values)
+            assert pool_data.mget(list(values)) == values
+            assert pool_data.keys_with_prefix("b") == ["big"]
+            pool_data.mset({{f"k{{i}}": i for i in range(3000)}})
+            assert pool_data.size() == 3004
+            assert pool_data.get("k2999") == 2999
+            pool_data.destroy()
+        """)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=root, capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == 0, result.stderr
+
 
 class TestSerializer:
     """Tests for serialization."""
@@ -151,3 +627,57 @@ class TestSerializer:
         # Verify round-trip
         assert ser.deserialize(small_serialized) == small_data
         assert ser.deserialize(large_serialized) == large_data
+    
+    def test_compression_codecs(self):
+        """Test that small and large payloads use their codec tiers."""
+        from latzero.core import memory
+        from latzero.core.memory import Serializer
+        
+        ser = Serializer(compress_threshold=100)
+        
+        for value in ("ab" * 1000, "ab" * 100_000):
+            data = ser.serialize(value)
+            assert data[0] & Serializer.CODEC_MASK
+            assert ser.deserialize(data) == value
+        
+        if memory.HAS_LZ4:
+            assert ser.serialize("ab" * 1000)[0] & Serializer.CODEC_MASK == memory.CODEC_LZ4
+    
+    def test_numpy_arrays(self):
+        """Test numeric arrays round-trip through the msgpack extension."""
+        np = pytest.importorskip("numpy")
+        from latzero.core.memory import Serializer
+        
+        ser = Serializer()
+        
+        arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+        for value in (arr, {"nested": [arr]}, arr.T):
+            data = ser.serialize(value)
+            assert data[0] & 0x7F == Serializer.MSGPACK_HEADER[0]
+        
+        result = ser.deserialize(ser.serialize({"nested": [arr]}))["nested"][0]
+        assert result.dtype == arr.dtype
+        assert result.shape == arr.shape
+        assert (result == arr).all()
+        assert result.flags.writeable
+        
+        # Object arrays still go through pickle
+        obj_arr = np.array(["a", None], dtype=object)
+        assert list(ser.deserialize(ser.serialize(obj_arr))) == ["a", None]
+    
+    def test_pickle_out_of_band_buffers(self):
+        """Test that pickled arrays keep their buffers out of the pickle stream."""
+        np = pytest.importorskip("numpy")
+        from latzero.core.memory import Serializer
+        
+        ser = Serializer(compress_threshold=-1)
+        
+        arr = np.zeros(1000, dtype=[("a", "i4"), ("b", "f8")])
+        arr["a"] = np.arange(1000)
+        data = ser.serialize({"rows": arr, "tags": {"x"}})
+        assert data[0] == Serializer.PICKLE_OOB_HEADER[0]
+        
+        result = ser.deserialize(memoryview(data))
+        assert (result["rows"] == arr).all()
+        assert result["tags"] == {"x"}
+        assert result["rows"].flags.writeable
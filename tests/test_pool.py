@@ -121,6 +121,38 @@ class TestPoolClient:
         assert client.delete("to_delete")
         assert client.get("to_delete") is None
     
+    def test_pop(self, pool_with_data):
+        """Test popping a key."""
+        client = pool_with_data["client"]
+        client.set("to_pop", {"a": 1})
+        assert client.pop("to_pop") == {"a": 1}
+        assert not client.exists("to_pop")
+        assert client.pop("to_pop", "default") == "default"
+    
+    def test_replace(self, pool_with_data):
+        """Test setting one key while deleting another."""
+        client = pool_with_data["client"]
+        client.set("request", {"x": 1})
+        assert client.replace("request", "reply", {"y": 2})
+        assert not client.exists("request")
+        assert client.get("reply") == {"y": 2}
+        assert not client.replace("request", "reply", 3)
+        assert client.get("reply") == 3
+        
+        # Replacing a key with itself is a plain set
+        deleted = []
+        client.on('on_delete', deleted.append)
+        assert not client.replace("reply", "reply", 4)
+        assert client.get("reply") == 4
+        assert client.exists("reply")
+        assert "reply" in client.keys()
+        assert deleted == []
+        other = pool_with_data["pool_manager"].connect(pool_with_data["pool_name"])
+        assert other.get("reply") == 4
+        other.disconnect()
+        with pytest.raises(ValueError):
+            client.replace(1, "reply", 5)
+    
     def test_exists(self, pool_with_data):
         """Test exists method."""
         client = pool_with_data["client"]
@@ -145,11 +177,43 @@ class TestPoolClient:
         assert "prefix_one" in keys
         assert "prefix_two" in keys
         assert "string_key" not in keys
-    
+
+    def test_scan(self, pool_with_data):
+        """Test paginated scanning while keys are added and removed."""
+        client = pool_with_data["client"]
+        client.mset({f"scan_{i:02d}": i for i in range(20)})
+        original = set(client.keys())
+        
+        seen = []
+        cursor, page = client.scan(count=7)
+        seen += page
+        while cursor:
+            # Keys sorting before and after the cursor appear meanwhile
+            client.set("a_new_" + str(cursor), 1)
+            client.set("zz_new_" + str(cursor), 1)
+            cursor, page = client.scan(cursor, count=7)
+            seen += page
+        
+        assert len(seen) == len(set(seen))
+        assert original <= set(seen)
+        assert client.scan(count=1000)[0] == 0
+
+    def test_items_with_pattern(self, pool_with_data):
+        """Test items/values with pattern filter."""
+        client = pool_with_data["client"]
+        client.set("item_one", 1)
+        client.set("item_two", 2)
+
+        assert sorted(client.items("item_")) == [("item_one", 1), ("item_two", 2)]
+        assert sorted(client.values("item_")) == [1, 2]
+
     def test_size(self, pool_with_data):
         """Test size method."""
         client = pool_with_data["client"]
         assert client.size() >= 5
+        assert client.size() == len(client.keys())
+        client.delete("string_key")
+        assert client.size() == len(client.keys())
     
     def test_stats(self, pool_with_data):
         """Test pool stats."""
@@ -204,6 +268,25 @@ class TestAtomicOperations:
         result = client.increment("new_counter")
         assert result == 1
     
+    def test_increment_concurrent(self, pool_with_data):
+        """Test increments from several threads are not lost."""
+        import threading
+        
+        client = pool_with_data["client"]
+        threads = [
+            threading.Thread(target=lambda: [client.increment("hits") for _ in range(200)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert client.get("hits") == 800
+        
+        client.set("text", "abc")
+        with pytest.raises(TypeError):
+            client.increment("text")
+    
     def test_append(self, pool_with_data):
         """Test append to list."""
         client = pool_with_data["client"]
@@ -249,6 +332,20 @@ class TestBatchOperations:
         assert result["int_key"] == 42
         assert result["nonexistent"] is None
     
+    def test_mget_lazy(self, pool_with_data):
+        """Test batch get with deferred decoding."""
+        from latzero import LazyValue
+        
+        client = pool_with_data["client"]
+        result = client.mget(["dict_key", "list_key", "nonexistent"], lazy=True)
+        assert isinstance(result["dict_key"], LazyValue)
+        # Later writes do not change values already read
+        client.set("dict_key", {"a": 0})
+        assert result["dict_key"] == {"a": 1, "b": 2}
+        assert result["list_key"][2] == 3
+        assert result["list_key"].get() == [1, 2, 3]
+        assert result["nonexistent"] is None
+    
     def test_delete_many(self, pool_with_data):
         """Test batch delete."""
         client = pool_with_data["client"]